@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendees',
+            name='renamed_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
@@ -6,6 +6,8 @@ class Attendees(models.Model):
     """
     name = models.CharField(max_length=200)
     email = models.EmailField(unique=True)
+    # Stamped by events.utils.upsert_attendees when a registration changes the name.
+    renamed_at = models.DateTimeField(null=True, editable=False)
     
     def __str__(self):
         return f"{self.name} {self.email}"
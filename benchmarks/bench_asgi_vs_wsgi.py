@@ -0,0 +1,125 @@
+"""
+Serves the same attendee-roster workload three ways and compares
+throughput at a fixed concurrency:
+
+* sync DRF view behind the WSGI handler (one thread per in-flight request)
+* sync DRF view behind the ASGI handler (sync_to_async thread hop per request)
+* native async view behind the ASGI handler
+
+The handlers are driven in-process, without a server or sockets, so the
+numbers isolate Django's request path.
+
+    python benchmarks/bench_asgi_vs_wsgi.py [--requests 2000] [--concurrency 100]
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from common import setup_django, test_database
+
+
+def wsgi_request(app, path, query=""):
+    environ = {
+        "REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": query,
+        "SERVER_NAME": "testserver", "SERVER_PORT": "80",
+        "wsgi.input": BytesIO(), "wsgi.url_scheme": "http",
+        "wsgi.errors": BytesIO(), "HTTP_TIMEZONE": "UTC",
+    }
+    status = []
+    body = b"".join(app(environ, lambda s, headers: status.append(s)))
+    assert status[0].startswith("200"), status
+    return body
+
+
+async def asgi_request(app, path, query=""):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path,
+        "query_string": query.encode(), "headers": [(b"timezone", b"UTC")],
+        "server": ("testserver", 80), "client": ("127.0.0.1", 50000),
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # The client never disconnects; Django cancels this wait when done.
+        await asyncio.Future()
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    assert messages[0]["status"] == 200, messages[0]
+    return b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def run_wsgi(app, path, total, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(lambda _: wsgi_request(app, path), range(total)))
+        return time.perf_counter() - start
+
+
+def run_asgi(app, path, total, concurrency):
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one():
+            async with semaphore:
+                await asgi_request(app, path)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return time.perf_counter() - start
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--attendees", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from datetime import timedelta
+    from django.core.handlers.asgi import ASGIHandler
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.utils import timezone
+    from attendees.models import Attendees
+    from events.models import Event, Registration
+
+    with test_database():
+        event = Event.objects.create(
+            name="Benchmark", location="Hall", max_capacity=args.attendees,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=2))
+        attendees = Attendees.objects.bulk_create(
+            Attendees(name="Guest", email=f"guest{i}@email.com")
+            for i in range(args.attendees))
+        Registration.objects.bulk_create(
+            Registration(event=event, attendee=attendee) for attendee in attendees)
+
+        sync_path = f"/events/{event.id}/attendees"
+        async_path = f"/async/events/{event.id}/attendees"
+        wsgi_app, asgi_app = WSGIHandler(), ASGIHandler()
+        # Warm up URL resolution, middleware and serializers.
+        wsgi_request(wsgi_app, sync_path)
+        asyncio.run(asgi_request(asgi_app, async_path))
+
+        print(f"{args.requests} requests, concurrency {args.concurrency}")
+        for label, runner, app, path in [
+            ("WSGI, sync view", run_wsgi, wsgi_app, sync_path),
+            ("ASGI, sync view", run_asgi, asgi_app, sync_path),
+            ("ASGI, async view", run_asgi, asgi_app, async_path),
+        ]:
+            elapsed = runner(app, path, args.requests, args.concurrency)
+            print(f"{label:<20} {args.requests / elapsed:10.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
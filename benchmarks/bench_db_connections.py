@@ -0,0 +1,108 @@
+"""
+Measures the per-request cost of opening a database connection.
+
+Serves the same small query repeatedly with connections closed after every
+request (CONN_MAX_AGE=0, Django's default) and with persistent connections.
+On PostgreSQL with psycopg_pool installed it also runs with Django's pool,
+which needs CONN_MAX_AGE=0; the pool options come from DB_POOL_* when
+DB_POOL=1 is set, and psycopg's defaults otherwise.
+
+SQLite (default) connects cheaply, so the gap is small. Point it at a real
+server to see the handshake and authentication cost:
+
+    EVENT_MANAGER_DB=postgres POSTGRES_HOST=... python benchmarks/bench_db_connections.py
+"""
+import argparse
+import os
+import tempfile
+import time
+from common import setup_django
+
+
+def pool_available():
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    workdir = tempfile.TemporaryDirectory()
+    if os.environ.get("EVENT_MANAGER_DB", "sqlite") == "sqlite":
+        os.environ.setdefault("SQLITE_PATH", os.path.join(workdir.name, "bench.sqlite3"))
+    setup_django()
+
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+    from events.models import Event
+
+    setup_test_environment()
+
+    if connection.vendor == "postgresql":
+        print("Using PostgreSQL; the benchmark reads existing data only.")
+    else:
+        call_command("migrate", verbosity=0)
+    event = Event.objects.order_by("id").first()
+    if event is None:
+        from datetime import timedelta
+        from django.utils import timezone
+        event = Event.objects.create(
+            name="Benchmark", location="Hall", max_capacity=10,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=2))
+    url = f"/events/{event.id}/attendees"
+    client = Client()
+    settings_dict = connection.settings_dict
+    options = settings_dict.setdefault("OPTIONS", {})
+    # Each mode is (label, CONN_MAX_AGE, pool options); Django refuses to
+    # combine a pool with persistent connections.
+    pool = options.pop("pool", None) or True
+    modes = [("CONN_MAX_AGE=600 (persistent)", 600, None),
+             ("CONN_MAX_AGE=0 (new connection per request)", 0, None)]
+    if connection.vendor == "postgresql" and pool_available():
+        modes.append(("pool, CONN_MAX_AGE=0", 0, pool))
+
+    def configure(max_age, pool):
+        connection.close()
+        settings_dict["CONN_MAX_AGE"] = max_age
+        if pool:
+            options["pool"] = pool
+        else:
+            options.pop("pool", None)
+
+    def run(label, max_age, pool, count):
+        configure(max_age, pool)
+        client.get(url)
+        start = time.perf_counter()
+        for _ in range(count):
+            assert client.get(url).status_code == 200
+        return (time.perf_counter() - start) / count
+
+    # Alternate short rounds so warm-up and drift affect every mode alike.
+    rounds = 5
+    best = {label: float("inf") for label, _, _ in modes}
+    for _ in range(rounds):
+        for mode in modes:
+            best[mode[0]] = min(best[mode[0]], run(*mode, args.requests // rounds))
+
+    print(f"{args.requests} requests to {url} on {connection.vendor} (best of {rounds} rounds)")
+    for label, _, _ in modes:
+        print(f"{label:<46} {best[label] * 1000:8.3f} ms/request")
+
+    if connection.vendor == "postgresql":
+        if len(modes) == 2:
+            print('Install "psycopg[binary,pool]" to also measure the connection pool.')
+        configure(0, pool)
+        connection.close_pool()
+    workdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compares per-instance ``EventSerializer`` output with the
+``EventListSerializer`` fast path for a list of upcoming events.
+
+    python benchmarks/bench_event_serializer.py [--events 5000]
+"""
+import argparse
+from datetime import timedelta
+from common import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    from zoneinfo import ZoneInfo
+    from django.utils import timezone
+    from events.models import Event
+    from events.serializers import EventSerializer
+
+    with test_database():
+        now = timezone.now()
+        Event.objects.bulk_create(
+            Event(name=f"Event {i}", location=f"Hall {i % 50}",
+                  start_time=now + timedelta(minutes=30 * i),
+                  end_time=now + timedelta(minutes=30 * i + 90),
+                  max_capacity=100)
+            for i in range(args.events)
+        )
+        queryset = Event.objects.order_by("start_time", "id")
+        timezone.activate(ZoneInfo("Asia/Kolkata"))
+
+        def per_instance():
+            # What many=True did before the fast path existed.
+            child = EventSerializer()
+            return [child.to_representation(event) for event in queryset.all()]
+
+        def fast_list_of_instances():
+            return EventSerializer(list(queryset.all()), many=True).data
+
+        def fast_values():
+            return EventSerializer(queryset.all(), many=True).data
+
+        assert per_instance() == fast_values() == fast_list_of_instances()
+
+        print(f"Serializing {args.events} events")
+        slow, _ = measure(per_instance)
+        report("per-instance EventSerializer", slow)
+        report("fast path, model instances", measure(fast_list_of_instances)[0], slow)
+        report("fast path, values_list()", measure(fast_values)[0], slow)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures worker cold start: ``django.setup()`` through to the first served
+request, in fresh processes.
+
+Each round starts a new interpreter that loads the WSGI application and
+serves one request to ``--path``. The first request is where URLconfs,
+views and their imports are loaded. The script reports the median time
+for setup, for the first request, and for the two together. It also
+reports whether drf-spectacular's schema views were imported.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --path /api/schema/
+
+The schema file is built into the temporary directory first. Pass
+``--no-build`` to measure /api/schema/ generating the schema on request.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from common import BASE_DIR
+
+
+def child(path):
+    start = time.perf_counter()
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "event_manager.settings")
+    from django.core.wsgi import get_wsgi_application
+    application = get_wsgi_application()
+    ready = time.perf_counter()
+
+    from wsgiref.util import setup_testing_defaults
+    environ = {"PATH_INFO": path, "HTTP_HOST": "localhost"}
+    setup_testing_defaults(environ)
+    statuses = []
+    body = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    b"".join(body)
+    body.close()
+    served = time.perf_counter()
+    print(json.dumps({
+        "setup": ready - start,
+        "first_request": served - ready,
+        "status": statuses[0],
+        "schema_views_imported": "drf_spectacular.views" in sys.modules,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="/events/")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--no-build", action="store_true", help="Skip build_schema.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args.path)
+
+    workdir = tempfile.TemporaryDirectory()
+    env = dict(
+        os.environ,
+        SQLITE_PATH=os.path.join(workdir.name, "bench.sqlite3"),
+        OPENAPI_SCHEMA_FILE=os.path.join(workdir.name, "openapi.json"),
+        RATE_LIMIT_DB=os.path.join(workdir.name, "ratelimit.sqlite3"),
+        IDEMPOTENCY_DB=os.path.join(workdir.name, "idempotency.sqlite3"),
+    )
+    manage = [sys.executable, str(BASE_DIR / "manage.py")]
+    subprocess.run(manage + ["migrate", "-v0"], env=env, check=True)
+    if not args.no_build:
+        subprocess.run(manage + ["build_schema"], env=env, check=True, stdout=subprocess.DEVNULL)
+
+    results = []
+    for _ in range(args.rounds):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", "--path", args.path],
+            env=env, check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(out.splitlines()[-1]))
+
+    print(f"{args.path}: {results[0]['status']}, "
+          f"schema views imported: {results[0]['schema_views_imported']}")
+    for label, key in (("django.setup()", "setup"), ("first request", "first_request")):
+        print(f"{label:<40} {statistics.median(r[key] for r in results) * 1000:10.3f} ms")
+    total = statistics.median(r["setup"] + r["first_request"] for r in results)
+    print(f"{'setup + first request':<40} {total * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Shared helpers for the scripts in this directory.
+
+Run a benchmark from the repository root, e.g.::
+
+    python benchmarks/bench_event_serializer.py
+"""
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(settings_module="event_manager.settings"):
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    Creates throwaway test databases (as the test runner does) so a
+    benchmark never touches the development database.
+    """
+    from django.test.utils import setup_databases, teardown_databases
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, repeat=5, number=1):
+    """
+    Runs ``func`` ``number`` times per round and returns the best and median
+    per-call time in seconds across ``repeat`` rounds.
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return min(rounds), statistics.median(rounds)
+
+
+def report(label, seconds, baseline=None):
+    line = f"{label:<40} {seconds * 1000:10.3f} ms"
+    if baseline:
+        line += f"   x{baseline / seconds:6.2f}"
+    print(line)
@@ -0,0 +1,219 @@
+"""
+Load test for the registration and list endpoints.
+
+Starts the app on a throwaway SQLite database, seeds a few events, then
+fires concurrent registrations and upcoming-event list reads from a pool of
+client threads. Reports throughput and p50/p95/p99 latency per operation.
+The oversell invariant is checked while the test runs and again at the
+end: no event may hold more Registration rows than its max_capacity.
+The script exits non-zero if the invariant is ever broken.
+
+    python benchmarks/loadtest.py --concurrency 500 --registrations 5000 --reads 5000
+
+Use ``--server uvicorn`` to serve the app over ASGI instead of the threaded
+development server (needs uvicorn installed).
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from common import BASE_DIR, setup_django
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind, port, env):
+    if kind == "uvicorn":
+        command = [sys.executable, "-m", "uvicorn", "event_manager.asgi:application",
+                   "--port", str(port), "--log-level", "warning"]
+    else:
+        command = [sys.executable, "manage.py", "runserver", f"127.0.0.1:{port}",
+                   "--noreload"]
+    process = subprocess.Popen(
+        command, cwd=BASE_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise SystemExit(f"{kind} exited with code {process.returncode}")
+            time.sleep(0.1)
+    process.kill()
+    raise SystemExit(f"{kind} did not start listening on port {port}")
+
+
+class Client(threading.local):
+    """
+    One keep-alive HTTP connection per client thread.
+    """
+    def __init__(self, port):
+        self.port = port
+        self.conn = None
+
+    def request(self, method, path, body=None):
+        headers = {"Timezone": "UTC"}
+        if body is not None:
+            body = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=60)
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                payload = response.read()
+                if response.getheader("Connection", "").lower() == "close":
+                    self.conn.close()
+                    self.conn = None
+                return response.status, payload
+            except (http.client.HTTPException, OSError):
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+
+
+def overbooked_events():
+    from django.db.models import Count, F
+    from events.models import Event
+    return list(
+        Event.objects.annotate(registered=Count("registrations"))
+        .filter(registered__gt=F("max_capacity"))
+        .values_list("id", "registered", "max_capacity"))
+
+
+def percentiles(samples):
+    if len(samples) < 2:
+        return samples * 3 if samples else [0.0] * 3
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return [cuts[49], cuts[94], cuts[98]]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--registrations", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=5)
+    parser.add_argument("--capacity", type=int, default=200)
+    parser.add_argument("--server", choices=["runserver", "uvicorn"], default="runserver")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="Keep the per-IP registration limit (all clients share one IP).")
+    args = parser.parse_args()
+
+    workdir = tempfile.TemporaryDirectory()
+    env = dict(os.environ, EVENT_MANAGER_DB="sqlite",
+               SQLITE_PATH=os.path.join(workdir.name, "loadtest.sqlite3"),
+               RATE_LIMIT_DB=os.path.join(workdir.name, "ratelimit.sqlite3"),
+               IDEMPOTENCY_DB=os.path.join(workdir.name, "idempotency.sqlite3"))
+    if not args.rate_limit:
+        # Every simulated client shares 127.0.0.1.
+        env["REGISTRATION_RATE_IP"] = "off"
+    os.environ.update(env)
+    setup_django()
+
+    from datetime import timedelta
+    from django.core.management import call_command
+    from django.utils import timezone
+    from events.models import Event
+
+    call_command("migrate", verbosity=0)
+    now = timezone.now()
+    event_ids = [
+        Event.objects.create(
+            name=f"Load test {i}", location="Online", max_capacity=args.capacity,
+            start_time=now + timedelta(days=1, hours=i),
+            end_time=now + timedelta(days=2, hours=i)).id
+        for i in range(args.events)
+    ]
+
+    port = free_port()
+    server = start_server(args.server, port, env)
+    client = Client(port)
+    rng = random.Random(args.seed)
+    operations = (
+        [("register", i) for i in range(args.registrations)]
+        + [("list", i) for i in range(args.reads)])
+    rng.shuffle(operations)
+    # Skew registrations towards the first event so it sells out under load.
+    targets = [rng.choice(event_ids[:1] * 3 + event_ids) for _ in range(args.registrations)]
+
+    latencies = defaultdict(list)
+    statuses = defaultdict(Counter)
+    violations = []
+    running = threading.Event()
+    running.set()
+
+    def monitor():
+        while running.is_set():
+            violations.extend(overbooked_events())
+            time.sleep(0.5)
+
+    def run(operation):
+        kind, index = operation
+        start = time.perf_counter()
+        try:
+            if kind == "register":
+                status, _ = client.request(
+                    "POST", f"/events/{targets[index]}/register",
+                    {"name": "Load Tester", "email": f"load{index}@example.com"})
+            else:
+                status, _ = client.request("GET", "/events/")
+        except Exception as exc:
+            status = type(exc).__name__
+        latencies[kind].append(time.perf_counter() - start)
+        statuses[kind][status] += 1
+
+    watcher = threading.Thread(target=monitor, daemon=True)
+    watcher.start()
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(run, operations))
+        elapsed = time.perf_counter() - started
+    finally:
+        running.clear()
+        watcher.join()
+        server.terminate()
+        server.wait()
+
+    violations.extend(overbooked_events())
+    print(f"{len(operations)} requests, concurrency {args.concurrency}, "
+          f"{args.server}, {elapsed:.2f}s, {len(operations) / elapsed:.1f} req/s")
+    print(f"{'operation':<10} {'count':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  statuses")
+    for kind in ("register", "list"):
+        samples = latencies[kind]
+        p50, p95, p99 = percentiles(samples)
+        print(f"{kind:<10} {len(samples):>7} {len(samples) / elapsed:>9.1f} "
+              f"{p50 * 1000:>9.2f} {p95 * 1000:>9.2f} {p99 * 1000:>9.2f}  "
+              f"{dict(statuses[kind])}")
+
+    if violations:
+        print(f"OVERSOLD: (event_id, registrations, max_capacity) {sorted(set(violations))}")
+        workdir.cleanup()
+        raise SystemExit(1)
+    print("Invariant held: no event has more registrations than max_capacity.")
+    workdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Builds ``DATABASES`` from environment variables.
+
+``EVENT_MANAGER_DB`` picks the profile:
+
+* ``sqlite`` (default) - the bundled ``event_manager.sqlite3``, or
+  ``SQLITE_PATH`` if set. Unless ``SQLITE_TUNING=0``, connections are
+  tuned for concurrent writers: a busy timeout of ``SQLITE_BUSY_TIMEOUT``
+  seconds, memory-mapped I/O and ``BEGIN IMMEDIATE`` for transactions.
+  The WAL journal (with ``synchronous=NORMAL``) is persistent, written into
+  the database file itself, so it is only switched on for an explicit
+  ``SQLITE_PATH``; the bundled file stays as committed. ``SQLITE_WAL=1``
+  or ``0`` overrides that.
+* ``postgres`` - PostgreSQL configured by ``POSTGRES_DB``, ``POSTGRES_USER``,
+  ``POSTGRES_PASSWORD``, ``POSTGRES_HOST`` and ``POSTGRES_PORT``.
+  Connections are kept for ``DB_CONN_MAX_AGE`` seconds (default 600)
+  and health-checked before reuse. ``DB_POOL=1`` uses Django's native
+  connection pool instead; that needs psycopg 3 with the pool extra
+  (``pip install "psycopg[binary,pool]"``).
+
+A read replica is added as the ``replica`` alias when ``SQLITE_REPLICA_PATH``
+(sqlite) or ``POSTGRES_REPLICA_HOST`` (postgres, with optional
+``POSTGRES_REPLICA_PORT``) is set. Tests treat it as a mirror of ``default``.
+
+With ``DB_FALLBACK_TO_SQLITE=1``, an unreachable PostgreSQL server is
+replaced by the SQLite profile, so the test suite can run anywhere.
+"""
+import logging
+import os
+
+
+logger = logging.getLogger(__name__)
+
+
+def env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def sqlite_database(base_dir):
+    database = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('SQLITE_PATH') or base_dir / 'event_manager.sqlite3',
+    }
+    if env_flag('SQLITE_TUNING', default=True):
+        pragmas = ['PRAGMA mmap_size=%d' % int(
+            os.environ.get('SQLITE_MMAP_SIZE', 128 * 1024 * 1024))]
+        if env_flag('SQLITE_WAL', default=bool(os.environ.get('SQLITE_PATH'))):
+            pragmas[:0] = ['PRAGMA journal_mode=WAL', 'PRAGMA synchronous=NORMAL']
+        database['OPTIONS'] = {
+            # Take the write lock when the transaction starts, so writers
+            # queue on the busy timeout instead of failing with
+            # "database is locked" when a deferred read lock is upgraded.
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': float(os.environ.get('SQLITE_BUSY_TIMEOUT', 20)),
+            'init_command': ';'.join(pragmas),
+        }
+    return database
+
+
+def postgres_database():
+    database = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'event_manager'),
+        'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', '127.0.0.1'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+        },
+    }
+    if env_flag('DB_POOL'):
+        # The pool manages connection lifetime; Django forbids combining it
+        # with persistent connections.
+        database['CONN_MAX_AGE'] = 0
+        database['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        }
+    return database
+
+
+def postgres_reachable(database):
+    """
+    Opens (and closes) a throwaway connection with a short timeout.
+    """
+    try:
+        import psycopg
+        connect = psycopg.connect
+    except ImportError:
+        try:
+            import psycopg2
+            connect = psycopg2.connect
+        except ImportError:
+            return False
+    try:
+        connect(
+            dbname='postgres', user=database['USER'], password=database['PASSWORD'],
+            host=database['HOST'], port=database['PORT'], connect_timeout=1,
+        ).close()
+    except Exception:
+        return False
+    return True
+
+
+def sqlite_replica(base_dir):
+    path = os.environ.get('SQLITE_REPLICA_PATH')
+    if not path:
+        return None
+    return dict(sqlite_database(base_dir), NAME=path)
+
+
+def postgres_replica(database):
+    host = os.environ.get('POSTGRES_REPLICA_HOST')
+    if not host:
+        return None
+    return dict(
+        database, HOST=host,
+        PORT=os.environ.get('POSTGRES_REPLICA_PORT', database['PORT']))
+
+
+def with_replica(primary, replica):
+    databases = {'default': primary}
+    if replica is not None:
+        databases['replica'] = dict(replica, TEST={'MIRROR': 'default'})
+    return databases
+
+
+def database_settings(base_dir):
+    profile = os.environ.get('EVENT_MANAGER_DB', 'sqlite').lower()
+    if profile == 'sqlite':
+        return with_replica(sqlite_database(base_dir), sqlite_replica(base_dir))
+    if profile != 'postgres':
+        raise ValueError(f"Unknown EVENT_MANAGER_DB profile '{profile}'.")
+
+    database = postgres_database()
+    if env_flag('DB_FALLBACK_TO_SQLITE') and not postgres_reachable(database):
+        logger.warning(
+            "PostgreSQL at %s:%s is unreachable; falling back to SQLite.",
+            database['HOST'], database['PORT'])
+        return with_replica(sqlite_database(base_dir), sqlite_replica(base_dir))
+    return with_replica(database, postgres_replica(database))
@@ -0,0 +1,193 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Metrics are kept per process; when running several workers, scrape each
+one (or aggregate upstream). Recording is a dict lookup, a ``bisect`` and
+a few additions under a lock, so it is cheap enough for every request.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from django.http import HttpResponse
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+def format_labels(names, values, extra=""):
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}_total{format_labels(self.labelnames, labels)} {format_number(value)}"
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, *labels):
+        state = self._values.get(labels)
+        return state[2] if state else 0
+
+    def sum(self, *labels):
+        state = self._values.get(labels)
+        return state[1] if state else 0.0
+
+    def samples(self):
+        with self._lock:
+            values = {labels: (list(b), s, c) for labels, (b, s, c) in self._values.items()}
+        for labels, (buckets, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, observed in zip(self.buckets, buckets):
+                cumulative += observed
+                le = 'le="%s"' % format_number(bound)
+                yield (f"{self.name}_bucket{format_labels(self.labelnames, labels, le)} "
+                       f"{cumulative}")
+            label_text = format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {format_number(total)}"
+            yield f"{self.name}_count{label_text} {count}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector):
+        """
+        ``collector()`` returns ``(name, type, help, [(labels_dict, value)])``
+        tuples, read at scrape time.
+        """
+        self._collectors.append(collector)
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    label_text = format_labels(labels.keys(), labels.values())
+                    lines.append(f"{name}{label_text} {format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "Request latency by URL name.",
+    ("view", "method")))
+requests_total = registry.register(Counter(
+    "http_requests", "Requests by URL name, method and status code.",
+    ("view", "method", "status")))
+db_queries = registry.register(Histogram(
+    "db_queries_per_request", "Database queries issued per request.",
+    ("view",), buckets=QUERY_COUNT_BUCKETS))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds", "Time spent in database queries per request.",
+    ("view",)))
+registrations_total = registry.register(Counter(
+    "event_registrations", "Registration attempts by outcome "
+    "(success, duplicate, full, not_found, promoted).", ("outcome",)))
+
+
+class RequestStats:
+    __slots__ = ("queries", "query_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+
+
+current_request_stats = ContextVar("current_request_stats", default=None)
+
+
+def record_queries(execute, sql, params, many, context):
+    """
+    Database execute wrapper: attributes query count and time to the request
+    being served, if any. Installed on every new connection.
+    """
+    stats = current_request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.query_time += time.perf_counter() - start
+        stats.queries += 1
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    if record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_queries)
+
+
+def record_registration(outcome, count=1):
+    registrations_total.inc(outcome, amount=count)
+
+
+def metrics_view(request):
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
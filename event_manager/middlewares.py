@@ -1,18 +1,119 @@
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from django.db.backends.signals import connection_created
 from django.utils import timezone
 from zoneinfo import ZoneInfo
+from . import metrics, routers
 
 class TimezoneMiddleware:
     """
     Activates timezone from request header 'Timezone'.
     Defaults to Asia/Kolkata if not provided or invalid.
+    Works in both sync (WSGI) and async (ASGI) middleware chains, so async
+    views are not forced through a thread hop.
     """
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.activate_timezone(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self.activate_timezone(request)
+        return await self.get_response(request)
+
+    def activate_timezone(self, request):
         tz_name = request.headers.get("Timezone") or "Asia/Kolkata"
         try:
             timezone.activate(ZoneInfo(tz_name))
         except Exception:
             timezone.deactivate()
-        return self.get_response(request)
+
+
+class MetricsMiddleware:
+    """
+    Records per-URL-name latency, status codes and database query count/time
+    for every request (see ``event_manager.metrics``).
+    Works in both sync (WSGI) and async (ASGI) middleware chains.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        connection_created.connect(metrics.install_query_recorder)
+        for connection in connections.all(initialized_only=True):
+            metrics.install_query_recorder(None, connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start, stats = time.perf_counter(), metrics.RequestStats()
+        token = metrics.current_request_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.current_request_stats.reset(token)
+        self.record(request, response, start, stats)
+        return response
+
+    async def __acall__(self, request):
+        start, stats = time.perf_counter(), metrics.RequestStats()
+        token = metrics.current_request_stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.current_request_stats.reset(token)
+        self.record(request, response, start, stats)
+        return response
+
+    def record(self, request, response, start, stats):
+        match = request.resolver_match
+        view = (match.url_name or match.view_name) if match else "unmatched"
+        metrics.request_duration.observe(time.perf_counter() - start, view, request.method)
+        metrics.requests_total.inc(view, request.method, str(response.status_code))
+        metrics.db_queries.observe(stats.queries, view)
+        metrics.db_query_duration.observe(stats.query_time, view)
+
+
+class PrimaryStickinessMiddleware:
+    """
+    After a successful write, pins the client to the primary database for
+    ``REPLICA_STICKY_SECONDS`` so its next reads see the write even if the
+    replica lags (see ``event_manager.routers``).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        self.pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        self.pin(request, response)
+        return response
+
+    def pin(self, request, response):
+        if (request.method not in routers.SAFE_METHODS
+                and response.status_code < 400 and routers.replica_configured()):
+            routers.pin_to_primary(response)
@@ -0,0 +1,89 @@
+"""
+Read-replica routing.
+
+Views opt in with ``@replica_reads``; their GET/HEAD queries go to the
+``replica`` alias, everything else to ``default``. A client that has just
+written (see ``PrimaryStickinessMiddleware``) carries a short-lived cookie
+and keeps reading from the primary, so it always sees its own writes.
+Without a ``replica`` alias in ``DATABASES`` every query uses ``default``.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+REPLICA_ALIAS = "replica"
+STICKY_COOKIE = "pin_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_use_replica = ContextVar("use_replica", default=False)
+
+
+def replica_configured():
+    return REPLICA_ALIAS in connections.settings
+
+
+def is_pinned(request):
+    """
+    True if the client wrote recently and must read from the primary.
+    """
+    return STICKY_COOKIE in request.COOKIES
+
+
+def pin_to_primary(response):
+    response.set_cookie(
+        STICKY_COOKIE, "1", max_age=settings.REPLICA_STICKY_SECONDS,
+        httponly=True, samesite="Lax")
+
+
+@contextmanager
+def reading_from_replica(enabled=True):
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def replica_reads(view):
+    """
+    Routes the reads of a (sync or async) view to the replica for safe
+    methods, unless the client is pinned to the primary.
+    """
+    def use_replica(request):
+        return request.method in SAFE_METHODS and not is_pinned(request)
+
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            with reading_from_replica(use_replica(request)):
+                return await view(request, *args, **kwargs)
+    else:
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            with reading_from_replica(use_replica(request)):
+                return view(request, *args, **kwargs)
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and replica_configured():
+            return REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Explicit, so saving an instance loaded from the replica still
+        # writes to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema from the primary (replication, or
+        # ``sync_replica`` for local SQLite files).
+        return db != REPLICA_ALIAS
@@ -0,0 +1,54 @@
+"""
+OpenAPI schema, Swagger UI and ReDoc views.
+
+The schema is built ahead of time with ``python manage.py build_schema``
+and served from ``OPENAPI_SCHEMA_FILE``. drf-spectacular's views and schema
+generator are only imported the first time one of these routes is hit, so
+workers that never serve the docs never load them.
+"""
+import os
+from functools import lru_cache
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+
+
+CONTENT_TYPE = "application/vnd.oai.openapi+json"
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """
+    A view that imports the class-based view at ``dotted_path`` on first use.
+    """
+    @lru_cache(maxsize=None)
+    def load():
+        return import_string(dotted_path).as_view(**initkwargs)
+
+    def view(request, *args, **kwargs):
+        return load()(request, *args, **kwargs)
+    return view
+
+
+@lru_cache(maxsize=4)
+def read_schema(path, mtime):
+    # Keyed on mtime so a rebuilt file is picked up without a restart.
+    with open(path, "rb") as f:
+        return f.read()
+
+
+generate_schema = lazy_view("drf_spectacular.views.SpectacularJSONAPIView")
+swagger_view = lazy_view("drf_spectacular.views.SpectacularSwaggerView", url_name="schema")
+redoc_view = lazy_view("drf_spectacular.views.SpectacularRedocView", url_name="schema")
+
+
+def schema_view(request):
+    """
+    Serves the prebuilt schema, or generates it when none was built (e.g.
+    in development).
+    """
+    path = str(settings.OPENAPI_SCHEMA_FILE)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return generate_schema(request)
+    return HttpResponse(read_schema(path, mtime), content_type=CONTENT_TYPE)
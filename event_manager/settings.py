@@ -11,8 +11,11 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import os
 import sys
 
+from .database import database_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -45,9 +48,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "event_manager.middlewares.MetricsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     "event_manager.middlewares.TimezoneMiddleware",
+    "event_manager.middlewares.PrimaryStickinessMiddleware",
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -77,14 +82,55 @@ WSGI_APPLICATION = 'event_manager.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# EVENT_MANAGER_DB selects sqlite (default) or postgres; see database.py.
+
+DATABASES = database_settings(BASE_DIR)
+
+# Safe requests to views marked @replica_reads use the 'replica' alias when
+# one is configured; see routers.py.
+DATABASE_ROUTERS = ['event_manager.routers.ReplicaRouter']
+
+# How long, in seconds, a client reads from the primary after a write.
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 10))
 
-DATABASES = {
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# EVENTS_CACHE_BACKEND selects locmem (default), file or redis.
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+CACHE_LOCATIONS = {
+    'locmem': 'event-manager',
+    'file': str(BASE_DIR / '.cache'),
+    'redis': 'redis://127.0.0.1:6379/0',
+}
+EVENTS_CACHE_BACKEND = os.environ.get('EVENTS_CACHE_BACKEND', 'locmem')
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'event_manager.sqlite3',
+        'BACKEND': CACHE_BACKENDS[EVENTS_CACHE_BACKEND],
+        'LOCATION': os.environ.get(
+            'EVENTS_CACHE_LOCATION', CACHE_LOCATIONS[EVENTS_CACHE_BACKEND]),
     }
 }
 
+EVENTS_CACHE_ALIAS = 'default'
+
+# Upper bound, in seconds, for a cached upcoming-events page.
+EVENTS_LIST_CACHE_TIMEOUT = int(os.environ.get('EVENTS_LIST_CACHE_TIMEOUT', 300))
+
+# Fan-out for the live seat streams (events/live.py). "local" only sees this
+# process's writes; "poll" also re-reads watched events, for several workers.
+LIVE_BROKERS = {
+    'local': 'events.live.LocalBroker',
+    'poll': 'events.live.PollingBroker',
+}
+LIVE_BROKER = LIVE_BROKERS[os.environ.get('LIVE_BROKER', 'local')]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -105,9 +151,24 @@ REST_FRAMEWORK = {
     ],
 'DEFAULT_PAGINATION_CLASS':
         'rest_framework.pagination.LimitOffsetPagination',
-'PAGE_SIZE': 10
+'PAGE_SIZE': 10,
+# Token buckets for POST /events/<id>/register; "off" disables one.
+'DEFAULT_THROTTLE_RATES': {
+    'registration_ip': os.environ.get('REGISTRATION_RATE_IP', '60/min'),
+    'registration_email': os.environ.get('REGISTRATION_RATE_EMAIL', '5/min'),
+},
+# Proxies in front of the app that append to X-Forwarded-For. With 0 the
+# client IP is REMOTE_ADDR, so clients cannot pick their own rate-limit key.
+'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 0)),
 }
 
+# SQLite file holding the rate-limit buckets, shared by all workers on a host.
+RATE_LIMIT_DB = os.environ.get('RATE_LIMIT_DB', str(BASE_DIR / '.ratelimit.sqlite3'))
+IDEMPOTENCY_DB = os.environ.get('IDEMPOTENCY_DB', str(BASE_DIR / '.idempotency.sqlite3'))
+
+# Prebuilt OpenAPI schema served at /api/schema/ (manage.py build_schema).
+OPENAPI_SCHEMA_FILE = os.environ.get('OPENAPI_SCHEMA_FILE', str(BASE_DIR / 'openapi.json'))
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Mini Event Management API',
     'DESCRIPTION': 'Events, registrations, attendees with capacity & timezone handling.',
@@ -115,6 +176,8 @@ SPECTACULAR_SETTINGS = {
     'APPEND_COMPONENTS': {},
     'SECURITY': [], 
     'EXTENSIONS_INFO': {},
+    # Imports the view annotations only when a schema is generated.
+    'DEFAULT_GENERATOR_CLASS': 'events.schema.SchemaGenerator',
 }
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -156,7 +219,7 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Test-specific settings
-if 'test' in sys.argv:
+if 'test' in sys.argv and DATABASES['default']['ENGINE'].endswith('sqlite3'):
     # Use in-memory database for faster tests
     DATABASES = {
         'default': {
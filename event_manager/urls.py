@@ -16,12 +16,15 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from .metrics import metrics_view
+from .schema import redoc_view, schema_view, swagger_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('events/', include('events.urls')),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger'),
-    path('redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    path('async/events/', include('events.async_urls')),
+    path('metrics', metrics_view, name='metrics'),
+    path('api/schema/', schema_view, name='schema'),
+    path('swagger/', swagger_view, name='swagger'),
+    path('redoc/', redoc_view, name='redoc'),
 ]
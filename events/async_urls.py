@@ -0,0 +1,11 @@
+from django.urls import path
+from .async_views import (
+    event_list, event_register, event_attendee_list, event_live)
+
+
+urlpatterns = [
+    path('', event_list, name='async-event-list'),
+    path('<int:event_id>/register', event_register, name='async-register-attendees'),
+    path('<int:event_id>/attendees', event_attendee_list, name='async-event-attendees'),
+    path('<int:event_id>/live', event_live, name='async-event-live'),
+]
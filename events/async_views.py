@@ -0,0 +1,184 @@
+"""
+Native async versions of the read and registration endpoints, for ASGI
+deployments. Reads use Django's async ORM; the registration write still runs
+in a worker thread because ``transaction.atomic`` is sync-only.
+"""
+from contextlib import nullcontext
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, Throttled, ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from attendees.serializers import AttendeeSerializer
+from .cache import seats_query, upcoming_events_cache, with_seats
+from .filters import filter_events
+from .idempotency import idempotent
+from .live import get_broker, seat_counts, stream
+from .pagination import EventCursorPagination, AttendeeCursorPagination
+from .serializers import EventSerializer, EventRegisterSerializer
+from .soldout import sold_out_events
+from .throttles import RegistrationEmailThrottle, RegistrationIPThrottle
+from event_manager.metrics import record_registration
+from event_manager.routers import is_pinned, reading_from_replica, replica_reads
+from .waitlist import cancel_token
+from .utils import (
+    register_attendee, upcoming_events, event_attendees, roster_version_query,
+    roster_etag)
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    """
+    Renders with DRF's JSONRenderer so bodies match the sync API byte for byte.
+    """
+    return HttpResponse(
+        JSONRenderer().render(data), status=status,
+        content_type="application/json", headers=headers)
+
+
+def error_response(exc):
+    detail = exc.detail
+    data = detail if isinstance(detail, (list, dict)) else {"detail": detail}
+    headers = {"Retry-After": "%d" % exc.wait} if getattr(exc, "wait", None) else None
+    return json_response(data, status=exc.status_code, headers=headers)
+
+
+class LiveStreamUnavailable(APIException):
+    status_code = status.HTTP_501_NOT_IMPLEMENTED
+    default_detail = "Live updates are only served under ASGI."
+    default_code = "not_implemented"
+
+
+def check_throttles(request, throttle_classes):
+    """
+    ``APIView.check_throttles`` for a plain view: every throttle takes its
+    token, and a refusal raises ``Throttled`` with the longest wait.
+    """
+    throttles = [throttle() for throttle in throttle_classes]
+    waits = [throttle.wait() for throttle in throttles
+             if not throttle.allow_request(request, None)]
+    if waits:
+        raise Throttled(max(waits))
+
+
+@require_GET
+@replica_reads
+async def event_list(request):
+    """
+    Async counterpart of ``EventListCreateView.get``.
+    """
+    uncached = is_pinned(request) or not upcoming_events_cache.cacheable(request)
+    key = upcoming_events_cache.key(request)
+    data = None if uncached else upcoming_events_cache.get(key)
+    if data is not None:
+        data = with_seats(data, {id: taken async for id, taken in seats_query(data)})
+        return json_response(data, headers={"X-Cache": "HIT"})
+
+    serializer = EventSerializer(many=True)
+    paginator = EventCursorPagination()
+    try:
+        # Pages about to be cached come from the primary, as in the sync view.
+        with nullcontext() if uncached else reading_from_replica(False):
+            queryset = filter_events(upcoming_events(), request.GET)
+            page = await paginator.apaginate_queryset(
+                queryset.values(*serializer.value_fields()), request)
+    except APIException as exc:
+        return error_response(exc)
+    data = paginator.get_paginated_data(serializer.to_representation(page))
+    if uncached:
+        return json_response(data)
+    upcoming_events_cache.set(
+        key, data, expires_at=page[0]["start_time"] if page else None)
+    return json_response(data, headers={"X-Cache": "MISS"})
+
+
+@require_GET
+@replica_reads
+async def event_attendee_list(request, event_id):
+    """
+    Async counterpart of ``EventAttendeesListView``.
+    """
+    try:
+        etag = roster_etag(
+            await roster_version_query(event_id).afirst(), request.get_full_path())
+    except NotFound as exc:
+        return error_response(exc)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+    paginator = AttendeeCursorPagination()
+    try:
+        page = await paginator.apaginate_queryset(event_attendees(event_id), request)
+    except APIException as exc:
+        return error_response(exc)
+    data = AttendeeSerializer(page, many=True).data
+    return json_response(paginator.get_paginated_data(data), headers={"ETag": etag})
+
+
+@csrf_exempt
+@idempotent
+@require_POST
+async def event_register(request, event_id):
+    """
+    Async counterpart of ``EventRegisteView.post``, with the same throttles
+    and ``Idempotency-Key`` handling.
+    """
+    request = Request(request, parsers=[JSONParser()])
+    try:
+        await sync_to_async(check_throttles)(
+            request, [RegistrationIPThrottle, RegistrationEmailThrottle])
+        if sold_out_events.is_sold_out(event_id):
+            record_registration("full")
+            raise ValidationError("Event is already full.")
+        payload = request.data
+    except APIException as exc:
+        return error_response(exc)
+
+    serializer = EventRegisterSerializer(data=payload)
+    if not serializer.is_valid():
+        return json_response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        await sync_to_async(register_attendee)(
+            event_id=event_id,
+            name=serializer.validated_data["name"],
+            email=serializer.validated_data["email"],
+        )
+    except APIException as exc:
+        return error_response(exc)
+    return json_response(
+        {"message": "Registration successful",
+         "cancel_token": cancel_token(event_id, serializer.validated_data["email"])},
+        status=status.HTTP_201_CREATED)
+
+
+@require_GET
+async def event_live(request, event_id):
+    """
+    Server-Sent Events stream of the event's ``registered_count`` and
+    ``seats_remaining``, pushed as registrations come and go. A WSGI worker
+    would be held for as long as the client stays connected, so the stream
+    is refused there.
+    """
+    if not isinstance(request, ASGIRequest):
+        return error_response(LiveStreamUnavailable())
+    broker = get_broker()
+    # Subscribe first so a change between the read and the subscribe is not lost.
+    subscription = broker.subscribe(event_id)
+    try:
+        counts = (await seat_counts([event_id])).get(event_id)
+    except BaseException:
+        broker.unsubscribe(event_id, subscription)
+        raise
+    if counts is None:
+        broker.unsubscribe(event_id, subscription)
+        return error_response(NotFound("Event not found"))
+    return StreamingHttpResponse(
+        stream(broker, event_id, subscription, counts),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
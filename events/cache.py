@@ -0,0 +1,133 @@
+import hashlib
+import threading
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from event_manager.metrics import registry
+from .models import Event
+
+
+class UpcomingEventsCache:
+    """
+    Versioned cache of serialized upcoming-events pages.
+
+    Entries are keyed by a global version, the active timezone and the
+    query string. Any change to an ``Event`` bumps the version, which
+    orphans every cached page at once; orphans simply age out. A page also
+    expires when its earliest event starts, since that event then stops
+    being "upcoming".
+
+    Registrations do not touch the cache: seat counts on a cached page are
+    refreshed on every hit by ``with_seats``, and pages filtered on seats
+    are not cached at all.
+    """
+    version_key = "events:upcoming:version"
+    key_prefix = "events:upcoming"
+    # Filters whose matches change with every registration.
+    seat_filters = ("has_seats",)
+
+    def __init__(self, alias=None, timeout=None):
+        self._alias = alias
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self._alias or getattr(settings, "EVENTS_CACHE_ALIAS", "default")]
+
+    @property
+    def timeout(self):
+        if self._timeout is not None:
+            return self._timeout
+        return getattr(settings, "EVENTS_LIST_CACHE_TIMEOUT", 300)
+
+    def version(self):
+        version = self.cache.get(self.version_key)
+        if version is None:
+            # Seed from the clock so a lost version key never reuses old entries.
+            self.cache.add(self.version_key, time.time_ns(), None)
+            version = self.cache.get(self.version_key)
+        return version
+
+    def bump(self):
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            self.cache.set(self.version_key, time.time_ns(), None)
+
+    def invalidate(self):
+        """
+        Bumps the version now and again after commit, so a reader that
+        cached the pre-commit state in between is discarded too.
+        """
+        self.bump()
+        transaction.on_commit(self.bump)
+
+    def cacheable(self, request):
+        return not any(name in request.GET for name in self.seat_filters)
+
+    def key(self, request):
+        query = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        tz_name = timezone.get_current_timezone_name()
+        return f"{self.key_prefix}:v{self.version()}:{tz_name}:{query}"
+
+    def get(self, key):
+        data = self.cache.get(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def set(self, key, data, expires_at=None):
+        """
+        Stores ``data`` for the configured timeout, or until ``expires_at``
+        if that comes first.
+        """
+        timeout = self.timeout
+        if expires_at is not None:
+            timeout = min(timeout, (expires_at - timezone.now()).total_seconds())
+        if timeout > 0:
+            self.cache.set(key, data, timeout)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+upcoming_events_cache = UpcomingEventsCache()
+
+
+def seats_query(data):
+    """
+    ``(id, seats_taken)`` for the events on a cached page, in one query.
+    """
+    return Event.objects.filter(
+        id__in=[row["id"] for row in data["results"]]).values_list("id", "seats_taken")
+
+
+def with_seats(data, seats):
+    """
+    Writes the current ``seats`` (``{event_id: seats_taken}``) over the
+    counts stored with a cached page.
+    """
+    for row in data["results"]:
+        taken = seats.get(row["id"], row["registered_count"])
+        row["registered_count"] = taken
+        row["seats_remaining"] = max(row["max_capacity"] - taken, 0)
+    return data
+
+
+def upcoming_events_cache_metrics():
+    stats = upcoming_events_cache.stats()
+    yield ("events_list_cache_requests_total", "counter",
+           "Upcoming-events cache lookups by result.",
+           [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])])
+
+
+registry.add_collector(upcoming_events_cache_metrics)
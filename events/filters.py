@@ -0,0 +1,85 @@
+import re
+from datetime import datetime, time, timedelta
+from django.db import connections
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+TRUE_VALUES = ("1", "true", "yes")
+FALSE_VALUES = ("0", "false", "no")
+
+
+def parse_bound(name, value):
+    """
+    Parses an ISO date or datetime into an aware datetime. Naive values are
+    in the active timezone. Returns ``(moment, is_date)``; a bare date
+    becomes midnight at the start of that day.
+    """
+    try:
+        # Dates first: parse_datetime() also accepts a bare date.
+        day = parse_date(value)
+        moment = datetime.combine(day, time.min) if day else parse_datetime(value)
+    except ValueError:
+        day = moment = None
+    if moment is None:
+        raise ValidationError({name: ["Expected an ISO date or datetime."]})
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment, day is not None
+
+
+def fts_query(text):
+    """
+    Turns free text into an FTS5 query: every word must match, as a prefix.
+    Quoting each word keeps FTS5 operators in user input inert.
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def search(queryset, text):
+    if connections[queryset.db].vendor == "sqlite":
+        query = fts_query(text)
+        if not query:
+            return queryset
+        return queryset.filter(id__in=RawSQL(
+            "SELECT rowid FROM events_event_fts WHERE events_event_fts MATCH %s",
+            [query]))
+    # PostgreSQL serves these from the pg_trgm GIN indexes.
+    return queryset.filter(Q(name__icontains=text) | Q(location__icontains=text))
+
+
+def filter_events(queryset, params):
+    """
+    Applies the list filters from ``params`` (a QueryDict):
+
+    * ``q`` - full-text search over name and location
+    * ``from`` / ``to`` - start time bounds, inclusive
+    * ``location`` - exact location
+    * ``has_seats`` - ``true`` for events with seats left, ``false`` for full ones
+    """
+    text = params.get("q", "").strip()
+    if text:
+        queryset = search(queryset, text)
+    if params.get("from"):
+        start, _ = parse_bound("from", params["from"])
+        queryset = queryset.filter(start_time__gte=start)
+    if params.get("to"):
+        end, is_date = parse_bound("to", params["to"])
+        if is_date:
+            # A bare date includes events at any time on that day.
+            queryset = queryset.filter(start_time__lt=end + timedelta(days=1))
+        else:
+            queryset = queryset.filter(start_time__lte=end)
+    if params.get("location"):
+        queryset = queryset.filter(location=params["location"])
+    has_seats = params.get("has_seats", "").lower()
+    if has_seats in TRUE_VALUES:
+        queryset = queryset.filter(seats_taken__lt=F("max_capacity"))
+    elif has_seats in FALSE_VALUES:
+        queryset = queryset.filter(seats_taken__gte=F("max_capacity"))
+    elif has_seats:
+        raise ValidationError({"has_seats": ["Expected true or false."]})
+    return queryset
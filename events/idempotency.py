@@ -0,0 +1,247 @@
+import asyncio
+import hashlib
+import time
+from functools import wraps
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from .sqlite_store import SQLiteStore
+
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+# Outcomes that may differ on retry (timeouts, conflicts, throttling).
+RETRYABLE_STATUSES = {408, 409, 425, 429}
+# Seconds between checks while another request holds the key.
+POLL_INTERVAL = 0.05
+
+
+class KeyReused(Exception):
+    """The key was first used with a different request body."""
+
+
+OWNER, RUNNING, DONE = "owner", "running", "done"
+
+
+class IdempotencyStore(SQLiteStore):
+    """
+    Map from idempotency key to the first response given for it, in a
+    SQLite file shared by every worker on the host (``IDEMPOTENCY_DB``), so
+    a retry is collapsed whichever worker it lands on.
+
+    ``begin`` claims a key with a single upsert. A claimed key is held by an
+    in-flight row for ``IDEMPOTENCY_LEASE`` seconds, which is how long a
+    key stays blocked if its worker dies mid-request. Finished keys expire
+    ``IDEMPOTENCY_TTL`` seconds after completion. Every ``prune_every``
+    claims, expired rows are deleted and only the newest
+    ``IDEMPOTENCY_MAX_KEYS`` finished rows are kept.
+    """
+    setting = "IDEMPOTENCY_DB"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS requests ("
+        "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, expires_at REAL NOT NULL, "
+        "status INTEGER, content BLOB, content_type TEXT) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS requests_expires_at ON requests (expires_at)",
+    )
+    claim_sql = """
+        INSERT INTO requests (key, fingerprint, expires_at)
+        VALUES (:key, :fingerprint, :now + :lease)
+        ON CONFLICT (key) DO UPDATE SET
+            fingerprint = excluded.fingerprint, expires_at = excluded.expires_at,
+            status = NULL, content = NULL, content_type = NULL
+        WHERE requests.expires_at <= :now
+        RETURNING 1
+    """
+
+    def __init__(self, path=None, max_entries=None, ttl=None, prune_every=100):
+        super().__init__(path)
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self.prune_every = prune_every
+        self._claims = 0
+
+    @property
+    def max_entries(self):
+        if self._max_entries is not None:
+            return self._max_entries
+        return getattr(settings, "IDEMPOTENCY_MAX_KEYS", 10_000)
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, "IDEMPOTENCY_TTL", 24 * 3600)
+
+    @property
+    def lease(self):
+        return getattr(settings, "IDEMPOTENCY_LEASE", 300)
+
+    def begin(self, key, fingerprint):
+        """
+        Returns ``(OWNER, None)`` when the caller should run the request and
+        call ``finish``, ``(RUNNING, None)`` while another request holds the
+        key, or ``(DONE, stored)`` with the stored response.
+        """
+        now = time.time()
+        self._claims += 1
+        if self._claims % self.prune_every == 0:
+            self.prune(now)
+        connection = self.connection
+        while True:
+            if connection.execute(self.claim_sql, {
+                    "key": key, "fingerprint": fingerprint, "now": now,
+                    "lease": self.lease}).fetchone():
+                return OWNER, None
+            row = connection.execute(
+                "SELECT fingerprint, status, content, content_type FROM requests "
+                "WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                continue  # The owner failed and let go in between; claim again.
+            if row[0] != fingerprint:
+                raise KeyReused(key)
+            if row[1] is None:
+                return RUNNING, None
+            return DONE, (row[1], row[2], row[3])
+
+    def finish(self, key, stored):
+        """
+        Stores ``(status, content, content_type)`` for replay, or with
+        ``None`` forgets the key so the next retry runs the request again.
+        """
+        if stored is None:
+            self.connection.execute(
+                "DELETE FROM requests WHERE key = ? AND status IS NULL", (key,))
+        else:
+            self.connection.execute(
+                "UPDATE requests SET status = ?, content = ?, content_type = ?, "
+                "expires_at = ? WHERE key = ?",
+                (*stored, time.time() + self.ttl, key))
+
+    def prune(self, now=None):
+        connection = self.connection
+        connection.execute(
+            "DELETE FROM requests WHERE expires_at <= ?", (now or time.time(),))
+        connection.execute(
+            "DELETE FROM requests WHERE key IN (SELECT key FROM requests "
+            "WHERE status IS NOT NULL ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,))
+
+    def reset(self):
+        self.connection.execute("DELETE FROM requests")
+
+
+idempotency_store = IdempotencyStore()
+
+
+def replay(stored):
+    status, content, content_type = stored
+    response = HttpResponse(content, status=status, content_type=content_type)
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+def check_key(request):
+    """
+    Returns ``(store_key, fingerprint)`` for a keyed POST, ``None`` when the
+    request is not idempotent, or an error response for an invalid key.
+    """
+    key = request.headers.get(HEADER)
+    if request.method != "POST" or not key:
+        return None
+    if len(key) > MAX_KEY_LENGTH:
+        return JsonResponse(
+            {"detail": f"{HEADER} must be at most {MAX_KEY_LENGTH} characters."},
+            status=400)
+    return f"{request.path}\n{key}", hashlib.sha256(request.body).hexdigest()
+
+
+def waiting_response(state, stored):
+    """
+    The response for a retry that did not get to run the request: a replay,
+    a 422 for a reused key, a 409 after waiting too long, or ``None`` to
+    keep waiting.
+    """
+    if state is KeyReused:
+        return JsonResponse(
+            {"detail": f"{HEADER} was already used with a different request."},
+            status=422)
+    if state == DONE:
+        return replay(stored)
+    if state is TimeoutError:
+        return JsonResponse(
+            {"detail": f"A request with this {HEADER} is still in progress."},
+            status=409)
+    return None
+
+
+def storable(response):
+    """
+    What to keep of ``response``: final outcomes only, never server errors
+    or retryable statuses.
+    """
+    if (response.status_code < 500 and response.status_code not in RETRYABLE_STATUSES
+            and not response.streaming):
+        return response.status_code, response.content, response["Content-Type"]
+    return None
+
+
+def idempotent(view):
+    """
+    Honours the ``Idempotency-Key`` header on POSTs to ``view`` (sync or
+    async): the first response for a key is replayed for retries, which
+    never reach the view. Reusing a key with a different body is a 422; a
+    retry that outwaits the original (``IDEMPOTENCY_WAIT`` seconds) gets a
+    409. Only final outcomes are stored: server errors and retryable
+    statuses such as 429 and 409 are not, so the client can retry them.
+    """
+    def poll(store_key, fingerprint, deadline):
+        try:
+            state, stored = idempotency_store.begin(store_key, fingerprint)
+        except KeyReused:
+            return KeyReused, None
+        if state == RUNNING and time.monotonic() >= deadline:
+            return TimeoutError, None
+        return state, stored
+
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            checked = check_key(request)
+            if checked is None or isinstance(checked, HttpResponse):
+                return checked or await view(request, *args, **kwargs)
+            deadline = time.monotonic() + getattr(settings, "IDEMPOTENCY_WAIT", 30)
+            while (state := await sync_to_async(poll)(*checked, deadline))[0] != OWNER:
+                response = waiting_response(*state)
+                if response is not None:
+                    return response
+                await asyncio.sleep(POLL_INTERVAL)
+            try:
+                response = await view(request, *args, **kwargs)
+            except BaseException:
+                await sync_to_async(idempotency_store.finish)(checked[0], None)
+                raise
+            await sync_to_async(idempotency_store.finish)(checked[0], storable(response))
+            return response
+        return wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        checked = check_key(request)
+        if checked is None or isinstance(checked, HttpResponse):
+            return checked or view(request, *args, **kwargs)
+        deadline = time.monotonic() + getattr(settings, "IDEMPOTENCY_WAIT", 30)
+        while (state := poll(*checked, deadline))[0] != OWNER:
+            response = waiting_response(*state)
+            if response is not None:
+                return response
+            time.sleep(POLL_INTERVAL)
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+        except BaseException:
+            idempotency_store.finish(checked[0], None)
+            raise
+        idempotency_store.finish(checked[0], storable(response))
+        return response
+    return wrapper
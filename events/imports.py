@@ -0,0 +1,110 @@
+import codecs
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from django.conf import settings
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+from .cache import upcoming_events_cache
+from .models import Event
+from .parsers import InvalidLine
+
+
+IMPORT_FORMATS = {
+    ".csv": "csv",
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def detect_format(filename: str) -> str:
+    suffix = Path(filename or "").suffix.lower()
+    if suffix not in IMPORT_FORMATS:
+        raise ValidationError(
+            f"Unsupported file type '{suffix}'. Use one of: "
+            + ", ".join(sorted(IMPORT_FORMATS)))
+    return IMPORT_FORMATS[suffix]
+
+
+def read_rows(fileobj, file_format: str, encoding: str = "utf-8"):
+    """
+    Yields one dict per event row from a binary file object. CSV and NDJSON
+    are read line by line. A JSON file must hold a single array and is
+    loaded into memory whole; use NDJSON for large files.
+
+    An NDJSON line that is not valid text is reported as an invalid row;
+    in CSV or JSON it raises ``ValidationError``.
+    """
+    try:
+        yield from _read_rows(fileobj, file_format, encoding)
+    except UnicodeDecodeError as exc:
+        raise ValidationError(f"The file is not valid {encoding} text: {exc.reason}.")
+
+
+def _read_rows(fileobj, file_format, encoding):
+    if file_format == "csv":
+        yield from csv.DictReader(codecs.getreader(encoding)(fileobj))
+    elif file_format == "ndjson":
+        for line in fileobj:
+            try:
+                line = line.decode(encoding).strip()
+                if line:
+                    yield json.loads(line)
+            except UnicodeDecodeError:
+                yield InvalidLine(f"Line is not valid {encoding} text.")
+            except ValueError as exc:
+                yield InvalidLine(f"JSON parse error - {exc}")
+    else:
+        text = codecs.getreader(encoding)(fileobj)
+        try:
+            rows = json.load(text)
+        except UnicodeDecodeError:
+            raise
+        except ValueError as exc:
+            raise ValidationError(f"JSON parse error - {exc}")
+        if not isinstance(rows, list):
+            raise ValidationError("Expected a JSON array of events.")
+        yield from rows
+
+
+def import_events(rows, batch_size: int = None) -> dict:
+    """
+    Validates rows with ``EventSerializer`` and inserts the valid ones with
+    ``bulk_create`` in batches of ``batch_size``. Invalid rows are reported
+    (1-based ``row`` numbers) without stopping the load. The whole load is
+    one transaction, so a file that turns out to be unreadable part-way
+    (``ValidationError`` from ``read_rows``) imports nothing.
+
+    Naive datetimes are read in the active timezone, as in the API.
+    """
+    from .serializers import EventSerializer
+
+    batch_size = batch_size or getattr(settings, "EVENT_IMPORT_BATCH_SIZE", 500)
+    # One serializer validates every row, so its fields are built only once.
+    serializer = EventSerializer()
+    created = 0
+    errors = []
+    rows = enumerate(rows, start=1)
+
+    with transaction.atomic():
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            events = []
+            for number, row in batch:
+                if isinstance(row, InvalidLine):
+                    errors.append({"row": number, "errors": [row.error]})
+                    continue
+                try:
+                    events.append(Event(**serializer.run_validation(row)))
+                except ValidationError as exc:
+                    errors.append({"row": number, "errors": exc.detail})
+            created += len(Event.objects.bulk_create(events))
+
+    if created:
+        # bulk_create skips the post_save signal that normally does this.
+        upcoming_events_cache.bump()
+    return {"created": created, "failed": len(errors), "errors": errors}
@@ -0,0 +1,226 @@
+"""
+Live seat counts for the ``events/<id>/live`` Server-Sent Events stream.
+
+Every streaming connection holds a ``Subscription`` with a broker. Writers
+call ``publish_on_commit`` when seats change; the broker waits
+``LIVE_COALESCE_SECONDS`` so a burst of changes becomes one update, reads
+the counts once per event and hands the result to every subscriber. An
+idle connection costs one suspended coroutine: no thread, no query.
+
+``LocalBroker`` only hears about changes made in its own process. With
+several workers, ``PollingBroker`` also re-reads the counts of all watched
+events every ``LIVE_POLL_SECONDS`` in a single query.
+"""
+import asyncio
+import json
+import logging
+from functools import lru_cache
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
+from .models import Event
+
+
+logger = logging.getLogger(__name__)
+
+
+async def seat_counts(event_ids) -> dict:
+    """
+    ``{event_id: {"registered_count": ..., "seats_remaining": ...}}`` for
+    the events that exist, in one query.
+    """
+    return {
+        event_id: {
+            "registered_count": taken,
+            "seats_remaining": max(capacity - taken, 0),
+        }
+        async for event_id, taken, capacity in Event.objects.filter(
+            id__in=event_ids).values_list("id", "seats_taken", "max_capacity")
+    }
+
+
+def close_old_connections():
+    """
+    ``django.db.close_old_connections`` for code running outside a request,
+    which gets none of the per-request cleanup. Connections inside a
+    transaction (as in tests) are left alone.
+    """
+    for connection in connections.all(initialized_only=True):
+        if not connection.in_atomic_block:
+            connection.close_if_unusable_or_obsolete()
+
+
+async def background_seat_counts(event_ids):
+    """
+    ``seat_counts`` for the brokers' background tasks: a broken or expired
+    connection is replaced before and after the read, and a failed read is
+    logged and returns ``None`` instead of killing the task.
+    """
+    await sync_to_async(close_old_connections)()
+    try:
+        return await seat_counts(event_ids)
+    except Exception:
+        logger.exception("Reading live seat counts for %s failed.", event_ids)
+        return None
+    finally:
+        await sync_to_async(close_old_connections)()
+
+
+class Subscription:
+    """
+    Holds only the latest counts, so a slow client skips straight to the
+    current state instead of queueing every change.
+    """
+    __slots__ = ("value", "_changed")
+
+    def __init__(self):
+        self.value = None
+        self._changed = asyncio.Event()
+
+    def push(self, value):
+        self.value = value
+        self._changed.set()
+
+    async def wait(self, timeout):
+        """
+        The next counts, or ``None`` if nothing arrived within ``timeout``.
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._changed.clear()
+        return self.value
+
+
+class LocalBroker:
+    """
+    In-process fan-out. ``publish`` may be called from any thread; the
+    subscriber bookkeeping lives on the event loop serving the streams.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._pending = set()
+        self._tasks = set()
+        self._loop = None
+
+    @property
+    def coalesce(self):
+        return getattr(settings, "LIVE_COALESCE_SECONDS", 0.25)
+
+    def subscribe(self, event_id) -> Subscription:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A server runs one loop per worker; a new one means the old is gone.
+            self._loop = loop
+            self._pending.clear()
+        subscription = Subscription()
+        self._subscribers.setdefault(event_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, event_id, subscription) -> None:
+        subscribers = self._subscribers.get(event_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[event_id]
+
+    def publish(self, event_id=None) -> None:
+        """
+        Schedules an update for ``event_id``, or for every watched event.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._schedule, event_id)
+
+    def push(self, counts) -> None:
+        for event_id, value in counts.items():
+            for subscription in self._subscribers.get(event_id, ()):
+                subscription.push(value)
+
+    def _spawn(self, coroutine):
+        task = self._loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _schedule(self, event_id):
+        event_ids = list(self._subscribers) if event_id is None else [event_id]
+        for watched in event_ids:
+            if watched in self._subscribers and watched not in self._pending:
+                self._pending.add(watched)
+                self._spawn(self._flush(watched))
+
+    async def _flush(self, event_id):
+        await asyncio.sleep(self.coalesce)
+        # Changes committed from here on schedule another flush.
+        self._pending.discard(event_id)
+        counts = await background_seat_counts([event_id])
+        if counts is not None:
+            self.push(counts)
+
+
+class PollingBroker(LocalBroker):
+    """
+    ``LocalBroker`` plus a per-worker poller, so changes made by other
+    workers (or hosts) reach this worker's streams within one interval.
+    """
+    _poller = None
+
+    @property
+    def poll_interval(self):
+        return getattr(settings, "LIVE_POLL_SECONDS", 1.0)
+
+    def subscribe(self, event_id) -> Subscription:
+        subscription = super().subscribe(event_id)
+        if self._poller is None or self._poller.done():
+            self._poller = self._spawn(self._poll())
+        return subscription
+
+    async def _poll(self):
+        while self._subscribers:
+            await asyncio.sleep(self.poll_interval)
+            if self._subscribers:
+                counts = await background_seat_counts(list(self._subscribers))
+                if counts is not None:
+                    # Streams drop repeats, so pushing unchanged counts is harmless.
+                    self.push(counts)
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(getattr(settings, "LIVE_BROKER", "events.live.LocalBroker"))()
+
+
+def publish_on_commit(event_id=None) -> None:
+    """
+    Tells live streams that ``event_id``'s seats (or, with ``None``, any
+    event's) changed, once the current transaction commits.
+    """
+    transaction.on_commit(lambda: get_broker().publish(event_id))
+
+
+def message(event_id, counts) -> str:
+    return "event: seats\ndata: %s\n\n" % json.dumps({"event_id": event_id, **counts})
+
+
+async def stream(broker, event_id, subscription, counts):
+    """
+    Yields SSE messages: the current counts, then every change, with a
+    comment every ``LIVE_KEEPALIVE_SECONDS`` to keep proxies from closing
+    the idle connection.
+    """
+    keepalive = getattr(settings, "LIVE_KEEPALIVE_SECONDS", 15)
+    try:
+        yield message(event_id, counts)
+        while True:
+            value = await subscription.wait(keepalive)
+            if value is None:
+                yield ": keepalive\n\n"
+            elif value != counts:
+                counts = value
+                yield message(event_id, counts)
+    finally:
+        broker.unsubscribe(event_id, subscription)
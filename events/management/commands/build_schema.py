@@ -0,0 +1,25 @@
+import os
+from pathlib import Path
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Build step for the OpenAPI schema served at /api/schema/. The file is
+    written next to its destination and renamed into place, so running
+    workers never read a half-written schema.
+    """
+    help = "Write the OpenAPI schema to OPENAPI_SCHEMA_FILE."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", help="Output path (default: OPENAPI_SCHEMA_FILE).")
+
+    def handle(self, *args, file=None, **options):
+        path = Path(file or settings.OPENAPI_SCHEMA_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        call_command("spectacular", format="openapi-json", file=str(tmp), validate=True)
+        os.replace(tmp, path)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}."))
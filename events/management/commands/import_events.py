@@ -0,0 +1,50 @@
+import json
+from zoneinfo import ZoneInfo
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from events.imports import IMPORT_FORMATS, detect_format, import_events, read_rows
+
+
+class Command(BaseCommand):
+    """
+    Bulk-loads events from a CSV, JSON or NDJSON file, using the same
+    validation as ``POST /events/``.
+    """
+    help = "Import events from a CSV, JSON or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument(
+            "--format", choices=sorted(set(IMPORT_FORMATS.values())),
+            help="File format (default: taken from the file extension).")
+        parser.add_argument(
+            "--batch-size", type=int, default=None,
+            help="Rows per bulk insert (default: EVENT_IMPORT_BATCH_SIZE).")
+        parser.add_argument(
+            "--timezone", default="Asia/Kolkata",
+            help="Timezone for naive datetimes (default: Asia/Kolkata).")
+
+    def handle(self, *args, **options):
+        try:
+            file_format = options["format"] or detect_format(options["path"])
+        except ValidationError as exc:
+            raise CommandError(exc.detail[0])
+        try:
+            tz = ZoneInfo(options["timezone"])
+        except (KeyError, ValueError):
+            raise CommandError(f"Unknown timezone '{options['timezone']}'.")
+
+        try:
+            with open(options["path"], "rb") as fileobj, timezone.override(tz):
+                result = import_events(
+                    read_rows(fileobj, file_format), batch_size=options["batch_size"])
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except ValidationError as exc:
+            raise CommandError(exc.detail[0])
+
+        for error in result["errors"]:
+            self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['created']} event(s), {result['failed']} row(s) failed."))
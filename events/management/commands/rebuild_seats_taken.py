@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from events.models import Event
+from events.utils import rebuild_seats_taken
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the denormalized ``Event.seats_taken`` counter from
+    ``Registration`` rows.
+    """
+    help = "Rebuild Event.seats_taken from the Registration table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "event_ids", nargs="*", type=int,
+            help="Only rebuild these events (default: all events).")
+
+    def handle(self, *args, **options):
+        queryset = Event.objects.all()
+        if options["event_ids"]:
+            queryset = queryset.filter(id__in=options["event_ids"])
+        updated = rebuild_seats_taken(queryset)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt seats_taken for {updated} event(s)."))
@@ -0,0 +1,133 @@
+import random
+import time
+from datetime import timedelta
+from itertools import islice
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from attendees.models import Attendees
+from events.cache import upcoming_events_cache
+from events.models import Event, Registration
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    """
+    Generates a large, reproducible dataset for benchmarking.
+
+    Events are spread over the past and the future; registration counts
+    follow a Zipf-like popularity curve, so a few events are huge (and some
+    sold out) while most are small. Primary keys are assigned up front, so
+    rows go straight into ``bulk_create`` without reading ids back; the
+    id sequences are moved past them afterwards.
+    """
+    help = "Seed a deterministic benchmark dataset of events, attendees and registrations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=50_000)
+        parser.add_argument("--attendees", type=int, default=1_000_000)
+        parser.add_argument("--registrations", type=int, default=2_000_000,
+                            help="Approximate total registrations to create.")
+        parser.add_argument("--past-fraction", type=float, default=0.3,
+                            help="Share of events that have already started.")
+        parser.add_argument("--skew", type=float, default=1.1,
+                            help="Zipf exponent for event popularity.")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        if options["attendees"] < 1 or options["events"] < 1:
+            raise CommandError("--events and --attendees must be positive.")
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        started = time.perf_counter()
+
+        first_attendee = (Attendees.objects.aggregate(m=Max("id"))["m"] or 0) + 1
+        first_event = (Event.objects.aggregate(m=Max("id"))["m"] or 0) + 1
+
+        self.write_rows(Attendees, self.attendee_rows(first_attendee, options["attendees"]),
+                        options["attendees"])
+        sizes = self.registration_counts(options)
+        events = list(self.event_rows(first_event, sizes, options["past_fraction"]))
+        self.write_rows(Event, events, len(events))
+        self.write_rows(
+            Registration,
+            self.registration_rows(events, first_attendee, options["attendees"]),
+            sum(sizes))
+        self.reset_sequences()
+
+        upcoming_events_cache.bump()
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['attendees']} attendees, {len(events)} events and "
+            f"{sum(sizes)} registrations in {time.perf_counter() - started:.1f}s."))
+
+    def write_rows(self, model, rows, total):
+        written = 0
+        for batch in batched(rows, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(batch, batch_size=self.batch_size)
+            written += len(batch)
+            self.stdout.write(f"\r{model.__name__}: {written}/{total}", ending="")
+        self.stdout.write("")
+
+    def reset_sequences(self):
+        """
+        Explicit ids do not advance PostgreSQL sequences; without this the
+        next regular insert would collide with a seeded row.
+        """
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), [Attendees, Event, Registration])
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+    def attendee_rows(self, first_id, count):
+        for offset in range(count):
+            pk = first_id + offset
+            yield Attendees(id=pk, name=f"Attendee {pk}", email=f"attendee{pk}@bench.example.com")
+
+    def registration_counts(self, options):
+        """
+        Registrations per event: Zipf weights over a shuffled event order,
+        capped by the number of attendees.
+        """
+        count = options["events"]
+        weights = [1 / (rank + 1) ** options["skew"] for rank in range(count)]
+        self.rng.shuffle(weights)
+        total_weight = sum(weights)
+        return [
+            min(options["attendees"], round(options["registrations"] * w / total_weight))
+            for w in weights
+        ]
+
+    def event_rows(self, first_id, sizes, past_fraction):
+        rng = self.rng
+        for offset, size in enumerate(sizes):
+            pk = first_id + offset
+            if rng.random() < past_fraction:
+                start = self.now - timedelta(hours=rng.randrange(1, 24 * 365))
+            else:
+                start = self.now + timedelta(hours=rng.randrange(1, 24 * 365))
+            # Roughly one event in ten is sold out; the rest have headroom.
+            spare = 0 if rng.random() < 0.1 else rng.randrange(1, max(2, size // 2 + 50))
+            yield Event(
+                id=pk, name=f"Event {pk}", location=f"Venue {rng.randrange(500)}",
+                start_time=start, end_time=start + timedelta(hours=rng.randrange(1, 48)),
+                max_capacity=size + spare, seats_taken=size)
+
+    def registration_rows(self, events, first_attendee, attendee_count):
+        rng = self.rng
+        window = 30 * 24 * 3600
+        for event in events:
+            for index in rng.sample(range(attendee_count), event.seats_taken):
+                yield Registration(
+                    event_id=event.id, attendee_id=first_attendee + index,
+                    created_at=event.start_time - timedelta(seconds=rng.randrange(1, window)))
@@ -0,0 +1,33 @@
+import sqlite3
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from event_manager.routers import REPLICA_ALIAS
+
+
+class Command(BaseCommand):
+    """
+    Copies the primary SQLite database onto the replica file with SQLite's
+    online backup API. Stands in for replication when trying out replica
+    routing locally; each run is a point-in-time snapshot, so anything
+    written afterwards is "replication lag" until the next run.
+    """
+    help = "Copy the primary SQLite database to the replica file (local testing only)."
+
+    def handle(self, *args, **options):
+        if REPLICA_ALIAS not in connections.settings:
+            raise CommandError("No 'replica' database configured; set SQLITE_REPLICA_PATH.")
+        primary = connections[DEFAULT_DB_ALIAS].settings_dict
+        replica = connections[REPLICA_ALIAS].settings_dict
+        if not (primary["ENGINE"] == replica["ENGINE"] == "django.db.backends.sqlite3"):
+            raise CommandError("sync_replica only supports SQLite primary and replica.")
+
+        connections[REPLICA_ALIAS].close()
+        source = sqlite3.connect(str(primary["NAME"]))
+        target = sqlite3.connect(str(replica["NAME"]))
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        self.stdout.write(self.style.SUCCESS(
+            f"Copied {primary['NAME']} to {replica['NAME']}."))
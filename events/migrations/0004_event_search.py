@@ -0,0 +1,85 @@
+# Generated by Django 5.2.5
+
+from django.db import migrations, models
+
+
+# Full-text search over Event.name and Event.location. SQLite gets an FTS5
+# index kept in sync by triggers; PostgreSQL gets trigram GIN indexes that
+# match the UPPER(col::text) LIKE ... SQL Django emits for icontains.
+# Note: SQLite table rebuilds (e.g. AlterField on Event) drop triggers, so
+# such migrations must re-run create_search_index.
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE events_event_fts USING fts5(
+        name, location, content='events_event', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER events_event_fts_insert AFTER INSERT ON events_event BEGIN
+        INSERT INTO events_event_fts(rowid, name, location)
+        VALUES (new.id, new.name, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER events_event_fts_delete AFTER DELETE ON events_event BEGIN
+        INSERT INTO events_event_fts(events_event_fts, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+    END
+    """,
+    # Only name/location changes touch the index, not seat counter updates.
+    """
+    CREATE TRIGGER events_event_fts_update AFTER UPDATE OF name, location ON events_event BEGIN
+        INSERT INTO events_event_fts(events_event_fts, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+        INSERT INTO events_event_fts(rowid, name, location)
+        VALUES (new.id, new.name, new.location);
+    END
+    """,
+    "INSERT INTO events_event_fts(events_event_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS events_event_fts_insert",
+    "DROP TRIGGER IF EXISTS events_event_fts_delete",
+    "DROP TRIGGER IF EXISTS events_event_fts_update",
+    "DROP TABLE IF EXISTS events_event_fts",
+]
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS events_event_name_trgm "
+    "ON events_event USING gin (UPPER(name::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS events_event_location_trgm "
+    "ON events_event USING gin (UPPER(location::text) gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS events_event_name_trgm",
+    "DROP INDEX IF EXISTS events_event_location_trgm",
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+    return operation
+
+
+create_search_index = run({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD})
+drop_search_index = run({"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRES_BACKWARD})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['location', 'start_time', 'id'], name='event_location_start_idx'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
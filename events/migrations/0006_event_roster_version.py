@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5
+
+import importlib
+from django.db import migrations, models
+
+
+# Adding a column rebuilds events_event on SQLite, which drops the search
+# triggers from 0004; rebuild the search index around the change.
+search = importlib.import_module("events.migrations.0004_event_search")
+
+
+def rebuild_search_index(apps, schema_editor):
+    search.drop_search_index(apps, schema_editor)
+    search.create_search_index(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_waitlistentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, rebuild_search_index),
+        migrations.AddField(
+            model_name='event',
+            name='roster_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(rebuild_search_index, migrations.RunPython.noop),
+    ]
@@ -12,8 +12,30 @@ class Event(models.Model):
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     max_capacity = models.PositiveIntegerField()
+    seats_taken = models.PositiveIntegerField(default=0, editable=False)
+    # Bumped when a registered attendee is renamed; part of the roster ETag.
+    roster_version = models.PositiveIntegerField(default=0, editable=False)
+
+    counters = ("seats_taken", "roster_version")
     
     
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_time", "id"], name="event_start_time_id_idx"),
+            models.Index(fields=["location", "start_time", "id"],
+                         name="event_location_start_idx"),
+        ]
+
+
+    def save(self, *args, **kwargs):
+        # The counters are only moved by conditional UPDATEs (events.utils);
+        # never write back a possibly stale in-memory copy.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counters]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f'{self.name} {self.location}'
     
@@ -28,7 +50,32 @@ class Registration(models.Model):
     class Meta:
         unique_together = ("event", "attendee")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["event", "created_at", "id"],
+                         name="registration_event_created_idx"),
+        ]
 
 
     def __str__(self):
         return f"{self.attendee.email} → {self.event.name}"
+
+
+class WaitlistEntry(models.Model):
+    """An attendee waiting for a seat on a full event, served in join order."""
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="waitlist")
+    attendee = models.ForeignKey(Attendees, on_delete=models.CASCADE, related_name="waitlist_entries")
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+
+    class Meta:
+        unique_together = ("event", "attendee")
+        ordering = ["created_at", "id"]
+        indexes = [
+            # The head of an event's queue is one index seek.
+            models.Index(fields=["event", "created_at", "id"],
+                         name="waitlist_event_created_idx"),
+        ]
+
+
+    def __str__(self):
+        return f"{self.attendee_id} waiting for {self.event_id}"
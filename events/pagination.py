@@ -0,0 +1,199 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a unique, ascending ``ordering`` tuple.
+
+    Each page is fetched with ``WHERE (a, b) > (last_a, last_b)`` instead of
+    an OFFSET, so page N costs the same as page 1. Cursors are opaque
+    base64 tokens holding the boundary row's ordering values and a direction.
+    """
+    ordering = ("id",)
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    # Cursor values must fit a 64-bit integer column.
+    max_cursor_int = 2 ** 63 - 1
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.page_queryset(queryset, request)
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async counterpart of ``paginate_queryset`` for async views.
+        """
+        queryset = self.page_queryset(queryset, request)
+        return self.set_page([row async for row in queryset])
+
+    def page_queryset(self, queryset, request):
+        """
+        Returns the (unevaluated) slice holding one page plus a lookahead row.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.position, self.reverse = self.decode_cursor(request)
+
+        if self.reverse:
+            queryset = queryset.order_by(*[f"-{field}" for field in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if self.position is not None:
+            try:
+                queryset = queryset.filter(self.seek_filter(self.position, self.reverse))
+            except (TypeError, ValueError, ValidationError):
+                # A tampered cursor whose values do not fit the ordering fields.
+                raise NotFound(self.invalid_cursor_message)
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, results):
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+
+        self.has_next = has_more if not self.reverse else True
+        self.has_previous = has_more if self.reverse else self.position is not None
+        return self.page
+
+    def get_query_params(self, request):
+        # Plain Django requests (async views) only have ``GET``.
+        return getattr(request, "query_params", request.GET)
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                size = int(self.get_query_params(request)[self.page_size_query_param])
+                if size > 0:
+                    return min(size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def seek_filter(self, position, reverse=False):
+        """
+        Builds the lexicographic ``(f1, f2, ...) > (v1, v2, ...)`` condition.
+        """
+        lookup = "lt" if reverse else "gt"
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            step = Q(**{f"{field}__{lookup}": position[index]})
+            for prev_field, prev_value in zip(self.ordering[:index], position):
+                step &= Q(**{prev_field: prev_value})
+            condition |= step
+        return condition
+
+    def get_position(self, instance):
+        if isinstance(instance, dict):
+            return [instance[field] for field in self.ordering]
+        return [getattr(instance, field) for field in self.ordering]
+
+    def encode_cursor(self, position, reverse=False):
+        values = [
+            {"dt": value.isoformat()} if isinstance(value, datetime) else value
+            for value in position
+        ]
+        payload = json.dumps({"p": values, "r": reverse}, separators=(",", ":"))
+        token = urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = self.get_query_params(request).get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            values = [
+                datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+                for value in payload["p"]
+            ]
+            reverse = bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if len(values) != len(self.ordering) or not all(map(self.valid_value, values)):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def valid_value(self, value):
+        if isinstance(value, int):
+            return abs(value) <= self.max_cursor_int
+        return isinstance(value, (str, datetime))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def get_paginated_data(self, data):
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque cursor returned in next/previous links.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class EventCursorPagination(KeysetPagination):
+    """
+    Upcoming events, ordered by ``(start_time, id)``.
+    """
+    ordering = ("start_time", "id")
+
+
+class AttendeeCursorPagination(KeysetPagination):
+    """
+    Attendees of one event, in registration order ``(created_at, id)``.
+    Expects the queryset to annotate ``registered_at`` and ``registration_id``.
+    """
+    ordering = ("registered_at", "registration_id")
@@ -0,0 +1,36 @@
+import json
+from django.conf import settings
+from rest_framework.parsers import BaseParser
+
+
+class InvalidLine:
+    """
+    Placeholder yielded for an NDJSON line that is not valid JSON, so the
+    caller can report it as a per-row error instead of failing the request.
+    """
+    def __init__(self, error):
+        self.error = error
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON lazily, one object per non-blank line.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return self._iter_lines(stream, encoding)
+
+    def _iter_lines(self, lines, encoding):
+        # Lines are decoded one by one, so a bad byte spoils only its own row.
+        for line in lines:
+            try:
+                line = line.decode(encoding).strip()
+                if line:
+                    yield json.loads(line)
+            except UnicodeDecodeError:
+                yield InvalidLine(f"Line is not valid {encoding} text.")
+            except ValueError as exc:
+                yield InvalidLine(f"JSON parse error - {exc}")
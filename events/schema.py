@@ -0,0 +1,204 @@
+"""
+OpenAPI annotations for the events API.
+
+They are attached to the views when this module is imported, which only
+happens through ``SchemaGenerator`` (``SPECTACULAR_SETTINGS``), so serving
+requests never loads drf-spectacular's schema machinery.
+"""
+from drf_spectacular.generators import SchemaGenerator as BaseSchemaGenerator
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema, extend_schema_view, inline_serializer, OpenApiParameter, OpenApiResponse)
+from rest_framework import serializers
+from attendees.serializers import AttendeeSerializer
+from . import views
+from .serializers import EventSerializer, EventRegisterSerializer, EventCancelSerializer
+
+
+class SchemaGenerator(BaseSchemaGenerator):
+    """
+    drf-spectacular's generator; referencing it from settings makes
+    spectacular import the annotations below before generating.
+    """
+
+
+extend_schema_view(get=extend_schema(parameters=[
+    OpenApiParameter(name="q", type=str,
+                     description="Full-text search over name and location (word prefixes)."),
+    OpenApiParameter(name="from", type=OpenApiTypes.DATETIME,
+                     description="Only events starting at or after this date/datetime."),
+    OpenApiParameter(name="to", type=OpenApiTypes.DATETIME,
+                     description="Only events starting at or before this date/datetime; "
+                                 "a bare date includes the whole day."),
+    OpenApiParameter(name="location", type=str, description="Exact location."),
+    OpenApiParameter(name="has_seats", type=bool,
+                     description="true: events with seats left; false: full events."),
+]))(views.EventListCreateView)
+
+extend_schema(
+    tags=["Events"],
+    parameters=[
+        OpenApiParameter(
+            name='Timezone',
+            location=OpenApiParameter.HEADER,
+            description='Client timezone (e.g., Asia/Kolkata, UTC, America/New_York). '
+                        'If provided, event times will be converted before returning.',
+            required=False,
+            type=str
+        )
+    ],
+    responses={
+        200: OpenApiResponse(
+            response=EventSerializer(many=True),
+            description="List of upcoming events."
+        ),
+        201: OpenApiResponse(
+            response=EventSerializer,
+            description="Event created successfully."
+        ),
+    }
+)(views.EventListCreateView)
+
+extend_schema(
+    tags=["Events"],
+    parameters=[
+        OpenApiParameter(
+            name='Timezone',
+            location=OpenApiParameter.HEADER,
+            description='Timezone used for datetimes without an offset.',
+            required=False,
+            type=str
+        )
+    ],
+    request={
+        "multipart/form-data": {
+            "type": "object",
+            "properties": {"file": {"type": "string", "format": "binary"}},
+        }
+    },
+    responses={
+        200: OpenApiResponse(
+            description="Number of events created and per-row errors."
+        ),
+        400: OpenApiResponse(
+            description="Missing or unsupported file."
+        ),
+    }
+)(views.EventImportView)
+
+extend_schema(
+    tags=["Event Registration"],
+    request=EventRegisterSerializer,
+    responses={
+        201: OpenApiResponse(
+            description="Attendee successfully registered for the event.",
+            response=inline_serializer(
+                "RegistrationMessage", {
+                    "message": serializers.CharField(),
+                    "cancel_token": serializers.CharField(),
+                })
+        ),
+        400: OpenApiResponse(
+            description="Validation error"
+        ),
+        404: OpenApiResponse(
+            description="Event not found."
+        ),
+        429: OpenApiResponse(
+            description="Too many attempts from this IP or for this email; see Retry-After."
+        )
+    }
+)(views.EventRegisteView)
+
+extend_schema(
+    tags=["Event Registration"],
+    request=EventRegisterSerializer,
+    responses={
+        201: OpenApiResponse(
+            description="Attendee joined the waitlist, or got a seat that had just freed up.",
+            response=inline_serializer("WaitlistStatus", {
+                "status": serializers.ChoiceField(["waitlisted", "registered"]),
+                "position": serializers.IntegerField(required=False),
+                "cancel_token": serializers.CharField(),
+            })
+        ),
+        400: OpenApiResponse(
+            description="Validation error, event not full, or already registered/waitlisted."
+        ),
+        404: OpenApiResponse(
+            description="Event not found."
+        )
+    }
+)(views.EventWaitlistView)
+
+extend_schema(
+    tags=["Event Registration"],
+    request=EventCancelSerializer,
+    responses={
+        200: OpenApiResponse(
+            description="Registration cancelled (the seat goes to the waitlist), "
+                        "or attendee removed from the waitlist.",
+            response=inline_serializer(
+                "CancellationMessage", {"message": serializers.CharField()})
+        ),
+        400: OpenApiResponse(
+            description="Attendee is neither registered nor waitlisted."
+        ),
+        403: OpenApiResponse(
+            description="Missing or wrong cancellation token."
+        ),
+        404: OpenApiResponse(
+            description="Event not found."
+        )
+    }
+)(views.EventCancelRegistrationView)
+
+extend_schema(
+    tags=["Event Registration"],
+    request=EventRegisterSerializer(many=True),
+    responses={
+        200: OpenApiResponse(
+            description="Per-row registration status, in request order. "
+                        "Each row is registered, duplicate, full or invalid."
+        ),
+        400: OpenApiResponse(
+            description="Request body is not a list of attendees."
+        ),
+        404: OpenApiResponse(
+            description="Event not found."
+        )
+    }
+)(views.EventBulkRegisterView)
+
+extend_schema(
+    tags=["Event Attendees"],
+    responses={
+        200: OpenApiResponse(
+            response=AttendeeSerializer(many=True),
+            description="List of attendees registered for the given event."
+        ),
+        304: OpenApiResponse(
+            description="Roster unchanged since the ETag sent in If-None-Match."
+        ),
+        404: OpenApiResponse(
+            description="Event not found."
+        )
+    }
+)(views.EventAttendeesListView)
+
+extend_schema(
+    tags=["Event Attendees"],
+    responses={
+        (200, "text/csv"): OpenApiResponse(
+            response=OpenApiTypes.STR,
+            description="Full attendee roster, streamed in registration order."
+        ),
+        (200, "application/x-ndjson"): OpenApiResponse(
+            response=OpenApiTypes.STR,
+            description="Full attendee roster, streamed in registration order."
+        ),
+        404: OpenApiResponse(
+            description="Event not found."
+        )
+    }
+)(views.EventAttendeesExportView)
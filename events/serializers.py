@@ -1,21 +1,108 @@
 from rest_framework import serializers
 from .models import Event
 from datetime import datetime, timezone as dt_timezone
+from django.db.models import Manager, QuerySet
 from django.utils import timezone
+from operator import attrgetter, itemgetter
+from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 from .utils import register_attendee
 import re
 
 
+LOCAL_DATETIME_FORMAT = "%d/%m/%Y %I:%M %p"
+
+
+class EventListSerializer(serializers.ListSerializer):
+    """
+    Read-only fast path for lists of events.
+
+    Rows are read as plain tuples (``.values_list()`` for querysets, or
+    attribute/key lookups for instances and ``.values()`` dicts) instead of
+    going through ``EventSerializer.to_representation`` per instance, and
+    each distinct timestamp is localized once per batch. Output is identical
+    to serializing every instance on its own.
+    """
+
+    def value_fields(self):
+        """
+        Model attributes needed to render a row, for ``.values()``.
+        """
+        sources = []
+        for field in self.child._readable_fields:
+            if field.source != "*" and field.source not in sources:
+                sources.append(field.source)
+        return sources
+
+    def to_representation(self, data):
+        if isinstance(data, Manager):
+            data = data.all()
+        fields = list(self.child._readable_fields)
+        sources = self.value_fields()
+
+        if isinstance(data, QuerySet):
+            rows = data.values_list(*sources)
+        else:
+            rows = list(data)
+            if rows:
+                getter = itemgetter if isinstance(rows[0], dict) else attrgetter
+                get_row = getter(*sources)
+                rows = [get_row(row) for row in rows]
+            if len(sources) == 1:
+                rows = [(row,) for row in rows]
+
+        tz = timezone.get_current_timezone()
+        local_times = {}
+
+        def local_time(value):
+            if value not in local_times:
+                local_times[value] = value.astimezone(tz).strftime(LOCAL_DATETIME_FORMAT)
+            return local_times[value]
+
+        # Whole-object fields (e.g. SerializerMethodField) get a stand-in
+        # built from the row, so they may only read attributes that other
+        # fields already fetch.
+        whole_row = [field.source == "*" for field in fields]
+        positions = [None if whole else sources.index(field.source)
+                     for field, whole in zip(fields, whole_row)]
+        converters = []
+        for field in fields:
+            if field.field_name in self.child.local_datetime_fields:
+                converters.append(local_time)
+            else:
+                converters.append(field.to_representation)
+
+        names = [field.field_name for field in fields]
+        columns = list(zip(names, converters, positions))
+        needs_instance = any(whole_row)
+        results = []
+        for row in rows:
+            instance = SimpleNamespace(**dict(zip(sources, row))) if needs_instance else None
+            results.append({
+                name: convert(instance) if index is None
+                else None if row[index] is None else convert(row[index])
+                for name, convert, index in columns
+            })
+        return results
+
+
 class EventSerializer(serializers.ModelSerializer):
     """
     Serializer for the Event model.
     """
-    
+    local_datetime_fields = ("start_time", "end_time")
+    registered_count = serializers.IntegerField(source="seats_taken", read_only=True)
+    seats_remaining = serializers.SerializerMethodField()
+
     class Meta:
         model = Event
-        fields = "__all__"
+        exclude = ("seats_taken", "roster_version")
+        list_serializer_class = EventListSerializer
         
+    def get_seats_remaining(self, event) -> int:
+        # Read from the maintained Event.seats_taken counter, never a COUNT().
+        return max(event.max_capacity - event.seats_taken, 0)
+
     def validate(self, data):
         if data['end_time'] <= data['start_time']:
             raise serializers.ValidationError("End time must be after start time.")
@@ -24,11 +111,11 @@ class EventSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         data = super().to_representation(instance)
 
-        for field in ["start_time", "end_time"]:
+        for field in self.local_datetime_fields:
             value = getattr(instance, field, None)
             if value:
                 local_value = timezone.localtime(value)
-                data[field] = local_value.strftime("%d/%m/%Y %I:%M %p")
+                data[field] = local_value.strftime(LOCAL_DATETIME_FORMAT)
 
         return data
         
@@ -69,4 +156,12 @@ class EventRegisterSerializer(serializers.Serializer):
             event_id=self.context["event_id"],
             name=validated_data["name"],
             email=validated_data["email"],
-        )
\ No newline at end of file
+        )
+
+
+class EventCancelSerializer(serializers.Serializer):
+    """
+    Serializer for cancelling a registration or leaving the waitlist.
+    """
+    email = serializers.EmailField()
+    token = serializers.CharField(help_text="cancel_token from the registration response.")
\ No newline at end of file
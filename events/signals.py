@@ -0,0 +1,46 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import upcoming_events_cache
+from .live import publish_on_commit
+from .models import Event, Registration
+from .soldout import sold_out_events
+from .utils import release_seats
+from .waitlist import promote_waitlist
+
+
+@receiver(post_delete, sender=Registration)
+def release_seat_on_registration_delete(sender, instance, origin=None, **kwargs):
+    """
+    Keeps ``Event.seats_taken`` in step with deleted registrations, however
+    they were deleted, and gives the freed seat to the waitlist first.
+    Registrations cascading from a deleted event are skipped: the counter
+    and waitlist go with the event.
+    """
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if issubclass(model, Event):
+        return
+    release_seats(instance.event_id)
+    sold_out_events.clear_on_commit(instance.event_id)
+    promote_waitlist(instance.event_id, limit=1)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_upcoming_events(sender, **kwargs):
+    """
+    Drops cached event lists.
+    """
+    upcoming_events_cache.invalidate()
+
+
+@receiver(post_save, sender=Event)
+def clear_sold_out_on_event_save(sender, instance, created, **kwargs):
+    """
+    A saved event may have gained capacity; let the database decide again,
+    and give any new seats to the waitlist first.
+    """
+    if not created:
+        sold_out_events.clear_on_commit(instance.id)
+        promote_waitlist(instance.id)
+        publish_on_commit(instance.id)
@@ -0,0 +1,76 @@
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class SoldOutRegistry:
+    """
+    Remembers which events are full so late registrations can be rejected
+    without opening a transaction.
+
+    A marker lives in two places: a per-process dict, checked on every
+    request, and a key in the shared cache. The local entry is trusted for
+    ``SOLD_OUT_LOCAL_TTL`` seconds and then re-validated against the shared
+    key, which is how a clear made by another worker reaches this one. The
+    shared key itself expires after ``SOLD_OUT_TIMEOUT`` seconds, so a worker
+    that missed a clear (e.g. with a per-process cache backend) falls back
+    to the database soon after.
+    """
+    key_prefix = "events:soldout"
+
+    def __init__(self, alias=None):
+        self._alias = alias
+        self._local = {}
+
+    @property
+    def cache(self):
+        return caches[self._alias or getattr(settings, "EVENTS_CACHE_ALIAS", "default")]
+
+    @property
+    def local_ttl(self):
+        return getattr(settings, "SOLD_OUT_LOCAL_TTL", 1.0)
+
+    @property
+    def timeout(self):
+        return getattr(settings, "SOLD_OUT_TIMEOUT", 30)
+
+    def key(self, event_id):
+        return f"{self.key_prefix}:{event_id}"
+
+    def is_sold_out(self, event_id) -> bool:
+        expires = self._local.get(event_id)
+        if expires is None:
+            return False
+        if expires > time.monotonic():
+            return True
+        if self.cache.get(self.key(event_id)):
+            self._local[event_id] = time.monotonic() + self.local_ttl
+            return True
+        self._local.pop(event_id, None)
+        return False
+
+    def mark(self, event_id) -> None:
+        self._local[event_id] = time.monotonic() + self.local_ttl
+        self.cache.set(self.key(event_id), 1, self.timeout)
+
+    def clear(self, event_id) -> None:
+        self._local.pop(event_id, None)
+        self.cache.delete(self.key(event_id))
+
+    def clear_on_commit(self, event_id) -> None:
+        """
+        Clears the marker once the current transaction commits. Cleared any
+        earlier, a registration that still sees the old seat count could
+        mark the event full again while the freed seat is on its way.
+        """
+        transaction.on_commit(lambda: self.clear(event_id))
+
+    def reset(self) -> None:
+        """
+        Forgets every local marker (shared keys are left to expire).
+        """
+        self._local.clear()
+
+
+sold_out_events = SoldOutRegistry()
@@ -0,0 +1,35 @@
+import sqlite3
+import threading
+from django.conf import settings
+
+
+class SQLiteStore:
+    """
+    Base for small key-value stores kept in a SQLite file shared by every
+    worker process on the host. The path comes from the ``setting`` named
+    by the subclass unless one is passed in; ``schema`` holds the statements
+    creating its tables. Each thread keeps its own connection, in WAL mode
+    with ``synchronous=OFF``: the data is worth little after a crash.
+    """
+    setting = None
+    schema = ()
+
+    def __init__(self, path=None):
+        self._path = path
+        self._local = threading.local()
+
+    @property
+    def path(self):
+        return self._path or str(getattr(settings, self.setting))
+
+    @property
+    def connection(self):
+        path = self.path
+        if getattr(self._local, "path", None) != path:
+            connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            for statement in self.schema:
+                connection.execute(statement)
+            self._local.connection, self._local.path = connection, path
+        return self._local.connection
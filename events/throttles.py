@@ -0,0 +1,130 @@
+import time
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+from .sqlite_store import SQLiteStore
+
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """
+    ``"10/min"`` -> ``(10, 60)``; ``None``, ``""`` or ``"off"`` -> ``None``.
+    """
+    if not rate or rate == "off":
+        return None
+    num, period = rate.split("/")
+    return int(num), PERIODS[period[0]]
+
+
+class TokenBucketStore(SQLiteStore):
+    """
+    Token buckets in a SQLite file, shared by every worker process on the
+    host (``RATE_LIMIT_DB``).
+
+    Refilling, checking and taking a token is one ``INSERT ... ON CONFLICT
+    DO UPDATE ... RETURNING`` statement, so concurrent workers cannot both
+    spend the last token. Each bucket records when it will be full again;
+    every ``prune_every`` takes, full buckets are deleted, since a missing
+    bucket starts out full anyway. This keeps the file to the clients seen
+    within the last period.
+    """
+    setting = "RATE_LIMIT_DB"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS token_buckets ("
+        "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, "
+        "full_at REAL NOT NULL, allowed INTEGER NOT NULL) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS token_buckets_full_at ON token_buckets (full_at)",
+    )
+    refill = "min(:capacity, tokens + (:now - updated) * :rate)"
+    left = f"{refill} - ({refill} >= 1)"
+    sql = f"""
+        INSERT INTO token_buckets (key, tokens, updated, full_at, allowed)
+        VALUES (:key, :capacity - 1, :now, :now + 1 / :rate, 1)
+        ON CONFLICT (key) DO UPDATE SET
+            allowed = {refill} >= 1,
+            tokens = {left},
+            updated = :now,
+            full_at = :now + (:capacity - ({left})) / :rate
+        RETURNING allowed, tokens
+    """
+
+    def __init__(self, path=None, prune_every=1000):
+        super().__init__(path)
+        self.prune_every = prune_every
+        self._takes = 0
+
+    def take(self, key, capacity, period):
+        """
+        Takes a token from ``key``'s bucket (``capacity`` tokens, refilled
+        over ``period`` seconds). Returns ``(allowed, retry_after_seconds)``.
+        """
+        rate = capacity / period
+        now = time.time()
+        self._takes += 1
+        if self._takes % self.prune_every == 0:
+            self.prune(now)
+        allowed, tokens = self.connection.execute(self.sql, {
+            "key": key, "capacity": capacity, "rate": rate, "now": now,
+        }).fetchone()
+        return bool(allowed), 0 if allowed else (1 - tokens) / rate
+
+    def prune(self, now=None):
+        self.connection.execute(
+            "DELETE FROM token_buckets WHERE full_at <= ?", (now or time.time(),))
+
+    def reset(self):
+        self.connection.execute("DELETE FROM token_buckets")
+
+
+registration_buckets = TokenBucketStore()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    DRF throttle backed by ``TokenBucketStore``. The rate comes from
+    ``DEFAULT_THROTTLE_RATES[scope]``; a burst of up to the full rate is
+    allowed, then requests are spaced evenly over the period.
+    """
+    scope = None
+    store = registration_buckets
+
+    def __init__(self):
+        self.rate = parse_rate(api_settings.DEFAULT_THROTTLE_RATES.get(self.scope))
+        self.retry_after = None
+
+    def get_key(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_key(request, view)
+        if key is None:
+            return True
+        allowed, self.retry_after = self.store.take(f"{self.scope}:{key}", *self.rate)
+        return allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+class RegistrationIPThrottle(TokenBucketThrottle):
+    scope = "registration_ip"
+
+    def get_key(self, request, view):
+        return self.get_ident(request)
+
+
+class RegistrationEmailThrottle(TokenBucketThrottle):
+    """
+    Limits attempts per email, whichever IPs they come from. Runs before
+    the serializer, so the address is only normalized, not validated.
+    """
+    scope = "registration_email"
+
+    def get_key(self, request, view):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return email.strip().lower()
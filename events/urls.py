@@ -4,6 +4,14 @@ from .views import *
 
 urlpatterns = [
     path('', EventListCreateView.as_view(), name='event-list-create'),
+    path('import', EventImportView.as_view(), name='event-import'),
     path('<int:event_id>/register', EventRegisteView.as_view(), name='register-attendees'),
-    path('<int:event_id>/attendees', EventAttendeesListView.as_view(), name='event-attendees')
+    path('<int:event_id>/register/bulk', EventBulkRegisterView.as_view(), name='bulk-register-attendees'),
+    path('<int:event_id>/waitlist', EventWaitlistView.as_view(), name='event-waitlist'),
+    path('<int:event_id>/cancel', EventCancelRegistrationView.as_view(), name='cancel-registration'),
+    path('<int:event_id>/attendees', EventAttendeesListView.as_view(), name='event-attendees'),
+    path('<int:event_id>/attendees.csv', EventAttendeesExportView.as_view(),
+         {'export_format': 'csv'}, name='event-attendees-csv'),
+    path('<int:event_id>/attendees.ndjson', EventAttendeesExportView.as_view(),
+         {'export_format': 'ndjson'}, name='event-attendees-ndjson'),
 ]
\ No newline at end of file
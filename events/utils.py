@@ -1,7 +1,182 @@
-from django.db import transaction
+import hashlib
+from itertools import islice
+from django.conf import settings
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError, NotFound
+from .live import publish_on_commit
 from .models import Event, Registration
+from .soldout import sold_out_events
 from attendees.models import Attendees
+from event_manager.metrics import record_registration
+
+
+def upcoming_events():
+    """
+    Events that have not started yet, soonest first.
+    """
+    return Event.objects.filter(
+        start_time__gte=timezone.now()).order_by("start_time")
+
+
+def event_attendees(event_id: int):
+    """
+    Attendees registered for an event, annotated with the registration's
+    ``registered_at`` and ``registration_id`` for keyset pagination.
+    """
+    # (event, attendee) is unique, so the join yields one row per attendee.
+    return Attendees.objects.filter(
+        registrations__event_id=event_id).annotate(
+            registered_at=F("registrations__created_at"),
+            registration_id=F("registrations__id"))
+
+
+def roster_version_query(event_id: int):
+    """
+    Cheap fingerprint of an event's roster: the ``seats_taken`` counter,
+    the ``roster_version`` bumped by attendee renames, and the id of the
+    newest registration, read in one query (an index seek on (event,
+    created_at, id)). Registrations are only ever added as the newest row,
+    so any addition or removal changes it.
+    """
+    newest = Registration.objects.filter(
+        event_id=OuterRef("pk")).order_by("-created_at", "-id").values("id")[:1]
+    return Event.objects.filter(id=event_id).annotate(
+        newest=Subquery(newest)).values_list("seats_taken", "roster_version", "newest")
+
+
+def roster_etag(version, path: str) -> str:
+    """
+    Weak ETag for one roster page, from ``roster_version_query``'s row and
+    the request path with its query string (cursor, page size).
+    """
+    if version is None:
+        raise NotFound(detail="Event not found")
+    key = "%s-%s-%s:%s" % (*version, path)
+    return 'W/"%s"' % hashlib.md5(key.encode()).hexdigest()
+
+
+def seats_changed(event_id: int = None) -> None:
+    """
+    Tells live streams about new seat counts; ``None`` means any event.
+    Cached lists read the counts afresh on every hit, so they are left alone.
+    """
+    publish_on_commit(event_id)
+
+
+def claim_seat(event_id: int) -> bool:
+    """
+    Atomically takes one seat on the event.
+
+    Issues a single conditional
+    ``UPDATE ... SET seats_taken = seats_taken + 1 WHERE seats_taken < max_capacity``
+    so the database, not the application, decides whether the event is full.
+    Returns False when no seat was left.
+    """
+    updated = Event.objects.filter(
+        id=event_id, seats_taken__lt=F("max_capacity")
+    ).update(seats_taken=F("seats_taken") + 1)
+    if updated:
+        seats_changed(event_id)
+    return updated == 1
+
+
+def claim_seats(event_id: int, count: int) -> int:
+    """
+    Takes up to ``count`` seats in one go and returns how many were claimed.
+
+    The event row is updated with a compare-and-swap on ``seats_taken``,
+    retried only if another writer changed the counter in between.
+    """
+    while True:
+        row = Event.objects.filter(id=event_id).values_list(
+            "seats_taken", "max_capacity").first()
+        if row is None:
+            raise NotFound(detail="Event not found")
+        taken, capacity = row
+        claimed = min(count, capacity - taken)
+        if claimed <= 0:
+            return 0
+        if Event.objects.filter(id=event_id, seats_taken=taken).update(
+                seats_taken=taken + claimed):
+            seats_changed(event_id)
+            return claimed
+
+
+def release_seats(event_id: int, count: int = 1) -> None:
+    """
+    Gives ``count`` seats back to the event, never going below zero.
+    """
+    if Event.objects.filter(id=event_id, seats_taken__gte=count).update(
+            seats_taken=F("seats_taken") - count):
+        seats_changed(event_id)
+
+
+def rebuild_seats_taken(queryset=None) -> int:
+    """
+    Recomputes ``Event.seats_taken`` from the ``Registration`` table.
+    Returns the number of events updated.
+    """
+    if queryset is None:
+        queryset = Event.objects.all()
+    counts = (
+        Registration.objects.filter(event=OuterRef("pk"))
+        .order_by()
+        .values("event")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    updated = queryset.update(seats_taken=Coalesce(Subquery(counts), 0))
+    seats_changed()
+    return updated
+
+
+def upsert_attendees(names: dict, rename: bool = True) -> dict:
+    """
+    Inserts attendees or, for known emails, updates their names, in a
+    single ``INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING``.
+    ``names`` maps lowercased email to name; returns ``{email: id}``. With
+    ``rename=False`` known attendees keep their names.
+
+    A name that actually changed stamps ``renamed_at`` in the same
+    statement, and the events those attendees are registered for get a new
+    ``roster_version``, so cached rosters (ETags) are not served stale.
+    """
+    now = timezone.now()
+    connection = connections[router.db_for_write(Attendees)]
+    table = connection.ops.quote_name(Attendees._meta.db_table)
+    rows = ", ".join(["(%s, %s)"] * len(names))
+    params = [value for pair in names.items() for value in pair]
+    if rename:
+        update = (f"name = excluded.name, renamed_at = CASE WHEN {table}.name <> "
+                  f"excluded.name THEN %s ELSE {table}.renamed_at END")
+        params.append(now)
+    else:
+        # A no-op update, so RETURNING still yields the existing rows.
+        update = f"name = {table}.name"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (email, name) VALUES {rows} "
+            f"ON CONFLICT (email) DO UPDATE SET {update} "
+            f"RETURNING id, email, renamed_at = %s",
+            params + [now])
+        returned = cursor.fetchall()
+    renamed = [attendee_id for attendee_id, _, changed in returned if changed]
+    if renamed:
+        Event.objects.filter(registrations__attendee_id__in=renamed).update(
+            roster_version=F("roster_version") + 1)
+    return {email: attendee_id for attendee_id, email, _ in returned}
+
+
+def upsert_attendee(name: str, email: str) -> Attendees:
+    """
+    ``upsert_attendees`` for one attendee.
+    """
+    email = email.lower()
+    attendee_id, = upsert_attendees({email: name}).values()
+    return Attendees(id=attendee_id, email=email, name=name)
 
 
 @transaction.atomic
@@ -10,24 +185,150 @@ def register_attendee(event_id: int, name: str, email: str) -> Registration:
     Creates a registration ensuring:
     - No duplicates for (event, attendee)
     - No overbooking beyond max_capacity
-    Uses SELECT ... FOR UPDATE to avoid race conditions under concurrency.
+    The happy path is three statements: claim a seat with a conditional
+    UPDATE on ``Event.seats_taken``, upsert the attendee on email, and insert
+    the registration, relying on the (event, attendee) unique constraint to
+    detect duplicates. Any failure rolls the seat claim back. A waitlist
+    entry the attendee still holds is left alone: promotion skips attendees
+    who are registered, and cancelling removes it.
     """
+    if not claim_seat(event_id):
+        if not Event.objects.filter(id=event_id).exists():
+            record_registration("not_found")
+            raise NotFound(detail="Event not found")
+        if Registration.objects.filter(
+                event_id=event_id, attendee__email=email.lower()).exists():
+            record_registration("duplicate")
+            raise ValidationError("Attendee already registered for this event.")
+        sold_out_events.mark(event_id)
+        record_registration("full")
+        raise ValidationError("Event is already full.")
+
+
+    attendee = upsert_attendee(name, email)
+
+
     try:
-        event = Event.objects.get(id=event_id)
-    except Event.DoesNotExist:
+        registration = Registration.objects.create(event_id=event_id, attendee=attendee)
+    except IntegrityError:
+        record_registration("duplicate")
+        raise ValidationError("Attendee already registered for this event.")
+    record_registration("success")
+    return registration
+
+
+def bulk_register_attendees(event_id: int, rows, batch_size: int = None) -> list:
+    """
+    Registers many attendees for one event and returns a status per row.
+
+    Rows are validated with ``EventRegisterSerializer``, attendees are upserted
+    by email and registrations inserted with ``bulk_create``. Capacity is
+    claimed once per batch, so the cost per row stays constant.
+    Each result is ``{"index", "email", "status"}`` where status is one of
+    ``registered``, ``duplicate``, ``full`` or ``invalid`` (with ``errors``).
+    """
+    from .serializers import EventRegisterSerializer
+    from .parsers import InvalidLine
+
+    if not Event.objects.filter(id=event_id).exists():
         raise NotFound(detail="Event not found")
 
+    batch_size = batch_size or getattr(
+        settings, "BULK_REGISTRATION_BATCH_SIZE", 1000)
+    results = []
+    seen_emails = set()
+    rows = enumerate(rows)
 
-    attendee, _ = Attendees.objects.get_or_create(email=email.lower(), name=name)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
 
+        pending = []
+        for index, row in batch:
+            if isinstance(row, InvalidLine):
+                results.append({"index": index, "email": None,
+                                "status": "invalid", "errors": [row.error]})
+                continue
+            serializer = EventRegisterSerializer(data=row)
+            if not serializer.is_valid():
+                email = row.get("email") if isinstance(row, dict) else None
+                results.append({"index": index, "email": email,
+                                "status": "invalid", "errors": serializer.errors})
+                continue
+            email = serializer.validated_data["email"].lower()
+            result = {"index": index, "email": email, "status": "duplicate"}
+            results.append(result)
+            if email in seen_emails:
+                continue
+            seen_emails.add(email)
+            pending.append((result, serializer.validated_data["name"]))
 
-    if Registration.objects.filter(event=event, attendee=attendee).exists():
-        raise ValidationError("Attendee already registered for this event.")
+        if pending:
+            _register_batch(event_id, pending)
 
+    return results
 
-    current = Registration.objects.filter(event=event).count()
-    if current >= event.max_capacity:
-        raise ValidationError("Event is already full.")
 
+@transaction.atomic
+def _register_batch(event_id: int, pending: list) -> None:
+    """
+    Writes one batch of validated rows; ``pending`` holds
+    ``(result, name)`` pairs whose result status is updated in place.
+    Known attendees are only renamed if they get registered.
+    """
+    attendee_ids = upsert_attendees(
+        {result["email"]: name for result, name in pending}, rename=False)
+    registered = set(
+        Registration.objects.filter(
+            event_id=event_id, attendee_id__in=attendee_ids.values()
+        ).values_list("attendee_id", flat=True))
+
+    new = [(result, name) for result, name in pending
+           if attendee_ids[result["email"]] not in registered]
+    claimed = claim_seats(event_id, len(new)) if new else 0
+    if claimed < len(new):
+        sold_out_events.mark(event_id)
+
+    for result, _ in new[claimed:]:
+        result["status"] = "full"
+    taken = _insert_registrations(
+        event_id, [attendee_ids[result["email"]] for result, _ in new[:claimed]])
+    if taken:
+        # Registered by a concurrent request since the check above.
+        release_seats(event_id, len(taken))
+        sold_out_events.clear_on_commit(event_id)
+    accepted = [(result, name) for result, name in new[:claimed]
+                if attendee_ids[result["email"]] not in taken]
+    for result, _ in accepted:
+        result["status"] = "registered"
+
+    if accepted:
+        upsert_attendees({result["email"]: name for result, name in accepted})
+    record_registration("success", len(accepted))
+    record_registration("full", len(new) - claimed)
+    record_registration("duplicate", len(pending) - len(accepted) - (len(new) - claimed))
 
-    return Registration.objects.create(event=event, attendee=attendee)
+
+def _insert_registrations(event_id: int, attendee_ids: list) -> set:
+    """
+    Inserts registrations for ``attendee_ids`` and returns the ones that
+    already existed. The batch insert runs in a savepoint; only when it
+    hits the (event, attendee) constraint is each row retried on its own.
+    """
+    try:
+        with transaction.atomic():
+            Registration.objects.bulk_create([
+                Registration(event_id=event_id, attendee_id=attendee_id)
+                for attendee_id in attendee_ids])
+        return set()
+    except IntegrityError:
+        pass
+    taken = set()
+    for attendee_id in attendee_ids:
+        try:
+            with transaction.atomic():
+                Registration.objects.create(event_id=event_id, attendee_id=attendee_id)
+        except IntegrityError:
+            taken.add(attendee_id)
+    return taken
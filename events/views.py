@@ -1,115 +1,212 @@
+from collections.abc import Iterator
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import JSONParser, MultiPartParser
 from .models import Event
-from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
-from attendees.models import Attendees
 from django.utils import timezone
-from .serializers import EventSerializer, EventRegisterSerializer
+from .cache import seats_query, upcoming_events_cache, with_seats
+from .pagination import EventCursorPagination, AttendeeCursorPagination
+from .serializers import EventSerializer, EventRegisterSerializer, EventCancelSerializer
 from attendees.serializers import AttendeeSerializer
-from .utils import register_attendee
-
-
-@extend_schema(
-    tags=["Events"],
-    parameters=[
-        OpenApiParameter(
-            name='Timezone',
-            location=OpenApiParameter.HEADER,
-            description='Client timezone (e.g., Asia/Kolkata, UTC, America/New_York). '
-                        'If provided, event times will be converted before returning.',
-            required=False,
-            type=str
-        )
-    ],
-    responses={
-        200: OpenApiResponse(
-            response=EventSerializer(many=True),
-            description="List of upcoming events."
-        ),
-        201: OpenApiResponse(
-            response=EventSerializer,
-            description="Event created successfully."
-        ),
-    }
-)
+from .exports import (
+    EXPORT_FORMATS, ExportContentNegotiation, aattendee_rows, astream_export,
+    attendee_rows, stream_export)
+from .filters import filter_events
+from .idempotency import idempotent
+from .imports import detect_format, import_events, read_rows
+from .parsers import NDJSONParser
+from .soldout import sold_out_events
+from .throttles import RegistrationEmailThrottle, RegistrationIPThrottle
+from .waitlist import cancel_registration, cancel_token, join_waitlist
+from event_manager.metrics import record_registration
+from event_manager.routers import is_pinned, reading_from_replica, replica_reads
+from .utils import (
+    bulk_register_attendees, upcoming_events, event_attendees, roster_version_query,
+    roster_etag)
+
+
+@method_decorator(replica_reads, name="get")
+@method_decorator(idempotent, name="dispatch")
 class EventListCreateView(generics.ListCreateAPIView):
     """
     API endpoint for listing and creating events.
     """
     serializer_class = EventSerializer
-    pagination_class = None
+    pagination_class = EventCursorPagination
     def get_queryset(self):
         if self.request.method == 'GET':
-             return Event.objects.filter(
-               start_time__gte=timezone.now()).order_by('start_time')
+             # Plain rows feed EventListSerializer's fast path.
+             return filter_events(upcoming_events(), self.request.query_params).values(
+                 *self.get_serializer(many=True).value_fields())
         return Event.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        if is_pinned(request) or not upcoming_events_cache.cacheable(request):
+            # Recent writers read the primary, and seat filters change on every
+            # registration; keep those pages out of the cache.
+            return super().list(request, *args, **kwargs)
+        key = upcoming_events_cache.key(request)
+        data = upcoming_events_cache.get(key)
+        if data is not None:
+            data = with_seats(data, dict(seats_query(data)))
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        # A page read from a lagging replica would stay cached for the whole
+        # timeout; misses read the primary.
+        with reading_from_replica(False):
+            response = super().list(request, *args, **kwargs)
+        page = getattr(self.paginator, "page", None)
+        upcoming_events_cache.set(
+            key, response.data,
+            expires_at=page[0]["start_time"] if page else None)
+        response["X-Cache"] = "MISS"
+        return response
     
 
-@extend_schema(
-    tags=["Event Registration"],
-    request=EventRegisterSerializer,
-    responses={
-        201: OpenApiResponse(
-            description="Attendee successfully registered for the event.",
-            response={
-                "message": "Registration successful"
-            }
-        ),
-        400: OpenApiResponse(
-            description="Validation error"
-        ),
-        404: OpenApiResponse(
-            description="Event not found."
-        )
-    }
-)
+class EventImportView(generics.GenericAPIView):
+    """
+    API endpoint to **bulk import events** from an uploaded CSV, JSON or
+    NDJSON file. Rows are validated like ``POST /events/`` and inserted in
+    batches; invalid rows are reported without stopping the import.
+    """
+    serializer_class = EventSerializer
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": ["No file was submitted."]})
+        rows = read_rows(upload, detect_format(upload.name))
+        return Response(import_events(rows), status=status.HTTP_200_OK)
+
+
+@method_decorator(idempotent, name="dispatch")
 class EventRegisteView(generics.GenericAPIView):
     """
     API endpoint to **register an attendee for an event**.
     """
     serializer_class = EventRegisterSerializer
+    throttle_classes = [RegistrationIPThrottle, RegistrationEmailThrottle]
     
     def post(self, request, event_id):
+        if sold_out_events.is_sold_out(event_id):
+            record_registration("full")
+            raise ValidationError("Event is already full.")
         serializer = self.get_serializer(
             data=request.data,
             context={"event_id": event_id})
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(
-            {"message": "Registration successful"},
+            {"message": "Registration successful",
+             "cancel_token": cancel_token(event_id, serializer.validated_data["email"])},
             status=status.HTTP_201_CREATED)
         
 
-@extend_schema(
-    tags=["Event Attendees"],
-    responses={
-        200: OpenApiResponse(
-            response=AttendeeSerializer(many=True),
-            description="List of attendees registered for the given event."
-        ),
-        404: OpenApiResponse(
-            description="Event not found."
-        )
+class EventWaitlistView(generics.GenericAPIView):
+    """
+    API endpoint to **join the waitlist of a full event**. Waitlisted
+    attendees are registered in join order as seats free up, so there is
+    no need to retry registration.
+    """
+    serializer_class = EventRegisterSerializer
+
+    def post(self, request, event_id):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        email = serializer.validated_data["email"]
+        result = join_waitlist(event_id, name=serializer.validated_data["name"], email=email)
+        result["cancel_token"] = cancel_token(event_id, email)
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
+class EventCancelRegistrationView(generics.GenericAPIView):
+    """
+    API endpoint to **cancel a registration**. Requires the ``cancel_token``
+    returned on registration. The freed seat is given to the next
+    waitlisted attendee in the same transaction.
+    """
+    serializer_class = EventCancelSerializer
+    messages = {
+        "cancelled": "Registration cancelled",
+        "left_waitlist": "Removed from waitlist",
     }
-)
+
+    def post(self, request, event_id):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        outcome = cancel_registration(
+            event_id, serializer.validated_data["email"], serializer.validated_data["token"])
+        return Response({"message": self.messages[outcome]}, status=status.HTTP_200_OK)
+
+
+class EventBulkRegisterView(generics.GenericAPIView):
+    """
+    API endpoint to **register many attendees for an event** in one request.
+    Accepts a JSON array or an NDJSON stream (``application/x-ndjson``).
+    """
+    serializer_class = EventRegisterSerializer
+    parser_classes = [JSONParser, NDJSONParser]
+
+    def post(self, request, event_id):
+        rows = request.data
+        if not isinstance(rows, (list, Iterator)):
+            raise ValidationError("Expected a list of attendees.")
+        results = bulk_register_attendees(event_id, rows)
+        summary = {}
+        for result in results:
+            summary[result["status"]] = summary.get(result["status"], 0) + 1
+            if result["status"] == "registered":
+                result["cancel_token"] = cancel_token(event_id, result["email"])
+        return Response(
+            {"summary": summary, "results": results},
+            status=status.HTTP_200_OK)
+        
+
+def attendees_etag(request, event_id):
+    return roster_etag(roster_version_query(event_id).first(), request.get_full_path())
+
+
+@method_decorator(replica_reads, name="get")
+@method_decorator(condition(etag_func=attendees_etag), name="get")
 class EventAttendeesListView(generics.ListAPIView):
     """
     API endpoint to **list all attendees for a given event**.
+    Responses carry an ETag; polling with ``If-None-Match`` gets a 304
+    without the roster being queried while nothing has changed.
     """
     serializer_class = AttendeeSerializer
-    
+    pagination_class = AttendeeCursorPagination
+
     def get_queryset(self):
-        event_id = self.kwargs["event_id"]
-        try:
-            event = Event.objects.get(id=event_id)
-        except Event.DoesNotExist:
+        # roster_etag() has already checked that the event exists.
+        return event_attendees(self.kwargs["event_id"])
+
+
+class EventAttendeesExportView(generics.GenericAPIView):
+    """
+    API endpoint to **export every attendee of an event** as CSV or NDJSON.
+    The roster is streamed, so memory use does not grow with event size;
+    under ASGI it is read with the async ORM so it streams there too.
+    """
+    pagination_class = None
+    content_negotiation_class = ExportContentNegotiation
+
+    def get(self, request, event_id, export_format):
+        if not Event.objects.filter(id=event_id).exists():
             raise NotFound("Event not found")
-        return Attendees.objects.filter(registrations__event_id=event_id).distinct()
-    
-    
-    
-    
-    
-    
-    
\ No newline at end of file
+        tz = timezone.get_current_timezone()
+        if isinstance(request._request, ASGIRequest):
+            stream = astream_export(export_format, aattendee_rows(event_id, tz=tz))
+        else:
+            stream = stream_export(export_format, attendee_rows(event_id, tz=tz))
+        response = StreamingHttpResponse(
+            stream, content_type=EXPORT_FORMATS[export_format][0])
+        response["Content-Disposition"] = (
+            f'attachment; filename="event-{event_id}-attendees.{export_format}"')
+        return response
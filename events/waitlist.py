@@ -0,0 +1,133 @@
+from django.core import signing
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.dispatch import Signal
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from event_manager.metrics import record_registration
+from .models import Event, Registration, WaitlistEntry
+from .utils import claim_seat, release_seats, upsert_attendee
+
+
+CANCEL_TOKEN_SALT = "events.cancel"
+
+
+# Sent after commit for every waitlisted attendee who got a seat, with
+# ``registration``; hook notifications here.
+attendee_promoted = Signal()
+
+
+def next_in_line(event_id: int):
+    """
+    The longest-waiting entry for the event: one seek on the
+    (event, created_at, id) index, whatever the queue length.
+    """
+    return (
+        WaitlistEntry.objects.select_for_update()
+        .filter(event_id=event_id)
+        .order_by("created_at", "id")
+        .first()
+    )
+
+
+def cancel_token(event_id: int, email: str) -> str:
+    """
+    Proof of ownership for ``cancel_registration``, handed out when the
+    attendee registers or joins the waitlist. Signed with ``SECRET_KEY``,
+    so nothing is stored.
+    """
+    return signing.dumps([event_id, email.lower()], salt=CANCEL_TOKEN_SALT, compress=True)
+
+
+def check_cancel_token(token: str, event_id: int, email: str) -> None:
+    try:
+        value = signing.loads(token, salt=CANCEL_TOKEN_SALT)
+    except signing.BadSignature:
+        value = None
+    if value != [event_id, email.lower()]:
+        raise PermissionDenied("Invalid cancellation token.")
+
+
+@transaction.atomic
+def promote_waitlist(event_id: int, limit: int = None) -> list:
+    """
+    Moves waitlisted attendees into free seats, oldest first, until the
+    event is full, the queue is empty or ``limit`` attendees were promoted.
+    Returns the new registrations.
+    """
+    promoted = []
+    while (limit is None or len(promoted) < limit) and (
+            (entry := next_in_line(event_id)) is not None and claim_seat(event_id)):
+        entry.delete()
+        try:
+            with transaction.atomic():
+                registration = Registration.objects.create(
+                    event_id=event_id, attendee_id=entry.attendee_id)
+        except IntegrityError:
+            # Registered directly while queued; hand the seat back.
+            release_seats(event_id)
+            continue
+        record_registration("promoted")
+        transaction.on_commit(
+            lambda registration=registration: attendee_promoted.send(
+                sender=Registration, registration=registration))
+        promoted.append(registration)
+    return promoted
+
+
+@transaction.atomic
+def join_waitlist(event_id: int, name: str, email: str) -> dict:
+    """
+    Queues the attendee for a full event. Returns ``{"status": "waitlisted",
+    "position": n}``, or ``{"status": "registered"}`` if a seat freed up
+    while joining and the attendee was first in line.
+    """
+    seats = Event.objects.filter(id=event_id).values_list(
+        "seats_taken", "max_capacity").first()
+    if seats is None:
+        raise NotFound(detail="Event not found")
+    if seats[0] < seats[1]:
+        raise ValidationError("Event still has seats available; register instead.")
+
+    attendee = upsert_attendee(name, email)
+    if Registration.objects.filter(event_id=event_id, attendee=attendee).exists():
+        raise ValidationError("Attendee already registered for this event.")
+    try:
+        with transaction.atomic():
+            entry = WaitlistEntry.objects.create(event_id=event_id, attendee=attendee)
+    except IntegrityError:
+        raise ValidationError("Attendee is already on the waitlist for this event.")
+
+    # A cancellation may have committed after the capacity check above.
+    if any(r.attendee_id == attendee.id for r in promote_waitlist(event_id)):
+        return {"status": "registered"}
+    position = WaitlistEntry.objects.filter(
+        Q(created_at__lt=entry.created_at) | Q(created_at=entry.created_at, id__lte=entry.id),
+        event_id=event_id).count()
+    return {"status": "waitlisted", "position": position}
+
+
+@transaction.atomic
+def cancel_registration(event_id: int, email: str, token: str) -> str:
+    """
+    Cancels the attendee's registration; ``token`` must be the attendee's
+    ``cancel_token``. The seat goes to the next waitlisted attendee in the
+    same transaction, so it is never visible as free to other registrants.
+    An attendee who is only on the waitlist leaves it. Returns
+    ``"cancelled"`` or ``"left_waitlist"``.
+    """
+    check_cancel_token(token, event_id, email)
+    email = email.lower()
+    # Registering directly leaves any waitlist entry in place; drop it first
+    # so the promotion below cannot hand the freed seat straight back.
+    left_waitlist, _ = WaitlistEntry.objects.filter(
+        event_id=event_id, attendee__email=email).delete()
+    # Deleting fires post_delete, which releases the seat and promotes.
+    deleted, _ = Registration.objects.filter(
+        event_id=event_id, attendee__email=email).delete()
+    if deleted:
+        return "cancelled"
+    if left_waitlist:
+        return "left_waitlist"
+    if not Event.objects.filter(id=event_id).exists():
+        raise NotFound(detail="Event not found")
+    raise ValidationError("Attendee is not registered for this event.")
@@ -0,0 +1,79 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from events.models import Event
+from events.idempotency import idempotency_store
+from events.live import get_broker
+from events.soldout import sold_out_events
+from events.throttles import registration_buckets
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+from .query_budget import QueryBudgetRecorder
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def make_event(db):
+    def _make_event(**kwargs):
+        defaults = {
+            "name": "Pycon India 2025",
+            "location": "Bangalore",
+            "start_time": timezone.now() + timedelta(days=1),
+            "end_time": timezone.now() + timedelta(days=2),
+            "max_capacity": 2,
+        }
+        defaults.update(kwargs)
+        return Event.objects.create(**defaults)
+    return _make_event
+
+
+@pytest.fixture
+def register(api_client):
+    """
+    POSTs a registration with ``api_client``; ``extra`` goes to the request
+    as headers or WSGI environ, e.g. ``REMOTE_ADDR`` or ``HTTP_IDEMPOTENCY_KEY``.
+    """
+    def _register(event, name, email, **extra):
+        url = reverse("register-attendees", kwargs={"event_id": event.id})
+        return api_client.post(url, {"name": name, "email": email}, format="json", **extra)
+    return _register
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_db(settings, tmp_path_factory):
+    settings.RATE_LIMIT_DB = str(tmp_path_factory.getbasetemp() / "ratelimit.sqlite3")
+    settings.IDEMPOTENCY_DB = str(tmp_path_factory.getbasetemp() / "idempotency.sqlite3")
+    registration_buckets.reset()
+    idempotency_store.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    sold_out_events.reset()
+    get_broker.cache_clear()
+    yield
+    cache.clear()
+    sold_out_events.reset()
+    get_broker.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def query_budget(request):
+    """
+    Fails the test if a request exceeds its endpoint's query budget or
+    repeats a query shape (see ``tests/query_budget.py``).
+    """
+    marker = request.node.get_closest_marker("query_budget")
+    options = dict(marker.kwargs) if marker else {}
+    enforce = options.pop("enforce", True)
+    with QueryBudgetRecorder() as recorder:
+        yield recorder
+    problems = recorder.violations(**options) if enforce else []
+    if problems:
+        pytest.fail("\n\n".join(problems), pytrace=False)
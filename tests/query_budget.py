@@ -0,0 +1,135 @@
+"""
+Per-endpoint query budgets and N+1 detection.
+
+Every request made through the Django test client is attributed to its URL
+name, and the SQL it issues is recorded. A test fails if any request goes
+over the budget declared for its endpoint in ``QUERY_BUDGETS``, or issues
+the same query shape more than ``REPEATED_QUERY_LIMIT`` times (the usual
+symptom of a lazy load inside a loop).
+
+Tests that legitimately exceed either check, e.g. a bulk import run in
+many tiny batches, opt out with::
+
+    @pytest.mark.query_budget(budget=50, allow_repeats=True)
+
+or skip the checks entirely with ``query_budget(enforce=False)``.
+"""
+import re
+from contextlib import ExitStack
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.urls import Resolver404, resolve
+
+
+# Worst-case statements per request, savepoints excluded. Batched endpoints
+# are budgeted for a single batch.
+QUERY_BUDGETS = {
+    # events/urls.py
+    "event-list-create": 1,
+    "event-import": 3,
+    # One more when the attendee's name changes (roster version bump).
+    "register-attendees": 4,
+    "bulk-register-attendees": 8,
+    "event-waitlist": 8,
+    # One more for dropping the attendee's own waitlist entry.
+    "cancel-registration": 8,
+    "event-attendees": 2,
+    "event-attendees-csv": 2,
+    "event-attendees-ndjson": 2,
+    # events/async_urls.py
+    "async-event-list": 1,
+    "async-register-attendees": 4,
+    "async-event-attendees": 2,
+    "async-event-live": 1,
+}
+
+REPEATED_QUERY_LIMIT = 2
+
+IGNORED_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_VALUES_LIST = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+def query_shape(sql):
+    """
+    Normalizes ``sql`` so queries differing only in parameters, literal
+    values or the length of an ``IN (...)`` list compare equal.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(?)", sql)
+    sql = _VALUES_LIST.sub(r"\1", sql)
+    return " ".join(sql.split())
+
+
+class RequestQueries:
+    def __init__(self, url_name, path):
+        self.url_name = url_name
+        self.path = path
+        self.statements = []
+
+    def repeated(self):
+        shapes = {}
+        for sql in self.statements:
+            shape = query_shape(sql)
+            shapes[shape] = shapes.get(shape, 0) + 1
+        return {shape: count for shape, count in shapes.items()
+                if count > REPEATED_QUERY_LIMIT}
+
+
+class QueryBudgetRecorder:
+    """
+    Hooks the test client's request signals and every connection's execute
+    path; collects one ``RequestQueries`` per request.
+    """
+    def __init__(self):
+        self.requests = []
+        self.current = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self.record))
+        request_started.connect(self.started)
+        request_finished.connect(self.finished)
+        return self
+
+    def __exit__(self, *exc_info):
+        request_started.disconnect(self.started)
+        request_finished.disconnect(self.finished)
+        self._stack.close()
+
+    def started(self, sender, environ=None, scope=None, **kwargs):
+        path = environ["PATH_INFO"] if environ is not None else scope["path"]
+        try:
+            url_name = resolve(path).url_name
+        except Resolver404:
+            url_name = None
+        self.current = RequestQueries(url_name, path)
+        self.requests.append(self.current)
+
+    def finished(self, sender, **kwargs):
+        self.current = None
+
+    def record(self, execute, sql, params, many, context):
+        if self.current is not None and not sql.startswith(IGNORED_STATEMENTS):
+            self.current.statements.append(sql)
+        return execute(sql, params, many, context)
+
+    def violations(self, budget=None, allow_repeats=False):
+        problems = []
+        for queries in self.requests:
+            limit = budget if budget is not None else QUERY_BUDGETS.get(queries.url_name)
+            if limit is not None and len(queries.statements) > limit:
+                problems.append(
+                    f"{queries.path} ({queries.url_name}) ran {len(queries.statements)} "
+                    f"queries, budget is {limit}:\n  " + "\n  ".join(queries.statements))
+            if not allow_repeats:
+                for shape, count in queries.repeated().items():
+                    problems.append(
+                        f"{queries.path} ({queries.url_name}) repeated a query {count} "
+                        f"times (possible N+1):\n  {shape}")
+        return problems
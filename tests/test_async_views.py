@@ -0,0 +1,67 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+from events.models import Registration
+
+
+@pytest.fixture
+def async_client():
+    return AsyncClient()
+
+
+@pytest.mark.django_db
+def test_async_event_list_matches_sync_body(api_client, async_client, make_event):
+    for i in range(3):
+        make_event(name=f"Event {i}")
+
+    sync_response = api_client.get(
+        reverse("event-list-create") + "?page_size=2", HTTP_Timezone="America/New_York")
+    async_response = async_to_sync(async_client.get)(
+        reverse("async-event-list") + "?page_size=2", headers={"Timezone": "America/New_York"})
+
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response.json()["results"] == sync_response.json()["results"]
+    assert async_response.json()["next"] is not None
+
+
+@pytest.mark.django_db
+def test_async_register_and_list_attendees(async_client, make_event):
+    event = make_event(max_capacity=1)
+    register_url = reverse("async-register-attendees", kwargs={"event_id": event.id})
+
+    invalid = async_to_sync(async_client.post)(
+        register_url, {"name": "Jose123", "email": "jose@email.com"},
+        content_type="application/json")
+    created = async_to_sync(async_client.post)(
+        register_url, {"name": "Albin", "email": "albin@email.com"},
+        content_type="application/json")
+    full = async_to_sync(async_client.post)(
+        register_url, {"name": "Babu", "email": "babu@email.com"},
+        content_type="application/json")
+
+    assert created.status_code == status.HTTP_201_CREATED
+    assert full.status_code == status.HTTP_400_BAD_REQUEST
+    assert "full" in full.content.decode().lower()
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Name can only contain letters" in invalid.content.decode()
+    assert Registration.objects.filter(event=event).count() == 1
+
+    attendees = async_to_sync(async_client.get)(
+        reverse("async-event-attendees", kwargs={"event_id": event.id}))
+    assert [a["email"] for a in attendees.json()["results"]] == ["albin@email.com"]
+
+
+@pytest.mark.django_db
+def test_async_endpoints_return_404_for_missing_event(async_client):
+    register = async_to_sync(async_client.post)(
+        reverse("async-register-attendees", kwargs={"event_id": 9999}),
+        {"name": "Albin", "email": "albin@email.com"},
+        content_type="application/json")
+    attendees = async_to_sync(async_client.get)(
+        reverse("async-event-attendees", kwargs={"event_id": 9999}))
+
+    assert register.status_code == status.HTTP_404_NOT_FOUND
+    assert attendees.status_code == status.HTTP_404_NOT_FOUND
+    assert attendees.json() == {"detail": "Event not found"}
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from rest_framework import status
+from events.models import Registration
+from attendees.models import Attendees
+
+
+@pytest.fixture
+def roster(make_event):
+    event = make_event(max_capacity=10)
+    base = datetime(2099, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+    for i in range(5):
+        attendee = Attendees.objects.create(name=f"Guest {i}", email=f"guest{i}@email.com")
+        Registration.objects.create(event=event, attendee=attendee,
+                                    created_at=base + timedelta(minutes=i))
+    return event
+
+
+def content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+@override_settings(ATTENDEE_EXPORT_CHUNK_SIZE=2)
+def test_csv_export_streams_full_roster(api_client, roster):
+    response = api_client.get(
+        reverse("event-attendees-csv", kwargs={"event_id": roster.id}),
+        HTTP_Timezone="UTC")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(content(response))))
+    assert [row["email"] for row in rows] == [f"guest{i}@email.com" for i in range(5)]
+    assert rows[0]["registered_at"] == "2099-01-01T12:00:00+00:00"
+
+
+@pytest.mark.django_db
+def test_ndjson_export_uses_client_timezone(api_client, roster):
+    response = api_client.get(
+        reverse("event-attendees-ndjson", kwargs={"event_id": roster.id}),
+        HTTP_Timezone="Asia/Kolkata")
+
+    lines = [json.loads(line) for line in content(response).splitlines()]
+    assert len(lines) == 5
+    assert set(lines[0]) == {"id", "name", "email", "registered_at"}
+    assert lines[0]["registered_at"] == "2099-01-01T17:30:00+05:30"
+
+
+@pytest.mark.django_db
+def test_export_missing_event(api_client):
+    response = api_client.get(
+        reverse("event-attendees-csv", kwargs={"event_id": 9999}))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name, accept", [
+    ("event-attendees-csv", "text/csv"),
+    ("event-attendees-ndjson", "application/x-ndjson"),
+])
+def test_export_ignores_accept(api_client, roster, url_name, accept):
+    response = api_client.get(
+        reverse(url_name, kwargs={"event_id": roster.id}), HTTP_ACCEPT=accept)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == accept
+
+
+@pytest.mark.django_db
+@override_settings(ATTENDEE_EXPORT_CHUNK_SIZE=2)
+def test_export_streams_asynchronously_under_asgi(roster):
+    async def fetch():
+        response = await AsyncClient().get(
+            reverse("event-attendees-csv", kwargs={"event_id": roster.id}))
+        assert response.is_async
+        return [chunk async for chunk in response.streaming_content]
+
+    chunks = async_to_sync(fetch)()
+
+    assert len(chunks) == 6
+    assert b"".join(chunks).decode().splitlines()[1].split(",")[2] == "guest0@email.com"
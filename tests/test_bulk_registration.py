@@ -0,0 +1,166 @@
+import json
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from events import utils
+from events.models import Event, Registration
+from events.utils import bulk_register_attendees
+from attendees.models import Attendees
+
+
+def bulk_url(event):
+    return reverse("bulk-register-attendees", kwargs={"event_id": event.id})
+
+
+@pytest.mark.django_db
+def test_bulk_register_json_array(api_client, make_event):
+    event = make_event(max_capacity=10)
+    rows = [{"name": "Albin", "email": "albin@email.com"},
+            {"name": "Babu", "email": "BABU@email.com"}]
+
+    response = api_client.post(bulk_url(event), rows, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["summary"] == {"registered": 2}
+    assert [r["email"] for r in response.data["results"]] == [
+        "albin@email.com", "babu@email.com"]
+    event.refresh_from_db()
+    assert event.seats_taken == 2
+    assert Registration.objects.filter(event=event).count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_register_ndjson_stream(api_client, make_event):
+    event = make_event(max_capacity=10)
+    body = "\n".join([
+        json.dumps({"name": "Albin", "email": "albin@email.com"}),
+        "",
+        "{not json",
+        json.dumps({"name": "Babu", "email": "babu@email.com"}),
+    ])
+
+    response = api_client.post(
+        bulk_url(event), body, content_type="application/x-ndjson")
+
+    assert response.status_code == status.HTTP_200_OK
+    statuses = [r["status"] for r in response.data["results"]]
+    assert statuses == ["registered", "invalid", "registered"]
+
+
+@pytest.mark.django_db
+def test_bulk_register_reports_undecodable_ndjson_lines(api_client, make_event):
+    event = make_event(max_capacity=10)
+    body = b'{"name": "Albin", "email": "albin@email.com"}\n\xff\xfe\n'
+
+    response = api_client.post(
+        bulk_url(event), body, content_type="application/x-ndjson")
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.data["results"]
+    assert [r["status"] for r in results] == ["registered", "invalid"]
+    assert "utf-8" in str(results[1]["errors"])
+
+
+@pytest.mark.django_db
+def test_bulk_register_reports_per_row_status(api_client, make_event):
+    event = make_event(max_capacity=2)
+    api_client.post(
+        reverse("register-attendees", kwargs={"event_id": event.id}),
+        {"name": "Albin", "email": "albin@email.com"}, format="json")
+    rows = [
+        {"name": "Albin", "email": "albin@email.com"},
+        {"name": "Jose123", "email": "jose@email.com"},
+        {"name": "Babu", "email": "babu@email.com"},
+        {"name": "Babu", "email": "babu@email.com"},
+        {"name": "Chris", "email": "chris@email.com"},
+    ]
+
+    response = api_client.post(bulk_url(event), rows, format="json")
+
+    results = response.data["results"]
+    assert [r["status"] for r in results] == [
+        "duplicate", "invalid", "registered", "duplicate", "full"]
+    assert "name" in results[1]["errors"]
+    event.refresh_from_db()
+    assert event.seats_taken == 2
+    assert Registration.objects.filter(event=event).count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_register_claims_capacity_across_batches(make_event):
+    event = make_event(max_capacity=5)
+    rows = [{"name": "Guest", "email": f"guest{i}@email.com"} for i in range(8)]
+
+    results = bulk_register_attendees(event.id, rows, batch_size=3)
+
+    assert [r["status"] for r in results] == ["registered"] * 5 + ["full"] * 3
+    assert Registration.objects.filter(event=event).count() == 5
+    assert Attendees.objects.count() == 8
+
+
+@pytest.mark.django_db
+def test_bulk_register_upserts_existing_attendee(api_client, make_event):
+    event = make_event(max_capacity=5)
+    Attendees.objects.create(name="Old Name", email="albin@email.com")
+
+    response = api_client.post(
+        bulk_url(event), [{"name": "Albin", "email": "albin@email.com"}],
+        format="json")
+
+    assert response.data["summary"] == {"registered": 1}
+    assert Attendees.objects.get().name == "Albin"
+
+
+@pytest.mark.django_db
+def test_bulk_register_keeps_names_of_rows_not_registered(make_event):
+    event = make_event(max_capacity=1)
+    existing = Attendees.objects.create(name="Babu", email="babu@email.com")
+    Registration.objects.create(event=event, attendee=existing)
+    Event.objects.filter(id=event.id).update(seats_taken=1)
+    waiting = Attendees.objects.create(name="Chinnu", email="chinnu@email.com")
+
+    results = bulk_register_attendees(event.id, [
+        {"name": "Babu Renamed", "email": "babu@email.com"},
+        {"name": "Chinnu Renamed", "email": "chinnu@email.com"},
+    ])
+
+    assert [r["status"] for r in results] == ["duplicate", "full"]
+    assert Attendees.objects.get(id=existing.id).name == "Babu"
+    assert Attendees.objects.get(id=waiting.id).name == "Chinnu"
+
+
+@pytest.mark.django_db
+def test_bulk_register_survives_a_concurrent_registration(make_event, monkeypatch):
+    event = make_event(max_capacity=5)
+    racer = Attendees.objects.create(name="Racer", email="racer@email.com")
+    claim_seats = utils.claim_seats
+
+    def racing_claim_seats(event_id, count):
+        # Another request registers the racer between the check and the insert.
+        utils.register_attendee(event_id, "Racer", "racer@email.com")
+        return claim_seats(event_id, count)
+
+    monkeypatch.setattr(utils, "claim_seats", racing_claim_seats)
+    results = bulk_register_attendees(event.id, [
+        {"name": "Racer Renamed", "email": "racer@email.com"},
+        {"name": "Albin", "email": "albin@email.com"},
+    ])
+
+    assert [r["status"] for r in results] == ["duplicate", "registered"]
+    assert Registration.objects.filter(event=event).count() == 2
+    assert Event.objects.get(id=event.id).seats_taken == 2
+    assert Attendees.objects.get(id=racer.id).name == "Racer"
+
+
+@pytest.mark.django_db
+def test_bulk_register_rejects_non_list_and_missing_event(api_client, make_event):
+    event = make_event()
+    response = api_client.post(
+        bulk_url(event), {"name": "Albin", "email": "albin@email.com"},
+        format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = api_client.post(
+        reverse("bulk-register-attendees", kwargs={"event_id": 9999}),
+        [], format="json")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,86 @@
+from pathlib import Path
+from event_manager import database
+from event_manager.database import database_settings
+
+
+BASE_DIR = Path("/srv/event-manager")
+
+
+def test_sqlite_is_the_default(monkeypatch):
+    monkeypatch.delenv("EVENT_MANAGER_DB", raising=False)
+    monkeypatch.delenv("SQLITE_PATH", raising=False)
+
+    default = database_settings(BASE_DIR)["default"]
+
+    assert default["ENGINE"] == "django.db.backends.sqlite3"
+    assert default["NAME"] == BASE_DIR / "event_manager.sqlite3"
+
+
+def test_wal_is_only_enabled_for_an_explicit_sqlite_path(monkeypatch):
+    monkeypatch.delenv("EVENT_MANAGER_DB", raising=False)
+    monkeypatch.delenv("SQLITE_WAL", raising=False)
+    monkeypatch.delenv("SQLITE_TUNING", raising=False)
+    monkeypatch.delenv("SQLITE_PATH", raising=False)
+    bundled = database_settings(BASE_DIR)["default"]["OPTIONS"]["init_command"]
+    monkeypatch.setenv("SQLITE_PATH", "/tmp/events.sqlite3")
+    explicit = database_settings(BASE_DIR)["default"]["OPTIONS"]["init_command"]
+    monkeypatch.setenv("SQLITE_WAL", "0")
+    opted_out = database_settings(BASE_DIR)["default"]["OPTIONS"]["init_command"]
+
+    assert "journal_mode=WAL" not in bundled
+    assert "journal_mode=WAL" in explicit
+    assert "journal_mode=WAL" not in opted_out
+
+
+def test_postgres_profile_uses_persistent_checked_connections(monkeypatch):
+    monkeypatch.setenv("EVENT_MANAGER_DB", "postgres")
+    monkeypatch.setenv("POSTGRES_DB", "events")
+    monkeypatch.setenv("DB_CONN_MAX_AGE", "120")
+    monkeypatch.delenv("DB_POOL", raising=False)
+
+    default = database_settings(BASE_DIR)["default"]
+
+    assert default["ENGINE"] == "django.db.backends.postgresql"
+    assert default["NAME"] == "events"
+    assert default["CONN_MAX_AGE"] == 120
+    assert default["CONN_HEALTH_CHECKS"] is True
+    assert "pool" not in default["OPTIONS"]
+
+
+def test_postgres_pool_disables_persistent_connections(monkeypatch):
+    monkeypatch.setenv("EVENT_MANAGER_DB", "postgres")
+    monkeypatch.setenv("DB_POOL", "1")
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "20")
+
+    default = database_settings(BASE_DIR)["default"]
+
+    assert default["CONN_MAX_AGE"] == 0
+    assert default["OPTIONS"]["pool"]["max_size"] == 20
+
+
+def test_unreachable_postgres_falls_back_to_sqlite(monkeypatch):
+    monkeypatch.setenv("EVENT_MANAGER_DB", "postgres")
+    monkeypatch.setenv("DB_FALLBACK_TO_SQLITE", "1")
+    monkeypatch.setattr(database, "postgres_reachable", lambda db: False)
+
+    default = database_settings(BASE_DIR)["default"]
+
+    assert default["ENGINE"] == "django.db.backends.sqlite3"
+
+
+def test_replica_alias_is_added_and_mirrors_default_in_tests(monkeypatch):
+    monkeypatch.setenv("EVENT_MANAGER_DB", "sqlite")
+    monkeypatch.setenv("SQLITE_REPLICA_PATH", "/tmp/replica.sqlite3")
+
+    databases = database_settings(BASE_DIR)
+
+    assert databases["replica"]["NAME"] == "/tmp/replica.sqlite3"
+    assert databases["replica"]["TEST"] == {"MIRROR": "default"}
+    assert "TEST" not in databases["default"]
+
+
+def test_no_replica_by_default(monkeypatch):
+    monkeypatch.setenv("EVENT_MANAGER_DB", "postgres")
+    monkeypatch.delenv("POSTGRES_REPLICA_HOST", raising=False)
+
+    assert set(database_settings(BASE_DIR)) == {"default"}
@@ -0,0 +1,102 @@
+import pytest
+from datetime import datetime, timedelta
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from events.filters import filter_events, fts_query
+from events.models import Event
+from events.utils import upcoming_events
+
+
+def names(response):
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return [event["name"] for event in response.data["results"]]
+
+
+def at(year, month, day, hour=10):
+    return timezone.make_aware(datetime(year, month, day, hour), timezone.get_fixed_timezone(0))
+
+
+@pytest.fixture
+def schedule(make_event):
+    make_event(name="PyCon India", location="Bangalore",
+               start_time=at(2099, 3, 1), end_time=at(2099, 3, 2))
+    make_event(name="DjangoCon Europe", location="Dublin",
+               start_time=at(2099, 3, 2), end_time=at(2099, 3, 3))
+    make_event(name="Rust Meetup", location="Bangalore",
+               start_time=at(2099, 3, 3, 23), end_time=at(2099, 3, 4), max_capacity=1)
+    make_event(name="Past Python Day", location="Bangalore",
+               start_time=timezone.now() - timedelta(days=1),
+               end_time=timezone.now() + timedelta(hours=1))
+
+
+def get(api_client, **params):
+    return api_client.get(reverse("event-list-create"), params, HTTP_TIMEZONE="UTC")
+
+
+@pytest.mark.django_db
+def test_full_text_search_matches_name_and_location_prefixes(api_client, schedule):
+    assert names(get(api_client, q="py")) == ["PyCon India"]
+    assert names(get(api_client, q="bangal")) == ["PyCon India", "Rust Meetup"]
+    assert names(get(api_client, q="django dublin")) == ["DjangoCon Europe"]
+    assert names(get(api_client, q='"OR" NEAR(*')) == []
+
+
+@pytest.mark.django_db
+def test_search_index_follows_renames_and_deletes(api_client, schedule):
+    Event.objects.filter(name="Rust Meetup").update(name="Go Meetup")
+    Event.objects.filter(name="DjangoCon Europe").delete()
+
+    assert names(get(api_client, q="rust")) == []
+    assert names(get(api_client, q="go")) == ["Go Meetup"]
+    assert names(get(api_client, q="django")) == []
+
+
+@pytest.mark.django_db
+def test_date_range_and_location(api_client, schedule):
+    assert names(get(api_client, **{"from": "2099-03-02", "to": "2099-03-03"})) == [
+        "DjangoCon Europe", "Rust Meetup"]
+    assert names(get(api_client, to="2099-03-02T10:00:00")) == [
+        "PyCon India", "DjangoCon Europe"]
+    assert names(get(api_client, location="Bangalore")) == ["PyCon India", "Rust Meetup"]
+
+
+@pytest.mark.django_db
+def test_has_seats(api_client, schedule):
+    Event.objects.filter(name="Rust Meetup").update(seats_taken=1)
+
+    assert names(get(api_client, has_seats="false")) == ["Rust Meetup"]
+    assert "Rust Meetup" not in names(get(api_client, has_seats="true"))
+
+
+@pytest.mark.django_db
+def test_invalid_filters_are_rejected(api_client, schedule):
+    assert get(api_client, **{"from": "soon"}).status_code == status.HTTP_400_BAD_REQUEST
+    assert get(api_client, to="2099-02-30").status_code == status.HTTP_400_BAD_REQUEST
+    assert get(api_client, has_seats="maybe").status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_search_and_location_use_indexes(schedule):
+    search_plan = filter_events(Event.objects.all(), QueryDict("q=bangalore")).explain()
+    location_plan = filter_events(
+        upcoming_events(), QueryDict("location=Dublin")).explain()
+
+    assert "VIRTUAL TABLE INDEX" in search_plan
+    assert "event_location_start_idx" in location_plan
+
+
+def test_fts_query_quotes_words():
+    assert fts_query('py* OR "con"') == '"py"* "OR"* "con"*'
+
+
+@pytest.mark.django_db
+def test_async_list_applies_filters(schedule):
+    from asgiref.sync import async_to_sync
+    from django.test import AsyncClient
+
+    response = async_to_sync(AsyncClient().get)(
+        reverse("async-event-list"), {"q": "rust"}, headers={"Timezone": "UTC"})
+
+    assert [e["name"] for e in response.json()["results"]] == ["Rust Meetup"]
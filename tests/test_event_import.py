@@ -0,0 +1,117 @@
+import json
+import pytest
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from events.models import Event
+
+
+CSV_ROWS = """name,location,start_time,end_time,max_capacity
+Pycon,Bangalore,2099-09-25 10:20,2099-09-25 12:20,100
+Backwards,Delhi,2099-09-25 12:20,2099-09-25 10:20,10
+Djangocon,Kochi,2099-09-26 09:00 AM,2099-09-26 05:00 PM,50
+Broken,Pune,not a date,2099-09-26 05:00 PM,5
+"""
+
+
+@pytest.mark.django_db
+def test_import_csv_upload_reports_row_errors(api_client):
+    upload = SimpleUploadedFile("schedule.csv", CSV_ROWS.encode(), content_type="text/csv")
+
+    response = api_client.post(
+        reverse("event-import"), {"file": upload}, format="multipart",
+        HTTP_Timezone="America/New_York")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["created"] == 2
+    assert [error["row"] for error in response.data["errors"]] == [2, 4]
+    assert "End time must be after start time" in str(response.data["errors"][0])
+    assert "start_time" in response.data["errors"][1]["errors"]
+    pycon = Event.objects.get(name="Pycon")
+    assert timezone.localtime(pycon.start_time, timezone.get_fixed_timezone(0)).hour == 14
+
+
+@pytest.mark.django_db
+@pytest.mark.query_budget(budget=9, allow_repeats=True)
+def test_import_ndjson_upload_in_small_batches(api_client, settings):
+    settings.EVENT_IMPORT_BATCH_SIZE = 2
+    lines = [json.dumps({
+        "name": f"Session {i}", "location": "Hall",
+        "start_time": "2099-01-01T10:00:00", "end_time": "2099-01-01T11:00:00",
+        "max_capacity": 10,
+    }) for i in range(5)]
+    lines.insert(2, "{oops")
+    upload = SimpleUploadedFile("schedule.ndjson", "\n".join(lines).encode())
+
+    response = api_client.post(reverse("event-import"), {"file": upload}, format="multipart")
+
+    assert response.data["created"] == 5
+    assert response.data["errors"][0]["row"] == 3
+    assert Event.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_import_rejects_unknown_or_missing_file(api_client):
+    response = api_client.post(reverse("event-import"), {}, format="multipart")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    upload = SimpleUploadedFile("schedule.xlsx", b"data")
+    response = api_client.post(reverse("event-import"), {"file": upload}, format="multipart")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("filename", ["schedule.csv", "schedule.json"])
+def test_import_rejects_undecodable_file_and_imports_nothing(api_client, settings, filename):
+    settings.EVENT_IMPORT_BATCH_SIZE = 1
+    data = CSV_ROWS.encode() if filename.endswith(".csv") else b'[{"name": "Pycon"}]'
+    upload = SimpleUploadedFile(filename, data + "\nCaf\xe9,Goa".encode("latin-1"))
+
+    response = api_client.post(reverse("event-import"), {"file": upload}, format="multipart")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "not valid utf-8" in str(response.data)
+    assert not Event.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_reports_undecodable_ndjson_line(api_client):
+    row = {"name": "Pycon", "location": "Goa", "start_time": "2099-09-25 10:20",
+           "end_time": "2099-09-25 12:20", "max_capacity": 10}
+    lines = [json.dumps(row).encode(), '{"name": "Caf\xe9"}'.encode("latin-1")]
+    upload = SimpleUploadedFile("schedule.ndjson", b"\n".join(lines))
+
+    response = api_client.post(reverse("event-import"), {"file": upload}, format="multipart")
+
+    assert response.data["created"] == 1
+    assert response.data["errors"] == [{"row": 2, "errors": ["Line is not valid utf-8 text."]}]
+
+
+@pytest.mark.django_db
+def test_import_events_command(tmp_path):
+    path = tmp_path / "schedule.json"
+    path.write_text(json.dumps([
+        {"name": "Pycon", "location": "Bangalore", "start_time": "2099-09-25 10:20",
+         "end_time": "2099-09-25 12:20", "max_capacity": 100},
+        {"name": "", "location": "Delhi", "start_time": "2099-09-25 10:20",
+         "end_time": "2099-09-25 12:20", "max_capacity": 100},
+    ]))
+    out, err = StringIO(), StringIO()
+
+    call_command("import_events", str(path), "--timezone", "UTC",
+                 "--batch-size", "1", stdout=out, stderr=err)
+
+    assert "Imported 1 event(s), 1 row(s) failed." in out.getvalue()
+    assert "Row 2" in err.getvalue()
+    assert Event.objects.get().start_time.hour == 10
+
+    with pytest.raises(CommandError):
+        call_command("import_events", str(tmp_path / "missing.csv"))
+    latin = tmp_path / "latin.csv"
+    latin.write_bytes("name,location\nCaf\xe9,Goa\n".encode("latin-1"))
+    with pytest.raises(CommandError, match="not valid utf-8"):
+        call_command("import_events", str(latin))
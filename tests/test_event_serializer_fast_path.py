@@ -0,0 +1,51 @@
+import pytest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from events.models import Event
+from events.serializers import EventSerializer
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.fixture
+def events(make_event):
+    base = datetime(2099, 3, 30, 20, 45, tzinfo=dt_timezone.utc)
+    return [
+        make_event(name="Pycon", location="Bangalore", start_time=base,
+                   end_time=base + timedelta(hours=2)),
+        # Shares a start time with the first event.
+        make_event(name="Djangocon", location="Kochi", start_time=base,
+                   end_time=base + timedelta(days=1)),
+        make_event(name="Late Night", location="O'Brien Hall",
+                   start_time=base - timedelta(hours=23, minutes=59),
+                   end_time=base - timedelta(hours=20), max_capacity=1),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("tz_name", ["Asia/Kolkata", "America/New_York", "Europe/London", "UTC"])
+def test_fast_path_is_byte_identical(events, tz_name):
+    queryset = Event.objects.order_by("start_time", "id")
+    serializer = EventSerializer()
+    with timezone.override(ZoneInfo(tz_name)):
+        expected = render([serializer.to_representation(event) for event in queryset])
+
+        many = EventSerializer(many=True)
+        from_queryset = render(EventSerializer(queryset, many=True).data)
+        from_instances = render(EventSerializer(list(queryset), many=True).data)
+        from_values = render(EventSerializer(
+            list(queryset.values(*many.value_fields())), many=True).data)
+
+    assert from_queryset == expected
+    assert from_instances == expected
+    assert from_values == expected
+
+
+@pytest.mark.django_db
+def test_fast_path_handles_empty_input():
+    assert EventSerializer(Event.objects.none(), many=True).data == []
+    assert EventSerializer([], many=True).data == []
@@ -67,8 +67,8 @@ def test_event_timezone_conversion(api_client):
     data = {
         "name": "Timezone Management Event",
         "location": "New York",
-        "start_time": "2025-09-25T10:20:00",
-        "end_time": "2025-09-25T12:20:00",
+        "start_time": "2099-09-25T10:20:00",
+        "end_time": "2099-09-25T12:20:00",
         "max_capacity": 100,
     }
     headers = {"HTTP_Timezone": "America/New_York"}
@@ -84,7 +84,7 @@ def test_event_timezone_conversion(api_client):
     returned_start_time = response.data['results'][0]["start_time"]
 
     # 10:20 AM New York (EDT) → 07:50 PM IST
-    expected_ist = "25/09/2025 07:50 PM"
+    expected_ist = "25/09/2099 07:50 PM"
     assert returned_start_time == expected_ist
 
 
@@ -0,0 +1,89 @@
+import pytest
+from datetime import timedelta
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from events.cache import UpcomingEventsCache, upcoming_events_cache
+
+
+@pytest.mark.django_db
+def test_upcoming_events_are_served_from_cache(api_client, make_event):
+    make_event(name="Cached")
+    url = reverse("event-list-create")
+    before = upcoming_events_cache.stats()
+
+    first = api_client.get(url)
+    second = api_client.get(url)
+
+    assert first["X-Cache"] == "MISS"
+    assert second["X-Cache"] == "HIT"
+    assert second.data == first.data
+    after = upcoming_events_cache.stats()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+
+
+@pytest.mark.django_db
+def test_event_changes_invalidate_cache(api_client, make_event):
+    event = make_event(name="Original")
+    url = reverse("event-list-create")
+    api_client.get(url)
+
+    event.name = "Renamed"
+    event.save()
+    response = api_client.get(url)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["results"][0]["name"] == "Renamed"
+
+    make_event(name="Second")
+    assert len(api_client.get(url).data["results"]) == 2
+
+    event.delete()
+    assert [e["name"] for e in api_client.get(url).data["results"]] == ["Second"]
+
+
+@pytest.mark.django_db
+def test_seat_filtered_pages_are_not_cached(api_client, make_event):
+    make_event()
+    url = reverse("event-list-create") + "?has_seats=true"
+
+    api_client.get(url)
+    response = api_client.get(url)
+
+    assert "X-Cache" not in response
+
+
+@pytest.mark.django_db
+def test_cache_is_keyed_by_timezone(api_client, make_event):
+    make_event()
+    url = reverse("event-list-create")
+    ist = api_client.get(url, HTTP_Timezone="Asia/Kolkata")
+    utc = api_client.get(url, HTTP_Timezone="UTC")
+
+    assert utc["X-Cache"] == "MISS"
+    assert ist.data["results"][0]["start_time"] != utc.data["results"][0]["start_time"]
+
+
+@pytest.mark.django_db
+def test_page_expires_when_first_event_starts(make_event):
+    cache = UpcomingEventsCache(timeout=300)
+
+    cache.set("started", {"results": []}, expires_at=timezone.now() - timedelta(seconds=1))
+    cache.set("later", {"results": []}, expires_at=timezone.now() + timedelta(hours=1))
+
+    assert cache.get("started") is None
+    assert cache.get("later") == {"results": []}
+
+
+def test_file_backend(tmp_path):
+    caches_setting = {"default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": str(tmp_path),
+    }}
+    with override_settings(CACHES=caches_setting):
+        cache = UpcomingEventsCache()
+        version = cache.version()
+        cache.bump()
+        assert cache.version() != version
+        cache.set("page", {"results": [1]})
+        assert cache.get("page") == {"results": [1]}
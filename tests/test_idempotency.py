@@ -0,0 +1,191 @@
+import multiprocessing
+import threading
+import time
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.http import JsonResponse
+from django.test import AsyncClient, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from events.idempotency import DONE, OWNER, RUNNING, IdempotencyStore, idempotent
+from events.models import Event, Registration
+
+
+@pytest.mark.django_db
+def test_retry_replays_registration_without_queries(register, make_event):
+    event = make_event()
+    first = register(event, "Albin", "albin@email.com", HTTP_IDEMPOTENCY_KEY="key-1")
+
+    with CaptureQueriesContext(connection) as ctx:
+        retry = register(event, "Albin", "albin@email.com", HTTP_IDEMPOTENCY_KEY="key-1")
+
+    assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+    assert retry.content == first.content
+    assert retry["Idempotent-Replayed"] == "true"
+    assert ctx.captured_queries == []
+    assert Registration.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_async_register_replays_retries(make_event):
+    event = make_event()
+    url = reverse("async-register-attendees", kwargs={"event_id": event.id})
+
+    def send():
+        return async_to_sync(AsyncClient().post)(
+            url, {"name": "Albin", "email": "albin@email.com"},
+            content_type="application/json", headers={"Idempotency-Key": "key-1"})
+
+    first, retry = send(), send()
+
+    assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+    assert retry.content == first.content
+    assert retry["Idempotent-Replayed"] == "true"
+    assert Registration.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_retried_event_creation_creates_one_event(api_client):
+    payload = {"name": "PyCon", "location": "Goa", "max_capacity": 10,
+               "start_time": "2099-01-01T10:00:00", "end_time": "2099-01-01T12:00:00"}
+    url = reverse("event-list-create")
+
+    first = api_client.post(url, payload, format="json", HTTP_IDEMPOTENCY_KEY="create-1")
+    retry = api_client.post(url, payload, format="json", HTTP_IDEMPOTENCY_KEY="create-1")
+    other = api_client.post(url, payload, format="json", HTTP_IDEMPOTENCY_KEY="create-2")
+
+    assert first.json() == retry.json()
+    assert other.json()["id"] != first.json()["id"]
+    assert Event.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_key_reused_with_different_body_is_rejected(register, make_event):
+    event = make_event()
+    register(event, "Albin", "albin@email.com", HTTP_IDEMPOTENCY_KEY="key-1")
+
+    response = register(event, "Albin", "babu@email.com", HTTP_IDEMPOTENCY_KEY="key-1")
+
+    assert response.status_code == 422
+    assert Registration.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_without_key_requests_are_not_deduplicated(api_client, make_event):
+    event = make_event()
+    url = reverse("register-attendees", kwargs={"event_id": event.id})
+    api_client.post(url, {"name": "Albin", "email": "albin@email.com"}, format="json")
+
+    response = api_client.post(url, {"name": "Albin", "email": "albin@email.com"}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_concurrent_requests_with_same_key_run_once():
+    calls = []
+    started = threading.Event()
+
+    @idempotent
+    def view(request):
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return JsonResponse({"n": len(calls)}, status=201)
+
+    def send(results):
+        request = RequestFactory().post("/x", {"a": 1}, content_type="application/json",
+                                        HTTP_IDEMPOTENCY_KEY="same")
+        results.append(view(request))
+
+    results = []
+    first = threading.Thread(target=send, args=(results,))
+    first.start()
+    started.wait()
+    others = [threading.Thread(target=send, args=(results,)) for _ in range(3)]
+    for thread in others:
+        thread.start()
+    for thread in [first, *others]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert {r.content for r in results} == {b'{"n": 1}'}
+    assert sum(r.has_header("Idempotent-Replayed") for r in results) == 3
+
+
+@pytest.mark.parametrize("transient", [500, 429, 409])
+def test_transient_errors_are_not_stored(transient):
+    outcomes = iter([transient, 201])
+
+    @idempotent
+    def view(request):
+        return JsonResponse({}, status=next(outcomes))
+
+    def send():
+        return view(RequestFactory().post("/x", HTTP_IDEMPOTENCY_KEY="k"))
+
+    assert send().status_code == transient
+    assert send().status_code == 201
+    assert send().has_header("Idempotent-Replayed")
+
+
+@pytest.mark.django_db
+def test_throttled_retry_runs_again_once_allowed(register, make_event, settings):
+    settings.REST_FRAMEWORK = dict(settings.REST_FRAMEWORK, DEFAULT_THROTTLE_RATES={
+        "registration_ip": "off", "registration_email": "1/min"})
+    event = make_event()
+    register(event, "Albin", "albin@email.com", HTTP_IDEMPOTENCY_KEY="key-1")
+
+    throttled = register(event, "Albin", "albin@email.com", HTTP_IDEMPOTENCY_KEY="key-2")
+    settings.REST_FRAMEWORK = dict(settings.REST_FRAMEWORK, DEFAULT_THROTTLE_RATES={
+        "registration_ip": "off", "registration_email": "off"})
+    retry = register(event, "Albin", "albin@email.com", HTTP_IDEMPOTENCY_KEY="key-2")
+
+    assert throttled.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert "Idempotent-Replayed" not in retry
+    assert retry.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_store_is_bounded_and_expires(monkeypatch, tmp_path):
+    store = IdempotencyStore(str(tmp_path / "keys.sqlite3"), max_entries=2, ttl=10)
+    clock = [100.0]
+    monkeypatch.setattr("events.idempotency.time.time", lambda: clock[0])
+    for key in ("a", "b", "c"):
+        assert store.begin(key, "f") == (OWNER, None)
+        clock[0] += 1
+        store.finish(key, (201, b"", "application/json"))
+    store.prune()
+
+    assert store.begin("a", "f")[0] == OWNER  # trimmed to keep the newest two
+    assert store.begin("c", "f") == (DONE, (201, b"", "application/json"))
+    clock[0] += 11
+    assert store.begin("c", "f")[0] == OWNER
+
+
+def test_abandoned_key_is_freed_after_the_lease(monkeypatch, settings, tmp_path):
+    settings.IDEMPOTENCY_LEASE = 30
+    store = IdempotencyStore(str(tmp_path / "keys.sqlite3"))
+    clock = [100.0]
+    monkeypatch.setattr("events.idempotency.time.time", lambda: clock[0])
+    store.begin("k", "f")
+
+    assert store.begin("k", "f") == (RUNNING, None)
+    clock[0] += 31
+    assert store.begin("k", "f") == (OWNER, None)
+
+
+def claim(path, key):
+    return IdempotencyStore(path).begin(key, "f")[0] == OWNER
+
+
+def test_keys_are_shared_across_processes(tmp_path):
+    path = str(tmp_path / "keys.sqlite3")
+    context = multiprocessing.get_context("spawn")
+
+    # This module imports models, so workers set Django up before loading it.
+    with context.Pool(4, initializer=django.setup) as pool:
+        owners = pool.starmap(claim, [(path, "same")] * 8)
+
+    assert sum(owners) == 1
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import OperationalError, connection
+from django.test import AsyncClient, Client, AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from events import live
+from events.live import seat_counts
+from events.async_views import event_live
+from events.models import Event
+
+
+def live_url(event_id):
+    return reverse("async-event-live", kwargs={"event_id": event_id})
+
+
+def parse(chunk):
+    chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+    if chunk.startswith(":"):
+        return None
+    return json.loads(chunk.split("data: ", 1)[1])
+
+
+@pytest.fixture
+def fast_live(settings):
+    settings.LIVE_COALESCE_SECONDS = 0.01
+    settings.LIVE_POLL_SECONDS = 0.01
+    settings.LIVE_KEEPALIVE_SECONDS = 0.2
+
+
+@pytest.mark.django_db
+def test_stream_coalesces_a_burst_into_one_update(make_event, fast_live):
+    event = make_event(max_capacity=5)
+
+    async def scenario():
+        response = await event_live(AsyncRequestFactory().get(live_url(event.id)), event.id)
+        chunks = aiter(response.streaming_content)
+        initial = parse(await anext(chunks))
+        await Event.objects.filter(id=event.id).aupdate(seats_taken=3)
+        for _ in range(1000):
+            live.get_broker().publish(event.id)
+        update = parse(await anext(chunks))
+        after = await anext(chunks)
+        return response, initial, update, after
+
+    response, initial, update, after = async_to_sync(scenario)()
+
+    assert response["Content-Type"] == "text/event-stream"
+    assert initial == {"event_id": event.id, "registered_count": 0, "seats_remaining": 5}
+    assert update == {"event_id": event.id, "registered_count": 3, "seats_remaining": 2}
+    assert after == b": keepalive\n\n"
+
+
+@pytest.mark.django_db
+def test_one_query_fans_out_to_every_subscriber(make_event, fast_live):
+    event = make_event(max_capacity=5)
+
+    async def scenario():
+        broker = live.get_broker()
+        subscriptions = [broker.subscribe(event.id) for _ in range(5000)]
+        broker.publish(event.id)
+        values = await asyncio.gather(*(s.wait(1) for s in subscriptions))
+        for subscription in subscriptions:
+            broker.unsubscribe(event.id, subscription)
+        return values
+
+    with CaptureQueriesContext(connection) as queries:
+        values = async_to_sync(scenario)()
+
+    assert len(queries) == 1
+    assert all(v == {"registered_count": 0, "seats_remaining": 5} for v in values)
+
+
+@pytest.mark.django_db
+def test_polling_broker_sees_changes_from_other_workers(make_event, settings, fast_live):
+    settings.LIVE_BROKER = "events.live.PollingBroker"
+    event = make_event(max_capacity=5)
+
+    async def scenario():
+        broker = live.get_broker()
+        subscription = broker.subscribe(event.id)
+        # Written without publishing, as another process would.
+        await Event.objects.filter(id=event.id).aupdate(seats_taken=5)
+        value = await subscription.wait(1)
+        broker.unsubscribe(event.id, subscription)
+        return value
+
+    assert async_to_sync(scenario)() == {"registered_count": 5, "seats_remaining": 0}
+
+
+@pytest.mark.django_db
+def test_failed_read_is_logged_and_later_updates_still_arrive(make_event, monkeypatch, caplog,
+                                                             fast_live):
+    event = make_event(max_capacity=5)
+    reads = []
+
+    async def flaky_seat_counts(event_ids):
+        reads.append(event_ids)
+        if len(reads) == 1:
+            raise OperationalError("server closed the connection unexpectedly")
+        return await seat_counts(event_ids)
+
+    monkeypatch.setattr(live, "seat_counts", flaky_seat_counts)
+
+    async def scenario():
+        broker = live.get_broker()
+        subscription = broker.subscribe(event.id)
+        broker.publish(event.id)
+        missed = await subscription.wait(0.2)
+        broker.publish(event.id)
+        value = await subscription.wait(1)
+        broker.unsubscribe(event.id, subscription)
+        return missed, value
+
+    missed, value = async_to_sync(scenario)()
+
+    assert missed is None
+    assert value == {"registered_count": 0, "seats_remaining": 5}
+    assert "Reading live seat counts" in caplog.text
+
+
+@pytest.mark.django_db
+def test_seat_changes_publish_after_commit(api_client, make_event, monkeypatch,
+                                           django_capture_on_commit_callbacks):
+    event = make_event(max_capacity=5)
+    published = []
+    monkeypatch.setattr(live.get_broker(), "publish", published.append)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            reverse("register-attendees", kwargs={"event_id": event.id}),
+            {"name": "Albin", "email": "albin@email.com"}, format="json")
+    registered = list(published)
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.post(
+            reverse("cancel-registration", kwargs={"event_id": event.id}),
+            {"email": "albin@email.com", "token": response.data["cancel_token"]}, format="json")
+
+    assert registered == [event.id]
+    assert published == [event.id, event.id]
+
+
+@pytest.mark.django_db
+def test_missing_event_is_404(fast_live):
+    response = async_to_sync(AsyncClient().get)(live_url(999))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert live.get_broker()._subscribers == {}
+
+
+@pytest.mark.django_db
+def test_stream_is_refused_under_wsgi(make_event, fast_live):
+    event = make_event(max_capacity=5)
+
+    response = Client().get(live_url(event.id))
+
+    assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+    assert live.get_broker()._subscribers == {}
@@ -0,0 +1,66 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from event_manager import metrics
+
+
+@pytest.mark.django_db
+def test_requests_are_recorded_by_url_name(api_client, make_event):
+    make_event()
+    before = metrics.requests_total.value("event-list-create", "GET", "200")
+    queries_before = metrics.db_queries.count("event-list-create")
+    query_sum = metrics.db_queries.sum("event-list-create")
+
+    response = api_client.get(reverse("event-list-create"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert metrics.requests_total.value("event-list-create", "GET", "200") == before + 1
+    assert metrics.db_queries.count("event-list-create") == queries_before + 1
+    assert metrics.db_queries.sum("event-list-create") > query_sum
+
+
+@pytest.mark.django_db
+def test_registration_outcomes_are_counted(register, make_event):
+    event = make_event(max_capacity=1)
+    counts = {o: metrics.registrations_total.value(o)
+              for o in ("success", "duplicate", "full")}
+
+    register(event, "Albin", "albin@email.com")
+    register(event, "Albin", "albin@email.com")
+    register(event, "Babu", "babu@email.com")
+    register(event, "Chris", "chris@email.com")
+
+    assert metrics.registrations_total.value("success") == counts["success"] + 1
+    assert metrics.registrations_total.value("duplicate") == counts["duplicate"] + 1
+    assert metrics.registrations_total.value("full") == counts["full"] + 2
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_renders_prometheus_text(api_client, make_event):
+    api_client.get(reverse("event-list-create"))
+
+    response = api_client.get(reverse("metrics"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_bucket{view="event-list-create",method="GET",le="+Inf"}' in body
+    assert "# TYPE event_registrations counter" in body
+    assert 'events_list_cache_requests_total{result="miss"}' in body
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("sample", "Sample.", ("view",), buckets=(1, 5))
+    for value in (0.5, 3, 3, 10):
+        histogram.observe(value, "a")
+
+    lines = list(histogram.samples())
+
+    assert lines == [
+        'sample_bucket{view="a",le="1"} 1',
+        'sample_bucket{view="a",le="5"} 3',
+        'sample_bucket{view="a",le="+Inf"} 4',
+        'sample_sum{view="a"} 16.5',
+        'sample_count{view="a"} 4',
+    ]
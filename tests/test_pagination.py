@@ -0,0 +1,113 @@
+import json
+import pytest
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from events.models import Registration
+from attendees.models import Attendees
+
+
+def collect_pages(api_client, url, key):
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append([item[key] for item in response.data["results"]])
+        url = response.data["next"]
+    return pages
+
+
+@pytest.mark.django_db
+def test_event_cursor_pagination_walks_every_event_once(api_client, make_event):
+    start = timezone.now() + timedelta(days=1)
+    # Two events share a start_time to exercise the id tie-breaker.
+    events = [make_event(name=f"Event {i}", start_time=start + timedelta(hours=i // 2),
+                         end_time=start + timedelta(days=1)) for i in range(7)]
+
+    url = reverse("event-list-create") + "?page_size=3"
+    pages = collect_pages(api_client, url, "id")
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sum(pages, []) == [event.id for event in events]
+
+
+@pytest.mark.django_db
+def test_event_cursor_previous_link(api_client, make_event):
+    for i in range(5):
+        make_event(name=f"Event {i}", start_time=timezone.now() + timedelta(days=1, hours=i))
+
+    first = api_client.get(reverse("event-list-create") + "?page_size=2")
+    assert first.data["previous"] is None
+    second = api_client.get(first.data["next"])
+    back = api_client.get(second.data["previous"])
+
+    assert [e["id"] for e in back.data["results"]] == [
+        e["id"] for e in first.data["results"]]
+    assert back.data["previous"] is None
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_returns_404(api_client, make_event):
+    make_event()
+    response = api_client.get(reverse("event-list-create") + "?cursor=garbage")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def cursor(payload):
+    return urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["event-list-create", "async-event-list"])
+@pytest.mark.parametrize("payload", [
+    [1, 2],
+    {"p": 5},
+    {"p": [{"dt": 5}, 1]},
+    {"p": [{"dt": "2099-01-01T00:00:00+00:00"}, "abc"]},
+    {"p": ["not a date", 1]},
+    {"p": [{"dt": "2099-01-01T00:00:00+00:00"}, [1]]},
+    {"p": [{"dt": "2099-01-01T00:00:00+00:00"}, None]},
+    {"p": [{"dt": "2099-01-01T00:00:00+00:00"}, 10 ** 30]},
+])
+def test_tampered_cursor_returns_404(client, make_event, url_name, payload):
+    make_event()
+    response = client.get(reverse(url_name), {"cursor": cursor(payload)})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+@pytest.mark.django_db
+def test_attendee_cursor_pagination_in_registration_order(api_client, make_event):
+    event = make_event(max_capacity=10)
+    now = timezone.now()
+    emails = []
+    for i in range(5):
+        attendee = Attendees.objects.create(name=f"Guest {i}", email=f"guest{i}@email.com")
+        Registration.objects.create(event=event, attendee=attendee,
+                                    created_at=now + timedelta(minutes=i))
+        emails.append(attendee.email)
+
+    url = reverse("event-attendees", kwargs={"event_id": event.id}) + "?page_size=2"
+    pages = collect_pages(api_client, url, "email")
+
+    assert sum(pages, []) == emails
+
+
+@pytest.mark.django_db
+def test_deep_attendee_page_uses_seek_not_offset(api_client, make_event):
+    event = make_event(max_capacity=10)
+    for i in range(4):
+        attendee = Attendees.objects.create(name=f"Guest {i}", email=f"guest{i}@email.com")
+        Registration.objects.create(event=event, attendee=attendee)
+
+    url = reverse("event-attendees", kwargs={"event_id": event.id}) + "?page_size=2"
+    next_url = api_client.get(url).data["next"]
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get(next_url)
+
+    assert not any("OFFSET" in query["sql"] for query in ctx.captured_queries)
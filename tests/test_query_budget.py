@@ -0,0 +1,54 @@
+import pytest
+from django.core.signals import request_finished, request_started
+from django.urls import get_resolver
+from events.models import Registration
+from attendees.models import Attendees
+from .query_budget import QUERY_BUDGETS, QueryBudgetRecorder, query_shape
+
+
+def test_every_events_endpoint_has_a_budget():
+    names = set()
+    for prefix in ("events.urls", "events.async_urls"):
+        names.update(p.name for p in get_resolver(prefix).url_patterns)
+
+    assert names <= set(QUERY_BUDGETS)
+
+
+def test_query_shape_ignores_parameters_and_in_list_length():
+    first = query_shape('SELECT * FROM "t" WHERE "id" IN (%s, %s) LIMIT 21')
+    second = query_shape('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s, %s) LIMIT 1')
+
+    assert first == second
+
+
+@pytest.mark.django_db
+@pytest.mark.query_budget(enforce=False)
+def test_lazy_loads_in_a_loop_are_flagged(make_event):
+    event = make_event(max_capacity=5)
+    for i in range(3):
+        attendee = Attendees.objects.create(name=f"A{i}", email=f"a{i}@email.com")
+        Registration.objects.create(event=event, attendee=attendee)
+
+    with QueryBudgetRecorder() as recorder:
+        request_started.send(sender=None, environ={"PATH_INFO": f"/events/{event.id}/attendees"})
+        [str(registration) for registration in Registration.objects.all()]
+        request_finished.send(sender=None)
+
+    problems = recorder.violations()
+    assert any("budget is 2" in problem for problem in problems)
+    assert any("possible N+1" in problem for problem in problems)
+
+
+@pytest.mark.django_db
+def test_select_related_stays_within_budget(make_event):
+    event = make_event(max_capacity=5)
+    for i in range(3):
+        attendee = Attendees.objects.create(name=f"A{i}", email=f"a{i}@email.com")
+        Registration.objects.create(event=event, attendee=attendee)
+
+    with QueryBudgetRecorder() as recorder:
+        request_started.send(sender=None, environ={"PATH_INFO": f"/events/{event.id}/attendees"})
+        [str(r) for r in Registration.objects.select_related("event", "attendee")]
+        request_finished.send(sender=None)
+
+    assert recorder.violations() == []
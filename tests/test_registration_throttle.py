@@ -0,0 +1,118 @@
+import multiprocessing
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from events.throttles import TokenBucketStore, parse_rate
+
+
+@pytest.fixture
+def rates(settings):
+    def set_rates(ip="off", email="off"):
+        settings.REST_FRAMEWORK = dict(settings.REST_FRAMEWORK, DEFAULT_THROTTLE_RATES={
+            "registration_ip": ip, "registration_email": email})
+    return set_rates
+
+
+@pytest.mark.django_db
+def test_ip_limit_rejects_before_touching_the_database(register, make_event, rates):
+    rates(ip="2/min")
+    event = make_event(max_capacity=10)
+    register(event, "Guest", "a@email.com")
+    register(event, "Guest", "b@email.com")
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = register(event, "Guest", "c@email.com")
+    other_ip = register(event, "Guest", "d@email.com", REMOTE_ADDR="10.0.0.2")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 25 <= int(response["Retry-After"]) <= 30
+    assert ctx.captured_queries == []
+    assert other_ip.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+def test_email_limit_applies_across_ips(register, make_event, rates):
+    rates(email="1/min")
+    first, second = make_event(), make_event()
+
+    assert register(first, "Guest", "albin@email.com").status_code == 201
+    response = register(second, "Guest", " Albin@Email.com", REMOTE_ADDR="10.9.9.9")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert "Retry-After" in response
+
+
+@pytest.mark.django_db
+def test_forwarded_for_is_ignored_without_proxies(register, make_event, rates):
+    rates(ip="1/min")
+    event = make_event(max_capacity=10)
+    register(event, "Guest", "a@email.com")
+
+    response = register(event, "Guest", "b@email.com", HTTP_X_FORWARDED_FOR="1.2.3.4")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+@pytest.mark.django_db
+def test_async_register_shares_the_limits(register, make_event, rates):
+    rates(email="1/min")
+    event = make_event()
+    register(event, "Guest", "albin@email.com")
+
+    response = async_to_sync(AsyncClient().post)(
+        reverse("async-register-attendees", kwargs={"event_id": event.id}),
+        {"name": "Guest", "email": "albin@email.com"}, content_type="application/json")
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 55 <= int(response["Retry-After"]) <= 60
+
+
+def test_bucket_refills_over_time(tmp_path, monkeypatch):
+    store = TokenBucketStore(str(tmp_path / "buckets.sqlite3"))
+    clock = [1000.0]
+    monkeypatch.setattr("events.throttles.time.time", lambda: clock[0])
+
+    assert [store.take("k", 2, 10)[0] for _ in range(3)] == [True, True, False]
+    assert store.take("k", 2, 10) == (False, pytest.approx(5.0))
+    clock[0] += 5
+    assert store.take("k", 2, 10)[0] is True
+    assert store.take("k", 2, 10)[0] is False
+
+
+def test_full_buckets_are_pruned(tmp_path, monkeypatch):
+    store = TokenBucketStore(str(tmp_path / "buckets.sqlite3"))
+    clock = [1000.0]
+    monkeypatch.setattr("events.throttles.time.time", lambda: clock[0])
+    store.take("idle", 2, 10)
+    store.take("busy", 2, 10)
+    clock[0] += 6
+    store.take("busy", 2, 10)
+    store.prune()
+
+    keys = [key for key, in store.connection.execute("SELECT key FROM token_buckets")]
+    assert keys == ["busy"]
+
+
+def test_parse_rate():
+    assert parse_rate("5/min") == (5, 60)
+    assert parse_rate("100/s") == (100, 1)
+    assert parse_rate("off") is None
+
+
+def take_many(path, attempts):
+    store = TokenBucketStore(path)
+    return sum(store.take("shared", 50, 3600)[0] for _ in range(attempts))
+
+
+def test_buckets_are_shared_across_processes(tmp_path):
+    path = str(tmp_path / "buckets.sqlite3")
+    context = multiprocessing.get_context("spawn")
+
+    with context.Pool(4) as pool:
+        allowed = pool.starmap(take_many, [(path, 40)] * 4)
+
+    assert sum(allowed) == 50
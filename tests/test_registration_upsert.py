@@ -0,0 +1,67 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from events.models import Registration
+from attendees.models import Attendees
+
+
+def statements(ctx):
+    """
+    Captured SQL minus the savepoints the test transaction wraps around atomic().
+    """
+    return [
+        query["sql"] for query in ctx.captured_queries
+        if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+    ]
+
+
+@pytest.mark.django_db
+def test_registration_is_three_statements(register, make_event):
+    event = make_event()
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = register(event, "Albin", "albin@email.com")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    sql = statements(ctx)
+    assert len(sql) == 3, sql
+    assert sql[0].startswith("UPDATE")
+    assert "ON CONFLICT" in sql[1]
+    assert sql[2].startswith("INSERT")
+
+
+@pytest.mark.django_db
+def test_known_email_with_different_name_is_upserted(register, make_event):
+    event = make_event()
+    Attendees.objects.create(name="Albin K", email="albin@email.com")
+
+    response = register(event, "Albin", "Albin@Email.com")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    attendee = Attendees.objects.get()
+    assert attendee.name == "Albin"
+    assert Registration.objects.get().attendee == attendee
+
+
+@pytest.mark.django_db
+def test_duplicate_is_detected_by_constraint_and_rolls_back_seat(register, make_event):
+    event = make_event(max_capacity=5)
+    register(event, "Albin", "albin@email.com")
+
+    response = register(event, "Albin", "albin@email.com")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "already registered" in str(response.data).lower()
+    event.refresh_from_db()
+    assert event.seats_taken == 1
+
+
+@pytest.mark.django_db
+def test_duplicate_on_full_event_reports_already_registered(register, make_event):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+
+    response = register(event, "Albin", "albin@email.com")
+
+    assert "already registered" in str(response.data).lower()
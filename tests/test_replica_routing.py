@@ -0,0 +1,118 @@
+"""
+Replica routing. The end-to-end test runs in a spawned process against two
+SQLite files, with ``sync_replica`` standing in for replication.
+"""
+import multiprocessing
+import os
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+from event_manager import routers
+from event_manager.routers import ReplicaRouter, STICKY_COOKIE, reading_from_replica
+
+
+def test_reads_use_default_without_a_replica():
+    from events.models import Event
+    with reading_from_replica():
+        assert ReplicaRouter().db_for_read(Event) is None
+
+
+def test_replica_reads_and_primary_writes(monkeypatch):
+    from events.models import Event
+    monkeypatch.setattr(routers, "replica_configured", lambda: True)
+    router = ReplicaRouter()
+
+    assert router.db_for_read(Event) is None
+    with reading_from_replica():
+        assert router.db_for_read(Event) == "replica"
+        assert router.db_for_write(Event) == "default"
+    assert router.allow_migrate("replica", "events") is False
+
+
+@pytest.mark.django_db
+def test_successful_write_pins_client_to_primary(api_client, make_event, monkeypatch):
+    monkeypatch.setattr(routers, "replica_configured", lambda: True)
+    event = make_event()
+    url = reverse("register-attendees", kwargs={"event_id": event.id})
+
+    response = api_client.post(url, {"name": "Albin", "email": "albin@email.com"}, format="json")
+    rejected = api_client.post(url, {"name": "Albin"}, format="json")
+
+    assert response.cookies[STICKY_COOKIE]["max-age"] > 0
+    assert STICKY_COOKIE not in rejected.cookies
+
+    listing = api_client.get(reverse("event-list-create"))
+    assert listing.status_code == status.HTTP_200_OK
+    assert "X-Cache" not in listing
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["event-list-create", "async-event-list"])
+def test_list_pages_are_cached_from_the_primary(make_event, monkeypatch, url_name):
+    make_event()
+    reads = []
+    monkeypatch.setattr(ReplicaRouter, "db_for_read",
+                        lambda self, model, **hints: reads.append(routers._use_replica.get()))
+    client = AsyncClient()
+
+    uncached = async_to_sync(client.get)(reverse(url_name) + "?has_seats=true")
+    uncached_reads, reads[:] = list(reads), []
+    miss = async_to_sync(client.get)(reverse(url_name))
+
+    assert "X-Cache" not in uncached and uncached_reads and all(uncached_reads)
+    assert miss["X-Cache"] == "MISS" and reads and not any(reads)
+
+
+def run_against_two_files(primary, replica):
+    # The rate-limit and idempotency files go next to the databases, so no
+    # run writes into the working tree or sees an earlier run's buckets.
+    os.environ.update(
+        EVENT_MANAGER_DB="sqlite", SQLITE_PATH=primary, SQLITE_REPLICA_PATH=replica,
+        RATE_LIMIT_DB=primary + ".ratelimit", IDEMPOTENCY_DB=primary + ".idempotency",
+        DJANGO_SETTINGS_MODULE="event_manager.settings")
+    import django
+    django.setup()
+    from datetime import timedelta
+    from django.core.management import call_command
+    from django.test.utils import setup_test_environment
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+    from events.models import Event
+
+    setup_test_environment()
+    call_command("migrate", verbosity=0)
+    start = timezone.now() + timedelta(days=1)
+    first = Event.objects.create(
+        name="Synced", location="Online", max_capacity=5,
+        start_time=start, end_time=start + timedelta(hours=1))
+    call_command("sync_replica", verbosity=0)
+    Event.objects.create(
+        name="Not yet replicated", location="Online", max_capacity=5,
+        start_time=start, end_time=start + timedelta(hours=1))
+
+    def names(client, path="/events/?has_seats=true"):
+        # Seat filters bypass the list cache, so these pages show the database read.
+        return [e["name"] for e in client.get(path).data["results"]]
+
+    client = APIClient()
+    before = names(client)
+    cached = names(client, "/events/")
+    client.post(f"/events/{first.id}/register",
+                {"name": "Albin", "email": "albin@email.com"}, format="json")
+    after_write = names(client)
+    return before, cached, after_write, names(APIClient())
+
+
+def test_two_sqlite_files_end_to_end(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        before, cached, after_write, other_client = pool.apply(
+            run_against_two_files,
+            (str(tmp_path / "primary.sqlite3"), str(tmp_path / "replica.sqlite3")))
+
+    assert before == ["Synced"]
+    assert cached == ["Synced", "Not yet replicated"]
+    assert after_write == ["Synced", "Not yet replicated"]
+    assert other_client == ["Synced"]
@@ -0,0 +1,95 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from events.waitlist import cancel_token
+
+
+def roster_url(event, url_name="event-attendees"):
+    return reverse(url_name, kwargs={"event_id": event.id})
+
+
+@pytest.fixture
+def event(register, make_event):
+    event = make_event()
+    register(event, "Albin", "albin@email.com")
+    return event
+
+
+@pytest.mark.django_db
+def test_unchanged_roster_is_304_without_the_roster_query(api_client, event):
+    first = api_client.get(roster_url(event))
+    etag = first["ETag"]
+
+    with CaptureQueriesContext(connection) as queries:
+        again = api_client.get(roster_url(event), HTTP_IF_NONE_MATCH=etag)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert etag.startswith('W/"')
+    assert again.status_code == status.HTTP_304_NOT_MODIFIED
+    assert again["ETag"] == etag
+    assert len(queries) == 1
+    assert "attendees_attendees" not in queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_etag_changes_on_registration_and_cancellation(api_client, register, event):
+    initial = api_client.get(roster_url(event))["ETag"]
+    register(event, "Babu", "babu@email.com")
+    registered = api_client.get(roster_url(event), HTTP_IF_NONE_MATCH=initial)
+    api_client.post(
+        reverse("cancel-registration", kwargs={"event_id": event.id}),
+        {"email": "albin@email.com", "token": cancel_token(event.id, "albin@email.com")},
+        format="json")
+    cancelled = api_client.get(roster_url(event), HTTP_IF_NONE_MATCH=registered["ETag"])
+
+    assert registered.status_code == status.HTTP_200_OK
+    assert registered["ETag"] != initial
+    assert cancelled.status_code == status.HTTP_200_OK
+    assert [a["email"] for a in cancelled.data["results"]] == ["babu@email.com"]
+    assert cancelled["ETag"] not in (initial, registered["ETag"])
+
+
+@pytest.mark.django_db
+def test_etag_changes_when_an_attendee_is_renamed_elsewhere(api_client, register, event, make_event):
+    initial = api_client.get(roster_url(event))["ETag"]
+    register(make_event(), "Albin Mathew", "albin@email.com")
+    renamed = api_client.get(roster_url(event), HTTP_IF_NONE_MATCH=initial)
+    register(make_event(), "Albin Mathew", "albin@email.com")
+    same_name = api_client.get(roster_url(event), HTTP_IF_NONE_MATCH=renamed["ETag"])
+
+    assert renamed.status_code == status.HTTP_200_OK
+    assert renamed.data["results"][0]["name"] == "Albin Mathew"
+    assert same_name.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_etag_differs_per_page(api_client, register, event):
+    register(event, "Babu", "babu@email.com")
+    first = api_client.get(roster_url(event) + "?page_size=1")
+    second = api_client.get(first.data["next"], HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert second.status_code == status.HTTP_200_OK
+    assert second["ETag"] != first["ETag"]
+
+
+@pytest.mark.django_db
+def test_missing_event_is_404(api_client):
+    response = api_client.get(reverse("event-attendees", kwargs={"event_id": 999}))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_async_roster_answers_if_none_match(event):
+    client = AsyncClient()
+    url = roster_url(event, "async-event-attendees")
+    first = async_to_sync(client.get)(url)
+    again = async_to_sync(client.get)(url, headers={"If-None-Match": first["ETag"]})
+
+    assert first.status_code == status.HTTP_200_OK
+    assert again.status_code == status.HTTP_304_NOT_MODIFIED
+    assert again["ETag"] == first["ETag"]
@@ -0,0 +1,63 @@
+"""
+Prebuilt OpenAPI schema and lazy schema views. The import check runs in a
+spawned process, since this test session has long since loaded everything.
+"""
+import io
+import json
+import multiprocessing
+import sys
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+
+def heavy_schema_modules():
+    import django
+    django.setup()
+    from django.urls import resolve
+    resolve("/events/")
+    return sorted(m for m in ("drf_spectacular.openapi", "drf_spectacular.views")
+                  if m in sys.modules)
+
+
+@pytest.fixture
+def schema_file(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_FILE = str(tmp_path / "openapi.json")
+    return tmp_path / "openapi.json"
+
+
+def test_serving_requests_does_not_load_schema_tooling():
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        assert pool.apply(heavy_schema_modules) == []
+
+
+@pytest.mark.django_db
+def test_schema_is_served_from_the_built_file(client, schema_file):
+    call_command("build_schema", stdout=io.StringIO())
+    response = client.get(reverse("schema"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/vnd.oai.openapi+json"
+    assert response.content == schema_file.read_bytes()
+    paths = json.loads(response.content)["paths"]
+    assert "/events/{event_id}/attendees" in paths
+    assert paths["/events/{event_id}/attendees"]["get"]["tags"] == ["Event Attendees"]
+
+
+@pytest.mark.django_db
+def test_schema_is_generated_when_not_built(client, schema_file):
+    response = client.get(reverse("schema"))
+
+    assert not schema_file.exists()
+    assert response.status_code == status.HTTP_200_OK
+    assert "/events/" in json.loads(response.content)["paths"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["swagger", "redoc"])
+def test_docs_pages_point_at_the_schema(client, url_name):
+    response = client.get(reverse(url_name))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert reverse("schema") in response.content.decode()
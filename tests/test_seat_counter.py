@@ -0,0 +1,111 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from events.models import Event, Registration
+from events.utils import claim_seat
+from attendees.models import Attendees
+
+
+@pytest.mark.django_db
+def test_registration_increments_seats_taken(register, make_event):
+    event = make_event()
+    response = register(event, "Albin", "albin@email.com")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    event.refresh_from_db()
+    assert event.seats_taken == 1
+
+
+@pytest.mark.django_db
+def test_failed_registration_does_not_take_a_seat(register, make_event):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+    duplicate = register(event, "Albin", "albin@email.com")
+    full = register(event, "Babu", "babu@email.com")
+
+    assert duplicate.status_code == status.HTTP_400_BAD_REQUEST
+    assert full.status_code == status.HTTP_400_BAD_REQUEST
+    event.refresh_from_db()
+    assert event.seats_taken == 1
+    assert Registration.objects.filter(event=event).count() == 1
+
+
+@pytest.mark.django_db
+def test_claim_seat_stops_at_capacity(make_event):
+    event = make_event(max_capacity=2)
+
+    assert claim_seat(event.id) is True
+    assert claim_seat(event.id) is True
+    assert claim_seat(event.id) is False
+    event.refresh_from_db()
+    assert event.seats_taken == 2
+
+
+@pytest.mark.django_db
+def test_deleting_registration_releases_seat(register, make_event):
+    event = make_event()
+    register(event, "Albin", "albin@email.com")
+    register(event, "Babu", "babu@email.com")
+
+    Registration.objects.filter(event=event, attendee__email="albin@email.com").delete()
+    event.refresh_from_db()
+    assert event.seats_taken == 1
+
+    Attendees.objects.filter(email="babu@email.com").delete()
+    event.refresh_from_db()
+    assert event.seats_taken == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("delete", [
+    lambda event: event.delete(),
+    lambda event: Event.objects.filter(id=event.id).delete(),
+])
+def test_deleting_an_event_does_not_release_seats_one_by_one(register, make_event, delete):
+    def delete_queries(registrations):
+        event = make_event(max_capacity=registrations)
+        for i in range(registrations):
+            register(event, "Albin", f"albin{i}@email.com")
+        assert Registration.objects.filter(event=event).count() == registrations
+        with CaptureQueriesContext(connection) as queries:
+            delete(event)
+        return len(queries)
+
+    assert delete_queries(1) == delete_queries(10)
+
+
+@pytest.mark.django_db
+def test_rebuild_seats_taken_command(register, make_event):
+    event = make_event(max_capacity=5)
+    register(event, "Albin", "albin@email.com")
+    register(event, "Babu", "babu@email.com")
+    Event.objects.filter(id=event.id).update(seats_taken=4)
+
+    out = StringIO()
+    call_command("rebuild_seats_taken", stdout=out)
+
+    event.refresh_from_db()
+    assert event.seats_taken == 2
+    assert "1 event" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_seats_taken_is_not_writable_or_listed(api_client):
+    url = reverse("event-list-create")
+    data = {
+        "name": "Music Fest",
+        "location": "Mumbai",
+        "start_time": "2099-01-01T10:00:00",
+        "end_time": "2099-01-01T12:00:00",
+        "max_capacity": 100,
+        "seats_taken": 100,
+    }
+    response = api_client.post(url, data, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "seats_taken" not in response.data
+    assert Event.objects.get().seats_taken == 0
@@ -0,0 +1,78 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from events.models import Event
+
+
+def list_events(api_client, **params):
+    response = api_client.get(reverse("event-list-create"), params)
+    assert response.status_code == status.HTTP_200_OK
+    return response
+
+
+@pytest.mark.django_db
+def test_list_includes_registered_count_and_seats_remaining(api_client, register, make_event):
+    event = make_event(max_capacity=3)
+    register(event, "Guest", "a@email.com")
+    register(event, "Guest", "b@email.com")
+
+    row = list_events(api_client).data["results"][0]
+
+    assert row["registered_count"] == 2
+    assert row["seats_remaining"] == 1
+    assert "seats_taken" not in row
+
+
+@pytest.mark.django_db
+def test_registration_refreshes_cached_counts(api_client, register, make_event):
+    event = make_event(max_capacity=3)
+    assert list_events(api_client).data["results"][0]["seats_remaining"] == 3
+    assert list_events(api_client)["X-Cache"] == "HIT"
+
+    register(event, "Guest", "a@email.com")
+    response = list_events(api_client)
+
+    # The page stays cached; only its counts are read again.
+    assert response["X-Cache"] == "HIT"
+    assert response.data["results"][0]["registered_count"] == 1
+    assert response.data["results"][0]["seats_remaining"] == 2
+
+
+@pytest.mark.django_db
+def test_seats_remaining_never_negative(api_client, make_event):
+    event = make_event(max_capacity=2)
+    Event.objects.filter(id=event.id).update(seats_taken=2, max_capacity=1)
+
+    assert list_events(api_client).data["results"][0]["seats_remaining"] == 0
+
+
+@pytest.mark.django_db
+def test_list_query_count_is_flat_in_number_of_events(api_client, register, make_event):
+    def queries_for(count):
+        Event.objects.all().delete()
+        for i in range(count):
+            event = make_event(name=f"Event {i}", max_capacity=5)
+            register(event, "Guest", f"guest{i}@email.com")
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = list_events(api_client, page_size=100)
+        assert len(response.data["results"]) == count
+        assert all(row["registered_count"] == 1 for row in response.data["results"])
+        return len(ctx.captured_queries)
+
+    assert queries_for(2) == queries_for(40) == 1
+
+
+@pytest.mark.django_db
+def test_async_list_includes_counts(make_event):
+    from asgiref.sync import async_to_sync
+    from django.test import AsyncClient
+    make_event(max_capacity=4)
+    Event.objects.update(seats_taken=1)
+
+    row = async_to_sync(AsyncClient().get)(reverse("async-event-list")).json()["results"][0]
+
+    assert (row["registered_count"], row["seats_remaining"]) == (1, 3)
@@ -0,0 +1,60 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count, F
+from events.models import Event, Registration
+from attendees.models import Attendees
+
+
+def seed(**options):
+    call_command("seed_benchmark_data", events=40, attendees=300, registrations=1000,
+                 batch_size=97, stdout=StringIO(), **options)
+
+
+def snapshot():
+    return (
+        list(Event.objects.order_by("id").values_list(
+            "id", "location", "max_capacity", "seats_taken")),
+        list(Registration.objects.order_by("event_id", "attendee_id").values_list(
+            "event_id", "attendee_id")),
+    )
+
+
+@pytest.mark.django_db
+def test_seed_is_consistent_and_skewed():
+    seed()
+
+    assert Attendees.objects.count() == 300
+    assert Event.objects.count() == 40
+    counts = Event.objects.annotate(registered=Count("registrations"))
+    assert not counts.exclude(seats_taken=F("registered")).exists()
+    assert not Event.objects.filter(seats_taken__gt=F("max_capacity")).exists()
+    sizes = sorted(counts.values_list("registered", flat=True), reverse=True)
+    assert sizes[0] > 10 * sizes[len(sizes) // 2]
+
+
+@pytest.mark.django_db
+def test_seed_is_deterministic():
+    seed(seed=7)
+    first = snapshot()
+    Event.objects.all().delete()
+    Attendees.objects.all().delete()
+
+    seed(seed=7)
+
+    assert snapshot() == first
+    assert len(first[1]) > 0
+
+
+@pytest.mark.django_db
+def test_seed_resets_id_sequences(monkeypatch):
+    reset = []
+    monkeypatch.setattr(connection.ops, "sequence_reset_sql",
+                        lambda style, models: reset.extend(models) or [])
+    seed()
+
+    assert set(reset) == {Attendees, Event, Registration}
+    assert Event.objects.create(
+        name="After", location="Goa", start_time="2099-01-01T10:00Z",
+        end_time="2099-01-01T12:00Z", max_capacity=1).id > 40
@@ -0,0 +1,80 @@
+import pytest
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from events.models import Registration
+from events.soldout import SoldOutRegistry, sold_out_events
+
+
+@pytest.mark.django_db
+def test_full_event_is_rejected_without_queries(register, make_event):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+    first_rejection = register(event, "Babu", "babu@email.com")
+    assert sold_out_events.is_sold_out(event.id)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = register(event, "Chris", "chris@email.com")
+
+    assert first_rejection.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "full" in str(response.data).lower()
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_deleting_registration_clears_marker(register, make_event,
+                                             django_capture_on_commit_callbacks):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+    register(event, "Babu", "babu@email.com")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Registration.objects.filter(event=event).delete()
+
+    assert not sold_out_events.is_sold_out(event.id)
+    response = register(event, "Babu", "babu@email.com")
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+def test_capacity_increase_clears_marker(register, make_event,
+                                         django_capture_on_commit_callbacks):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+    register(event, "Babu", "babu@email.com")
+
+    event.max_capacity = 2
+    with django_capture_on_commit_callbacks(execute=True):
+        event.save()
+
+    response = register(event, "Babu", "babu@email.com")
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+def test_marker_is_cleared_only_when_the_freed_seat_commits(register, make_event,
+                                                          django_capture_on_commit_callbacks):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+    register(event, "Babu", "babu@email.com")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            Registration.objects.filter(event=event).delete()
+            still_marked = sold_out_events.is_sold_out(event.id)
+
+    assert still_marked
+    assert not sold_out_events.is_sold_out(event.id)
+
+
+@override_settings(SOLD_OUT_LOCAL_TTL=0)
+def test_clear_from_another_worker_propagates_through_shared_cache():
+    worker_a, worker_b = SoldOutRegistry(), SoldOutRegistry()
+    worker_a.mark(42)
+    assert worker_a.is_sold_out(42)
+
+    worker_b.clear(42)
+
+    assert not worker_a.is_sold_out(42)
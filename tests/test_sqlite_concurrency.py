@@ -0,0 +1,82 @@
+"""
+Multi-process registration stress test against a file-backed SQLite
+database using the tuned connection settings (WAL, busy timeout,
+BEGIN IMMEDIATE).
+"""
+import multiprocessing
+import os
+import sqlite3
+
+
+CAPACITY = 20
+WORKERS = 6
+ATTEMPTS_PER_WORKER = 10
+
+
+def setup_django(db_path):
+    os.environ["SQLITE_PATH"] = db_path
+    # Keep the rate-limit and idempotency files out of the working tree.
+    os.environ["RATE_LIMIT_DB"] = db_path + ".ratelimit"
+    os.environ["IDEMPOTENCY_DB"] = db_path + ".idempotency"
+    os.environ["EVENT_MANAGER_DB"] = "sqlite"
+    os.environ.pop("SQLITE_TUNING", None)
+    os.environ["DJANGO_SETTINGS_MODULE"] = "event_manager.settings"
+    import django
+    django.setup()
+
+
+def create_schema_and_event(db_path):
+    setup_django(db_path)
+    from datetime import timedelta
+    from django.core.management import call_command
+    from django.utils import timezone
+    from events.models import Event
+
+    call_command("migrate", verbosity=0)
+    return Event.objects.create(
+        name="Flash Sale", location="Online", max_capacity=CAPACITY,
+        start_time=timezone.now() + timedelta(days=1),
+        end_time=timezone.now() + timedelta(days=2)).id
+
+
+def register_many(db_path, event_id, worker):
+    setup_django(db_path)
+    from rest_framework.exceptions import ValidationError
+    from events.utils import register_attendee
+
+    outcomes = {"registered": 0, "full": 0, "error": []}
+    for attempt in range(ATTEMPTS_PER_WORKER):
+        try:
+            register_attendee(event_id, "Guest", f"w{worker}-{attempt}@email.com")
+            outcomes["registered"] += 1
+        except ValidationError:
+            outcomes["full"] += 1
+        except Exception as exc:
+            outcomes["error"].append(repr(exc))
+    return outcomes
+
+
+def test_concurrent_registrations_neither_fail_nor_oversell(tmp_path):
+    db_path = str(tmp_path / "stress.sqlite3")
+    context = multiprocessing.get_context("spawn")
+
+    with context.Pool(1) as pool:
+        event_id = pool.apply(create_schema_and_event, (db_path,))
+    with context.Pool(WORKERS) as pool:
+        results = pool.starmap(
+            register_many, [(db_path, event_id, worker) for worker in range(WORKERS)])
+
+    errors = [error for result in results for error in result["error"]]
+    assert errors == []
+    assert sum(result["registered"] for result in results) == CAPACITY
+    assert sum(result["full"] for result in results) == WORKERS * ATTEMPTS_PER_WORKER - CAPACITY
+
+    with sqlite3.connect(db_path) as conn:
+        journal_mode, = conn.execute("PRAGMA journal_mode").fetchone()
+        registrations, = conn.execute(
+            "SELECT COUNT(*) FROM events_registration WHERE event_id = ?",
+            (event_id,)).fetchone()
+        seats_taken, = conn.execute(
+            "SELECT seats_taken FROM events_event WHERE id = ?", (event_id,)).fetchone()
+    assert journal_mode == "wal"
+    assert registrations == seats_taken == CAPACITY
@@ -0,0 +1,208 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from attendees.models import Attendees
+from events.models import Event, Registration, WaitlistEntry
+from events.soldout import sold_out_events
+from events.waitlist import attendee_promoted, cancel_token, join_waitlist
+
+
+def post(api_client, url_name, event, **data):
+    return api_client.post(reverse(url_name, kwargs={"event_id": event.id}), data, format="json")
+
+
+def join(api_client, event, name, email):
+    return post(api_client, "event-waitlist", event, name=name, email=email)
+
+
+def cancel(api_client, event, email, token=None):
+    token = token if token is not None else cancel_token(event.id, email)
+    return post(api_client, "cancel-registration", event, email=email, token=token)
+
+
+def registered_emails(event):
+    return set(Registration.objects.filter(event=event).values_list("attendee__email", flat=True))
+
+
+@pytest.fixture
+def full_event(register, make_event):
+    event = make_event(max_capacity=1)
+    register(event, "Albin", "albin@email.com")
+    return event
+
+
+@pytest.mark.django_db
+def test_waitlist_positions_follow_join_order(api_client, full_event):
+    first = join(api_client, full_event, "Babu", "babu@email.com")
+    second = join(api_client, full_event, "Chris", "chris@email.com")
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert first.data["status"] == "waitlisted" and first.data["position"] == 1
+    assert second.data["status"] == "waitlisted" and second.data["position"] == 2
+
+
+@pytest.mark.django_db
+def test_cancel_promotes_the_longest_waiting(api_client, full_event, django_capture_on_commit_callbacks):
+    join(api_client, full_event, "Babu", "babu@email.com")
+    join(api_client, full_event, "Chris", "chris@email.com")
+    promoted = []
+    receiver = lambda registration, **kwargs: promoted.append(registration.attendee.email)
+    attendee_promoted.connect(receiver)
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = cancel(api_client, full_event, "Albin@email.com")
+    finally:
+        attendee_promoted.disconnect(receiver)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"message": "Registration cancelled"}
+    assert registered_emails(full_event) == {"babu@email.com"}
+    assert list(WaitlistEntry.objects.values_list("attendee__email", flat=True)) == ["chris@email.com"]
+    assert promoted == ["babu@email.com"]
+    full_event.refresh_from_db()
+    assert full_event.seats_taken == 1
+
+
+@pytest.mark.django_db
+def test_cancel_without_waitlist_frees_the_seat(api_client, register, full_event):
+    cancel(api_client, full_event, "albin@email.com")
+
+    full_event.refresh_from_db()
+    assert full_event.seats_taken == 0
+    assert not sold_out_events.is_sold_out(full_event.id)
+    assert register(full_event, "Babu", "babu@email.com").status_code == 201
+
+
+@pytest.mark.django_db
+def test_leaving_the_waitlist(api_client, full_event):
+    join(api_client, full_event, "Babu", "babu@email.com")
+
+    response = cancel(api_client, full_event, "babu@email.com")
+
+    assert response.data == {"message": "Removed from waitlist"}
+    assert not WaitlistEntry.objects.exists()
+    assert registered_emails(full_event) == {"albin@email.com"}
+
+
+@pytest.mark.django_db
+def test_waitlist_rejections(api_client, make_event, full_event):
+    open_event = make_event(max_capacity=5)
+    join(api_client, full_event, "Babu", "babu@email.com")
+
+    assert "register instead" in str(join(api_client, open_event, "Babu", "babu@email.com").data)
+    assert "already registered" in str(join(api_client, full_event, "Albin", "albin@email.com").data)
+    assert "already on the waitlist" in str(join(api_client, full_event, "Babu", "babu@email.com").data)
+    unknown = cancel(api_client, full_event, "nobody@email.com")
+    assert unknown.status_code == status.HTTP_400_BAD_REQUEST
+    missing = api_client.post(reverse("event-waitlist", kwargs={"event_id": 999}),
+                              {"name": "Babu", "email": "babu@email.com"}, format="json")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_raising_capacity_promotes_waitlist(api_client, full_event):
+    join(api_client, full_event, "Babu", "babu@email.com")
+    join(api_client, full_event, "Chris", "chris@email.com")
+
+    full_event.max_capacity = 2
+    full_event.save()
+
+    assert registered_emails(full_event) == {"albin@email.com", "babu@email.com"}
+    assert WaitlistEntry.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_seat_freed_while_joining_goes_to_joiner(full_event, monkeypatch):
+    from events import waitlist
+    upsert = waitlist.upsert_attendee
+
+    def upsert_after_concurrent_cancel(name, email):
+        # A cancellation commits after join_waitlist checked capacity.
+        Event.objects.filter(id=full_event.id).update(seats_taken=0)
+        return upsert(name, email)
+
+    monkeypatch.setattr(waitlist, "upsert_attendee", upsert_after_concurrent_cancel)
+
+    assert join_waitlist(full_event.id, "Babu", "babu@email.com") == {"status": "registered"}
+    assert "babu@email.com" in registered_emails(full_event)
+    assert not WaitlistEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_head_of_queue_is_an_index_seek(full_event):
+    plan = WaitlistEntry.objects.filter(event_id=full_event.id).order_by(
+        "created_at", "id")[:1].explain()
+
+    assert "waitlist_event_created_idx" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("delete", [
+    lambda event: Registration.objects.filter(event=event).delete(),
+    lambda event: Attendees.objects.filter(email="albin@email.com").delete(),
+])
+def test_seat_freed_by_any_delete_goes_to_the_waitlist(api_client, register, full_event, delete):
+    join(api_client, full_event, "Babu", "babu@email.com")
+
+    delete(full_event)
+    late = register(full_event, "Chris", "chris@email.com")
+
+    assert registered_emails(full_event) == {"babu@email.com"}
+    assert late.status_code == status.HTTP_400_BAD_REQUEST
+    assert not WaitlistEntry.objects.exists()
+
+
+@pytest.mark.django_db
+# Skipping the stale entry costs a failed insert and a second lookup.
+@pytest.mark.query_budget(budget=10, allow_repeats=True)
+def test_stale_entry_of_a_directly_registered_attendee_is_skipped(api_client, register,
+                                                                 full_event):
+    join(api_client, full_event, "Babu", "babu@email.com")
+    Event.objects.filter(id=full_event.id).update(max_capacity=2)
+    assert register(full_event, "Babu", "babu@email.com").status_code == 201
+
+    assert cancel(api_client, full_event, "albin@email.com").status_code == status.HTTP_200_OK
+    assert registered_emails(full_event) == {"babu@email.com"}
+    assert not WaitlistEntry.objects.exists()
+    full_event.refresh_from_db()
+    assert full_event.seats_taken == 1
+
+
+@pytest.mark.django_db
+def test_cancelling_drops_the_attendees_waitlist_entry(api_client, register, full_event):
+    join(api_client, full_event, "Babu", "babu@email.com")
+    Event.objects.filter(id=full_event.id).update(max_capacity=2)
+    assert register(full_event, "Babu", "babu@email.com").status_code == 201
+    Event.objects.filter(id=full_event.id).update(max_capacity=1)
+
+    response = cancel(api_client, full_event, "babu@email.com")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert registered_emails(full_event) == {"albin@email.com"}
+    assert not WaitlistEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_promotion_skips_attendees_already_registered(full_event):
+    from events.waitlist import promote_waitlist
+    babu = Attendees.objects.create(name="Babu", email="babu@email.com")
+    WaitlistEntry.objects.create(event=full_event, attendee=Registration.objects.get().attendee)
+    WaitlistEntry.objects.create(event=full_event, attendee=babu)
+    Event.objects.filter(id=full_event.id).update(max_capacity=2)
+
+    promoted = promote_waitlist(full_event.id)
+
+    assert [r.attendee_id for r in promoted] == [babu.id]
+    full_event.refresh_from_db()
+    assert full_event.seats_taken == 2
+
+
+@pytest.mark.django_db
+def test_cancel_needs_the_attendee_token(api_client, full_event):
+    forged = cancel(api_client, full_event, "albin@email.com", token="forged")
+    other = cancel(api_client, full_event, "albin@email.com",
+                   token=cancel_token(full_event.id, "babu@email.com"))
+
+    assert forged.status_code == other.status_code == status.HTTP_403_FORBIDDEN
+    assert registered_emails(full_event) == {"albin@email.com"}